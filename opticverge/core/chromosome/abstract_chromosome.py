@@ -1,12 +1,15 @@
 import copy
 from abc import ABCMeta
 from collections import OrderedDict
-from typing import Any, Dict, TypeVar
+from typing import Any, Dict, List, TypeVar
 
+import numpy as np
 import xxhash
 
 from opticverge.core.generator.real_generator import rand_real
+from opticverge.core.generator.sampler import get_sampler
 from opticverge.core.meta.chromosome_meta import ChromosomeMeta
+from opticverge.core.util.encoding import encode
 
 """
 Typing for the chromosome meta class since we can't use the AbstractChromosome
@@ -16,7 +19,23 @@ AbstractChromosomeEntity = TypeVar('AbstractChromosome')
 
 
 class AbstractChromosome(metaclass=ABCMeta):
-    """ The base class for all chromosomes """
+    """ The base class for all chromosomes
+
+    Chromosomes and their generators are created in large numbers, so the
+    classes of the library declare __slots__ rather than holding an instance
+    __dict__. Derived classes should declare __slots__ too, including an empty
+    tuple when they add no attributes.
+    """
+
+    __slots__ = ("__blueprint", "__owns_blueprint", "__genotype", "__fixed_genotype", "__phenotype", "__fitness",
+                 "__meta")
+
+    """
+    Whether generate changes the state of the chromosome beyond its phenotype,
+    a chromosome that does so is copied before it generates on behalf of a
+    chromosome that shares it with its clones, see clone.
+    """
+    copy_on_generate: bool = True
 
     def __init__(self, blueprint: Dict[str, AbstractChromosomeEntity], fixed_genotype: Dict[str, Any] = None):
         """The base constructor for the derived class
@@ -27,12 +46,14 @@ class AbstractChromosome(metaclass=ABCMeta):
         """
 
         """
-        Given that the blueprint could represent anything, using an OrderedDict
-        allows us to guarantee cross compatibility when selecting representations        
+        Given that the blueprint could represent anything, an ordered mapping
+        allows us to guarantee cross compatibility when selecting
+        representations, a dict preserves the order of insertion and is more
+        compact than an OrderedDict.
         """
-        if type(blueprint) is not OrderedDict:
+        if not isinstance(blueprint, dict):
             raise TypeError(
-                "Expected blueprint to be of type OrderedDict, received type {}".format(type(blueprint))
+                "Expected blueprint to be of type dict or OrderedDict, received type {}".format(type(blueprint))
             )
 
         """
@@ -43,6 +64,12 @@ class AbstractChromosome(metaclass=ABCMeta):
         """
         self.__blueprint: Dict[str, AbstractChromosomeEntity] = blueprint
 
+        """
+        Whether the blueprint belongs to this chromosome alone, a cloned
+        chromosome shares the blueprint of its parent until it has to change it
+        """
+        self.__owns_blueprint: bool = True
+
         """
         The genotype represents the result of generating a result for each of
         the generators in the blueprint.
@@ -133,20 +160,76 @@ class AbstractChromosome(metaclass=ABCMeta):
     @property
     def id(self):
         if self.__meta.id is None:
-            self.__meta.id = xxhash.xxh64("%s" % self.__genotype).hexdigest()
+            self.__meta.id = xxhash.xxh64(self.encode_genotype()).hexdigest()
         return self.__meta.id
 
+    def encode_genotype(self) -> bytes:
+        """Encodes the genotype as canonical bytes from which the id of the chromosome is derived
+
+        Returns:
+            bytes: The encoding of the genotype, see encode
+        """
+        return encode(self.__genotype)
+
     def clone(self) -> AbstractChromosomeEntity:
         """Generates a copy of the chromosome
-        
+
+        Only the genotype is copied, the clone shares the blueprint and fixed
+        genotype with this chromosome and the phenotype until it is mutated.
+        Mutable values of the genotype e.g. a list are copied with it, see
+        _copy_genotype.
+        A nested chromosome of the shared blueprint e.g. the base_estimator of
+        an AdaBoostRegressorChromosome is itself cloned before it generates a
+        new value, see copy_on_generate.
+
         Returns:
             AbstractChromosome: A copy of the chromosome
         """
-        clone = copy.deepcopy(self)
-        # clone.__phenotype = None
-        clone.__meta = clone.__meta.clone()
+        clone = _shallow_copy(self)
+
+        clone.__genotype = _copy_genotype(self.__genotype)
+
+        # chromosomes whose genotype is their blueprint e.g. a
+        # FunctionChromosome keep doing so
+        if self.__blueprint is self.__genotype:
+            clone.__blueprint = clone.__genotype
+        else:
+            self.__owns_blueprint = False
+            clone.__owns_blueprint = False
+
+        # the id is derived before the meta is cloned so that the clone always
+        # knows its parent, nothing else may have read the id yet
+        self.id
+
+        clone.__meta = self.__meta.clone()
+
         return clone
 
+    def writable_generator(self, identifier: str) -> AbstractChromosomeEntity:
+        """Get the generator of the blueprint that is safe to generate from
+
+        The generator is cloned into a blueprint owned by this chromosome if it
+        is shared with other chromosomes and its state changes when generating.
+
+        Args:
+            identifier (str): The key of the generator in the blueprint
+
+        Returns:
+            AbstractChromosome: The generator
+        """
+        generator = self.__blueprint[identifier]
+
+        if self.__owns_blueprint or not getattr(generator, "copy_on_generate", False):
+            return generator
+
+        if self.__blueprint is not self.__genotype:
+            self.__blueprint = self.__blueprint.copy()
+
+        generator = generator.clone()
+        self.__blueprint[identifier] = generator
+
+        return generator
+
     def generate(self, **kwargs) -> Dict[str, Any]:
         """Generates the genotype from the blueprint recursively
         
@@ -154,8 +237,8 @@ class AbstractChromosome(metaclass=ABCMeta):
             Dict[str, Any]: The updated genotype
         """
 
-        for identifier, generator in self.__blueprint.items():
-            self.__genotype[identifier] = generator.generate(**kwargs)
+        for identifier in list(self.__blueprint.keys()):
+            self.__genotype[identifier] = self.writable_generator(identifier).generate(**kwargs)
 
         self.__genotype.update(self.__fixed_genotype)
 
@@ -168,16 +251,209 @@ class AbstractChromosome(metaclass=ABCMeta):
             mutation_probability (float): The likelihood of change
         """
 
-        for identifier, generator in self.__blueprint.items():
+        for identifier in list(self.__blueprint.keys()):
             if rand_real() < mutation_probability:
-                self.__genotype[identifier] = generator.generate(**kwargs)
+                self.__genotype[identifier] = self.writable_generator(identifier).generate(**kwargs)
 
         self.__genotype.update(self.__fixed_genotype)
 
         return self.__genotype
 
+    def derive(self, genotype: Dict[str, Any]) -> AbstractChromosomeEntity:
+        """Creates a new chromosome with the genotype that shares the blueprint and fixed genotype of this chromosome
+
+        Unlike a clone the chromosome does not descend from this chromosome, it
+        has no phenotype, fitness or parent.
+
+        Args:
+            genotype (Dict[str, Any]): The genotype of the new chromosome
+
+        Returns:
+            AbstractChromosome: The new chromosome
+        """
+        chromosome = _shallow_copy(self)
+
+        chromosome.__genotype = genotype
+
+        if self.__blueprint is self.__genotype:
+            chromosome.__blueprint = genotype
+        else:
+            self.__owns_blueprint = False
+            chromosome.__owns_blueprint = False
+
+        chromosome.__phenotype = None
+        chromosome.__fitness = None
+        chromosome.__meta = ChromosomeMeta()
+
+        return chromosome
+
+    def generate_values(self, count: int, **kwargs) -> List[Any]:
+        """Generates count values at once, each the value generate would return, without changing this chromosome
+
+        This is how a chromosome generates the values of a generator of its
+        blueprint in bulk, see generate_batch.
+
+        Args:
+            count (int): The number of values
+
+        Returns:
+            List[Any]: The values
+        """
+        return [chromosome.genotype for chromosome in self.generate_batch(count, **kwargs)]
+
+    def generate_batch(self, count: int, **kwargs) -> List[AbstractChromosomeEntity]:
+        """Generates count new chromosomes from the blueprint at once, see derive
+
+        Each generator of the blueprint generates the values of its key for
+        every chromosome in a single call rather than once per chromosome.
+
+        Args:
+            count (int): The number of chromosomes
+
+        Returns:
+            List[AbstractChromosome]: The generated chromosomes
+        """
+        identifiers: List[str] = list(self.__blueprint.keys())
+
+        columns: List[List[Any]] = [
+            self.__blueprint[identifier].generate_values(count, **kwargs) for identifier in identifiers
+        ]
+
+        chromosomes: List[AbstractChromosomeEntity] = []
+
+        for i in range(count):
+            genotype: Dict[str, Any] = OrderedDict(zip(identifiers, [column[i] for column in columns]))
+            genotype.update(self.__fixed_genotype)
+
+            chromosomes.append(self.derive(genotype))
+
+        return chromosomes
+
+    def mutate_batch(self, mutation_probability: float, count: int, **kwargs) -> List[AbstractChromosomeEntity]:
+        """Creates count mutated clones of this chromosome at once
+
+        The clones change the same as if each was mutated, see mutate, however
+        each generator generates the changed values of its key for every clone
+        in a single call.
+
+        Args:
+            mutation_probability (float): The likelihood of change
+            count (int): The number of clones
+
+        Returns:
+            List[AbstractChromosome]: The mutated clones
+        """
+        identifiers: List[str] = list(self.__blueprint.keys())
+
+        changes: np.ndarray = get_sampler().generator.random((count, len(identifiers))) < mutation_probability
+
+        clones: List[AbstractChromosomeEntity] = [self.clone() for _ in range(count)]
+
+        for j, identifier in enumerate(identifiers):
+
+            rows: List[int] = np.flatnonzero(changes[:, j]).tolist()
+
+            if len(rows) == 0:
+                continue
+
+            values = self.__blueprint[identifier].generate_values(len(rows), **kwargs)
+
+            for row, value in zip(rows, values):
+                clones[row].__genotype[identifier] = value
+
+        for clone in clones:
+            clone.__genotype.update(self.__fixed_genotype)
+
+        return clones
+
     def genotype_factory(self, **kwargs) -> Dict[str, AbstractChromosomeEntity]:
         return OrderedDict({})
 
     def generate_genotype(self):
         self.__blueprint = self.genotype_factory()
+        self.__owns_blueprint = True
+
+
+"""
+The attribute names of the slots of each chromosome class including those of
+its base classes, resolved once per class
+"""
+_slot_names: Dict[type, List[str]] = {}
+
+
+"""
+The types of the values of a genotype that a clone shares with its parent
+rather than copying them, the remaining values may change in place
+"""
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None), np.generic, AbstractChromosome)
+
+
+def _copy_genotype(genotype: Dict[str, Any]) -> Dict[str, Any]:
+    """ Copies a genotype, deep copying its mutable values
+
+    The values of the genotype are mostly numbers, so only the values that
+    are not are deep copied. A chromosome of the genotype e.g. the generator
+    of a FunctionChromosome is part of the blueprint and stays shared.
+
+    Args:
+        genotype: The genotype to copy
+
+    Returns:
+        Dict[str, Any]: The copy
+    """
+    copied: Dict[str, Any] = genotype.copy()
+
+    for key, value in genotype.items():
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            copied[key] = copy.deepcopy(value)
+
+    return copied
+
+
+def _shallow_copy(chromosome: AbstractChromosome) -> AbstractChromosome:
+    """ Copies the attributes of a chromosome into a new instance without calling its constructor
+
+    Equivalent to copy.copy for slotted classes but without the generic
+    reduce protocol, which dominates the cost of cloning.
+
+    Args:
+        chromosome: The chromosome to copy
+
+    Returns:
+        AbstractChromosome: The copy
+    """
+    cls = type(chromosome)
+
+    names: List[str] = _slot_names.get(cls)
+
+    if names is None:
+        names = []
+
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            slots = (slots,) if isinstance(slots, str) else slots
+
+            for slot in slots:
+                # private slots are mangled with the name of the declaring class
+                if slot.startswith("__") and not slot.endswith("__"):
+                    slot = "_{}{}".format(base.__name__.lstrip("_"), slot)
+
+                if slot not in ("__dict__", "__weakref__"):
+                    names.append(slot)
+
+        _slot_names[cls] = names
+
+    clone = cls.__new__(cls)
+
+    for name in names:
+        try:
+            setattr(clone, name, getattr(chromosome, name))
+        except AttributeError:
+            # the slot was never assigned
+            pass
+
+    # derived classes that do not declare __slots__ hold an instance dict
+    if hasattr(chromosome, "__dict__"):
+        clone.__dict__.update(chromosome.__dict__)
+
+    return clone
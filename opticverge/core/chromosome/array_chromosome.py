@@ -1,6 +1,6 @@
 import copy
 from collections import OrderedDict
-from typing import List
+from typing import Any, Dict, List
 
 import numpy as np
 
@@ -9,11 +9,18 @@ from opticverge.core.chromosome.function_chromosome import FunctionChromosome
 from opticverge.core.generator.int_distribution_generator import rand_int
 from opticverge.core.generator.options_generator import rand_options
 from opticverge.core.generator.real_generator import rand_real
+from opticverge.core.generator.sampler import get_sampler
+from opticverge.core.util.encoding import encode_array
 
 
 class RandArrayChromosome(FunctionChromosome):
     """ The chromosome for generating fixed or dynamic arrays """
 
+    __slots__ = ("__generator", "__owns_generator", "__length", "__fixed")
+
+    # generate fills the genotype of the array
+    copy_on_generate: bool = True
+
     def __init__(self, generator: AbstractChromosome, length: int, fixed: bool = False):
         """ The constructor for this class
 
@@ -29,6 +36,12 @@ class RandArrayChromosome(FunctionChromosome):
         """
         self.__generator = generator
 
+        """
+        Whether the generator belongs to this array alone, a clone shares the
+        generator of its parent until it generates from it
+        """
+        self.__owns_generator: bool = True
+
         """
         The length represents the initial size of the array if fixed is True
         """
@@ -40,14 +53,69 @@ class RandArrayChromosome(FunctionChromosome):
         """
         self.__fixed = fixed
 
+    @property
+    def generator(self) -> AbstractChromosome:
+        """Get the generator responsible for producing each entry
+
+        Returns:
+            AbstractChromosome: The generator of the array entries
+        """
+        return self.__generator
+
+    @property
+    def length(self) -> int:
+        """Get the length of the array
+
+        Returns:
+            int: The length, or the maximum length if the array is not fixed
+        """
+        return self.__length
+
+    @property
+    def fixed(self) -> bool:
+        """Get whether the array length is fixed
+
+        Returns:
+            bool: True if the length of the array does not change
+        """
+        return self.__fixed
+
+    def encode_genotype(self) -> bytes:
+        """Encodes the genotype as an array so that the id matches the id of the row in an ArrayPopulation
+
+        Returns:
+            bytes: The encoding of the genotype, see encode_array
+        """
+        # a view of a row of an ArrayPopulation holds only its phenotype
+        values = self.genotype.values()
+
+        if len(values) == 0 and self.phenotype is not None:
+            values = self.phenotype
+
+        return encode_array(np.asarray(list(values)))
+
+    def clone(self) -> AbstractChromosome:
+        clone: RandArrayChromosome = super(RandArrayChromosome, self).clone()
+        self.__owns_generator = False
+        clone.__owns_generator = False
+        return clone
+
+    def derive(self, genotype: Dict[str, Any]) -> AbstractChromosome:
+        chromosome: RandArrayChromosome = super(RandArrayChromosome, self).derive(genotype)
+        self.__owns_generator = False
+        chromosome.__owns_generator = False
+        return chromosome
+
     def generate(self, **kwargs):
 
+        generator: AbstractChromosome = self.__writable_generator()
+
         # determine the length of the array to generate
         length: int = self.__length if self.__fixed is True else rand_int(1, self.__length)
 
         # generate each of the positions of the array using the generator
         for i in range(length):
-            self.genotype[i] = self.__generator.generate(**kwargs)
+            self.genotype[i] = generator.generate(**kwargs)
 
         # the phenotype of an array represents the values from the genotype,
         # since we use an OrderedDict as our base representation we are safe to
@@ -78,29 +146,15 @@ class RandArrayChromosome(FunctionChromosome):
 
         """
 
+        generator: AbstractChromosome = self.__writable_generator()
+
         # 1. Attempt to mutate each value
         for key, val in self.genotype.items():
             if rand_real() < mutation_probability:
-                self.genotype[key] = self.__generator.generate(**kwargs)
+                self.genotype[key] = generator.generate(**kwargs)
 
         # 2. Attempt to swap positions of the array
-        keys: List[str or int] = list(self.genotype.keys())
-        if len(keys) > 1:
-
-            # select the number of items to modify in the list
-            items_to_select: int = rand_int(2, len(keys))
-
-            selected: List[str or int] = rand_options(keys, items_to_select)
-
-            shuffled: List[np.int64] = copy.copy(selected)
-
-            np.random.shuffle(shuffled)
-
-            for i, key in enumerate(selected):
-
-                if rand_real() < mutation_probability:
-                    self.genotype[selected[i]], self.genotype[shuffled[i]] = self.genotype[shuffled[i]], self.genotype[
-                        selected[i]]
+        self.__swap(mutation_probability)
 
         # TODO: Sensibly define how to insert/update an OrderedDict
         # 3. Attempt to add and remove items to the array
@@ -123,3 +177,105 @@ class RandArrayChromosome(FunctionChromosome):
         self.phenotype = list(self.genotype.values())
 
         return self.phenotype
+
+    def __writable_generator(self) -> AbstractChromosome:
+        """ Get the generator that is safe to generate from, see AbstractChromosome.writable_generator
+
+        Returns:
+            AbstractChromosome: The generator, cloned if it is shared and its state changes when generating
+        """
+        if not self.__owns_generator and self.__generator.copy_on_generate:
+            self.__generator = self.__generator.clone()
+            self.__owns_generator = True
+
+        return self.__generator
+
+    def __swap(self, mutation_probability: float):
+        """ Swaps positions of the array selected at random with the mutation probability
+
+        Args:
+            mutation_probability: The likelihood that each selected position is swapped
+        """
+        keys: List[str or int] = list(self.genotype.keys())
+        if len(keys) > 1:
+
+            # select the number of items to modify in the list
+            items_to_select: int = rand_int(2, len(keys))
+
+            selected: List[str or int] = rand_options(keys, items_to_select)
+
+            shuffled: List[np.int64] = copy.copy(selected)
+
+            get_sampler().generator.shuffle(shuffled)
+
+            for i, key in enumerate(selected):
+
+                if rand_real() < mutation_probability:
+                    self.genotype[selected[i]], self.genotype[shuffled[i]] = self.genotype[shuffled[i]], self.genotype[
+                        selected[i]]
+
+    def __generate_rows(self, count: int, **kwargs) -> List[List[Any]]:
+        """ Generates the entries of count arrays with a single call of the generator
+
+        Args:
+            count: The number of arrays
+
+        Returns:
+            List[List[Any]]: The entries of each array
+        """
+        if self.__fixed is True:
+            lengths: List[int] = [self.__length] * count
+        else:
+            lengths = get_sampler().generator.integers(1, self.__length, count).tolist()
+
+        values = self.__generator.generate_values(sum(lengths), **kwargs)
+
+        offsets: List[int] = np.cumsum([0] + lengths).tolist()
+
+        return [list(values[offsets[i]:offsets[i + 1]]) for i in range(count)]
+
+    def generate_values(self, count: int, **kwargs) -> List[List[Any]]:
+        return self.__generate_rows(count, **kwargs)
+
+    def generate_batch(self, count: int, **kwargs) -> List[AbstractChromosome]:
+        chromosomes: List[AbstractChromosome] = []
+
+        for row in self.__generate_rows(count, **kwargs):
+            chromosome: RandArrayChromosome = self.derive(OrderedDict(zip(range(len(row)), row)))
+            chromosome.phenotype = row
+            chromosomes.append(chromosome)
+
+        return chromosomes
+
+    def mutate_batch(self, mutation_probability: float, count: int, **kwargs) -> List[AbstractChromosome]:
+        """ Creates count mutated clones of the array at once
+
+        The entries of every clone are regenerated with a single call of the
+        generator, the positions of each clone are then swapped as they are by
+        mutate.
+
+        Args:
+            mutation_probability: The likelihood that we will change the array
+            count: The number of clones
+
+        Returns:
+            List[AbstractChromosome]: The mutated clones
+        """
+        keys: List[str or int] = list(self.genotype.keys())
+
+        # 1. Attempt to mutate each value
+        changes: np.ndarray = get_sampler().generator.random((count, len(keys))) < mutation_probability
+
+        values = self.__generator.generate_values(int(np.count_nonzero(changes)), **kwargs)
+
+        clones: List[RandArrayChromosome] = [self.clone() for _ in range(count)]
+
+        for (row, column), value in zip(zip(*np.nonzero(changes)), values):
+            clones[row].genotype[keys[column]] = value
+
+        # 2. Attempt to swap positions of the array
+        for clone in clones:
+            clone.__swap(mutation_probability)
+            clone.phenotype = list(clone.genotype.values())
+
+        return clones
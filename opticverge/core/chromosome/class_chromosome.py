@@ -1,15 +1,24 @@
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
 
 
 class ClassChromosome(AbstractChromosome):
+    """ The chromosome whose phenotype is an instance of a class constructed from the genotype
+
+    The phenotype is constructed on first access rather than whenever the
+    genotype changes, so clones that are discarded before they are evaluated
+    e.g. because they duplicate an existing chromosome never construct it.
+    """
+
+    __slots__ = ("__constructor", "__kwargs")
+
     def __init__(self,
                  constructor: Callable,
                  blueprint: Dict[str, AbstractChromosome],
                  fixed_genotype: Dict[str, Any] = None):
         """The constructor for the ClassChromosome
-        
+
         Args:
             constructor (Callable): The reference to the class
             blueprint (Dict[str, AbstractChromosome]): The description on how to generate the genotype
@@ -19,13 +28,84 @@ class ClassChromosome(AbstractChromosome):
         super(ClassChromosome, self).__init__(blueprint=blueprint, fixed_genotype=fixed_genotype)
         self.__constructor = constructor
 
-    def generate(self, **kwargs) -> Any:
-        super(ClassChromosome, self).generate()
-        self.phenotype = self.__constructor(**{**self.genotype, **kwargs})
-        return self.phenotype
+        # the arguments the phenotype is constructed with in addition to the
+        # genotype, None until the genotype is generated
+        self.__kwargs: Dict[str, Any] = None
 
-    def mutate(self, mutation_probability: float, **kwargs) -> Any:
-        super(ClassChromosome, self).mutate(mutation_probability=mutation_probability, **kwargs)
+    @property
+    def phenotype(self) -> Any:
+        """Get the instance of the class, constructing it if the genotype changed since it was last constructed
+
+        Returns:
+            Any: The instance of the class, None if the genotype is yet to be generated
+        """
+        phenotype = super(ClassChromosome, self).phenotype
+
+        if phenotype is None and self.__kwargs is not None:
+            phenotype = self.express(**self.__kwargs)
+
+        return phenotype
+
+    @phenotype.setter
+    def phenotype(self, phenotype: Any):
+        AbstractChromosome.phenotype.fset(self, phenotype)
+
+    def express(self, **kwargs) -> Any:
+        """Constructs the phenotype from the genotype
+
+        Returns:
+            Any: The instance of the class
+        """
+        self.__kwargs = kwargs
         self.phenotype = self.__constructor(**{**self.genotype, **kwargs})
         return self.phenotype
 
+    def clone(self) -> AbstractChromosome:
+        # the clone constructs its own phenotype once its genotype is final
+        clone: ClassChromosome = super(ClassChromosome, self).clone()
+        clone.__defer(self.__kwargs)
+        return clone
+
+    def generate(self, **kwargs) -> Any:
+        super(ClassChromosome, self).generate()
+        return self.express(**kwargs)
+
+    def mutate(self, mutation_probability: float, **kwargs) -> Dict[str, Any]:
+        genotype = super(ClassChromosome, self).mutate(mutation_probability=mutation_probability, **kwargs)
+        self.__defer(kwargs)
+        return genotype
+
+    def generate_values(self, count: int, **kwargs) -> List[Any]:
+        return [chromosome.express(**kwargs) for chromosome in super(ClassChromosome, self).generate_batch(count)]
+
+    def generate_batch(self, count: int, **kwargs) -> List[AbstractChromosome]:
+        chromosomes: List[AbstractChromosome] = super(ClassChromosome, self).generate_batch(count)
+
+        for chromosome in chromosomes:
+            chromosome.__defer(kwargs)
+
+        return chromosomes
+
+    def mutate_batch(self, mutation_probability: float, count: int, **kwargs) -> List[AbstractChromosome]:
+        clones: List[AbstractChromosome] = super(ClassChromosome, self).mutate_batch(
+            mutation_probability=mutation_probability,
+            count=count,
+            **kwargs
+        )
+
+        for clone in clones:
+            clone.__defer(kwargs)
+
+        return clones
+
+    def __defer(self, kwargs: Dict[str, Any] or None):
+        """Discards the phenotype so that it is constructed from the genotype on first access
+
+        Args:
+            kwargs (Dict[str, Any] or None): The arguments the phenotype is constructed with, None if the genotype is
+                yet to be generated
+        """
+        self.__kwargs = kwargs
+
+        if kwargs is not None:
+            AbstractChromosome.phenotype.fset(self, None)
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Dict
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
@@ -7,10 +6,13 @@ from opticverge.core.generator.bool_generator import rand_uniform_bool
 
 
 class RandUniformBooleanChromosome(FunctionChromosome):
+
+    __slots__ = ()
+
     def blueprint_factory(self, loc) -> Dict[str, AbstractChromosome]:
-        return OrderedDict({
+        return {
             "loc": loc
-        })
+        }
 
     def __init__(self, loc=0.5):
         super(RandUniformBooleanChromosome, self).__init__(
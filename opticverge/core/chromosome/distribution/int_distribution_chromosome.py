@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Dict
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosomeEntity, AbstractChromosome
@@ -9,6 +8,8 @@ from opticverge.core.globals import DEFAULT_SAMPLE_SIZE
 
 class RandIntChromosome(FunctionChromosome):
 
+    __slots__ = ()
+
     def __init__(self,
                  min_val,
                  max_val,
@@ -17,27 +18,29 @@ class RandIntChromosome(FunctionChromosome):
                  output_dtype=None):
         super(RandIntChromosome, self).__init__(
             rand_int,
-            OrderedDict({
+            {
                 "min_val": min_val,
                 "max_val": max_val,
                 "rounding": rounding,
                 "sample_size": sample_size,
                 "output_dtype": output_dtype
-            })
+            }
         )
 
 
 class RandPoissonChromosome(FunctionChromosome):
 
+    __slots__ = ()
+
     def blueprint_factory(self, value, min_val, max_val, rounding, sample_size, output_dtype) -> Dict[str, AbstractChromosome]:
-        return OrderedDict({
+        return {
             "value": value,
             "min_val": min_val,
             "max_val": max_val,
             "rounding": rounding,
             "sample_size": sample_size,
             "output_dtype": output_dtype
-        })
+        }
 
     def __init__(self,
                  value,
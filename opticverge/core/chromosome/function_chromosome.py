@@ -1,9 +1,18 @@
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, List
+
+import numpy as np
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.generator.batch_generator import get_batch_generator
 
 
 class FunctionChromosome(AbstractChromosome):
+
+    __slots__ = ("__function",)
+
+    # generate only assigns the phenotype so the chromosome can be shared
+    copy_on_generate: bool = False
+
     def __init__(self, func: Callable or AbstractChromosome, blueprint: Dict[str, AbstractChromosome or Any],
                  fixed_genotype: Dict[str, Any] = None):
         """The constructor for the FunctionChromosome
@@ -19,9 +28,60 @@ class FunctionChromosome(AbstractChromosome):
 
         self.genotype = self.blueprint
 
+    @property
+    def function(self) -> Callable:
+        """Get the function called on generate and mutate
+
+        Returns:
+            Callable: The function producing the phenotype
+        """
+        return self.__function
+
     def generate(self, **kwargs) -> Any:
-        self.phenotype = self.__function(**{**dict(self.genotype), **kwargs})
-        return self.phenotype
+        # the generated value is returned rather than read back from the
+        # phenotype, which another chromosome sharing this one may overwrite
+        phenotype = self.__function(**{**dict(self.genotype), **kwargs})
+        self.phenotype = phenotype
+        return phenotype
 
     def mutate(self, mutation_probability: float, **kwargs):
         return super(FunctionChromosome, self).mutate(mutation_probability=mutation_probability, **kwargs)
+
+    def generate_values(self, count: int, **kwargs) -> np.ndarray or List[Any]:
+        """Calls the function count times at once, in a single call if the function has a batch equivalent
+
+        Args:
+            count (int): The number of values
+
+        Returns:
+            np.ndarray or List[Any]: The values, an array if the function has a batch equivalent, see
+                get_batch_generator
+        """
+        parameters: Dict[str, Any] = {**dict(self.genotype), **kwargs}
+
+        batch_generator = get_batch_generator(self.__function)
+
+        if batch_generator is None:
+            return [self.__function(**parameters) for _ in range(count)]
+
+        return batch_generator(count, **parameters)
+
+    def generate_batch(self, count: int, **kwargs) -> List[AbstractChromosome]:
+        chromosomes: List[AbstractChromosome] = []
+
+        for value in self.generate_values(count, **kwargs):
+            chromosome: FunctionChromosome = self.derive(self.genotype.copy())
+            chromosome.phenotype = value
+            chromosomes.append(chromosome)
+
+        return chromosomes
+
+    def mutate_batch(self, mutation_probability: float, count: int, **kwargs) -> List[AbstractChromosome]:
+        # the genotype holds the arguments of the function rather than
+        # generators, so each clone is mutated in turn
+        clones: List[AbstractChromosome] = [self.clone() for _ in range(count)]
+
+        for clone in clones:
+            clone.mutate(mutation_probability, **kwargs)
+
+        return clones
@@ -0,0 +1,110 @@
+import time
+import uuid
+from typing import Any, Dict, List
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.distributed.payload import decode_result, encode_task
+from opticverge.core.distributed.transport import AbstractTransport
+from opticverge.core.log.logger import application_logger
+
+
+class Coordinator(object):
+    """ Evaluates chromosomes on remote workers through a transport
+
+    The coordinator encodes the genotype of each chromosome as a task, waits
+    for the workers to return its fitness and timing and requeues the tasks of
+    workers that stopped renewing their lease, see Worker.
+    """
+
+    def __init__(self, transport: AbstractTransport, lease_timeout: float = 60, poll_interval: float = 0.1,
+                 timeout: float = None):
+        """ The constructor for this class
+
+        Args:
+            transport (AbstractTransport): The transport shared with the workers
+            lease_timeout (float, optional): Defaults to 60. The number of seconds after which the task of a worker
+                that has not renewed its lease is requeued
+            poll_interval (float, optional): Defaults to 0.1. The number of seconds between checks for results
+            timeout (float, optional): Defaults to None. The number of seconds to wait for a batch before the
+                evaluation of the remaining chromosomes fails, None waits indefinitely
+        """
+        self.__transport = transport
+        self.__lease_timeout = lease_timeout
+        self.__poll_interval = poll_interval
+        self.__timeout = timeout
+
+    @property
+    def transport(self) -> AbstractTransport:
+        return self.__transport
+
+    @property
+    def lease_timeout(self) -> float:
+        return self.__lease_timeout
+
+    def evaluate(self, chromosomes: List[AbstractChromosome], identity: str = None) -> Dict[str, Any]:
+        """Evaluates the chromosomes on the workers, assigning the fitness and evaluation time of each chromosome
+
+        A chromosome whose evaluation failed on the worker or timed out is
+        evaluated without a fitness, as it is when the problem fails locally.
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The chromosomes to evaluate
+            identity (str, optional): Defaults to None. The identity of the problem, workers whose problem differs
+                refuse the tasks, see AbstractProblem.identity
+
+        Returns:
+            Dict[str, Any]: The result returned by the objective function for each chromosome keyed by its task
+        """
+        tasks: Dict[str, AbstractChromosome] = {}
+
+        for chromosome in chromosomes:
+            task_id = uuid.uuid4().hex
+            self.__transport.put_task(task_id, encode_task(chromosome, identity))
+            tasks[task_id] = chromosome
+
+        outputs: Dict[str, Any] = {}
+        started = time.time()
+
+        while len(tasks) > 0:
+
+            for task_id in list(tasks):
+                payload = self.__transport.get_result(task_id)
+
+                if payload is None:
+                    continue
+
+                chromosome = tasks.pop(task_id)
+                result: Dict[str, Any] = decode_result(payload)
+
+                if result.get("error") is not None:
+                    application_logger.error("Coordinator-evaluate: Worker {} failed to evaluate {}: {}".format(
+                        result.get("worker_id"), chromosome.id, result.get("error")))
+
+                chromosome.fitness = result.get("fitness")
+                chromosome.meta.evaluated = True
+                # the evaluation stage sets the evaluation and CPU time
+                for stage, (wall, cpu) in result.get("timings", {}).items():
+                    chromosome.meta.record_time(stage, wall, cpu)
+
+                chromosome.meta.abandoned = result.get("abandoned", False)
+
+                outputs[task_id] = result.get("output")
+
+            if len(tasks) == 0:
+                break
+
+            for task_id in self.__transport.requeue_expired(self.__lease_timeout):
+                application_logger.warning("Coordinator-evaluate: Requeued task {} of a lost worker".format(task_id))
+
+            if self.__timeout is not None and time.time() - started > self.__timeout:
+                application_logger.error("Coordinator-evaluate: {} tasks timed out".format(len(tasks)))
+
+                for task_id, chromosome in tasks.items():
+                    self.__transport.cancel(task_id)
+                    chromosome.fitness = None
+
+                break
+
+            time.sleep(self.__poll_interval)
+
+        return outputs
@@ -0,0 +1,161 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+
+
+def encode_task(chromosome: AbstractChromosome, identity: str = None) -> bytes:
+    """ Encodes a chromosome as the JSON payload of a task
+
+    Only the genotype, phenotype and the meta the evaluation depends on are
+    sent, so a worker never unpickles data read from the transport. A value
+    of the genotype or phenotype constructed from a nested chromosome e.g. the
+    base_estimator of an ensemble is sent as its parameters, see decode_task.
+
+    Args:
+        chromosome (AbstractChromosome): The chromosome to evaluate
+        identity (str, optional): Defaults to None. The identity of the problem, a worker whose problem has a
+            different identity refuses the task
+
+    Returns:
+        bytes: The payload
+
+    Raises:
+        TypeError: If the genotype holds a value that cannot be encoded
+    """
+    return json.dumps({
+        "identity": identity,
+        "genotype": _to_json(chromosome.genotype),
+        "phenotype": _to_json(chromosome.phenotype),
+        "meta": {
+            "id": chromosome.id,
+            "parent_id": chromosome.meta.parent_id,
+            "threshold": _to_json(chromosome.meta.threshold),
+            "fidelity": chromosome.meta.fidelity
+        }
+    }).encode()
+
+
+def decode_task(payload: bytes, chromosome: AbstractChromosome) -> Tuple[AbstractChromosome, str]:
+    """ Rebuilds the chromosome of a task from the chromosome held by the worker
+
+    The genotype is decoded against the blueprint of the worker's chromosome,
+    values sent as parameters are constructed by the nested chromosome of the
+    blueprint with the same key, see ClassChromosome.express.
+
+    Args:
+        payload (bytes): The payload, see encode_task
+        chromosome (AbstractChromosome): The chromosome whose blueprint the task was generated from
+
+    Returns:
+        Tuple[AbstractChromosome, str]: The chromosome to evaluate and the identity of the problem of the coordinator
+
+    Raises:
+        ValueError: If the payload holds a value the blueprint cannot construct
+    """
+    task: Dict[str, Any] = json.loads(payload.decode())
+
+    derived: AbstractChromosome = chromosome.derive(_from_json(task["genotype"], chromosome.blueprint))
+    derived.phenotype = _from_json(task["phenotype"], chromosome)
+
+    meta: Dict[str, Any] = task["meta"]
+    derived.meta.id = meta["id"]
+    derived.meta.parent_id = meta["parent_id"]
+    derived.meta.threshold = _from_json(meta["threshold"])
+    derived.meta.fidelity = meta["fidelity"]
+
+    return derived, task["identity"]
+
+
+def encode_result(result: Dict[str, Any]) -> bytes:
+    """ Encodes the result of a task as a JSON payload
+
+    Values that cannot be encoded e.g. an unusual output of the objective
+    function are replaced by their repr.
+
+    Args:
+        result (Dict[str, Any]): The fitness, output and timing of the evaluation
+
+    Returns:
+        bytes: The payload
+    """
+    return json.dumps({key: _to_json(value, strict=False) for key, value in result.items()}).encode()
+
+
+def decode_result(payload: bytes) -> Dict[str, Any]:
+    """ Decodes the result of a task
+
+    Args:
+        payload (bytes): The payload, see encode_result
+
+    Returns:
+        Dict[str, Any]: The fitness, output and timing of the evaluation
+    """
+    return {key: _from_json(value) for key, value in json.loads(payload.decode()).items()}
+
+
+def _to_json(value: Any, strict: bool = True) -> Any:
+    """ Converts a value to the types JSON represents, tagging the types it does not in a single key object
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, list):
+        return [_to_json(item, strict) for item in value]
+
+    if isinstance(value, tuple):
+        return {"tuple": [_to_json(item, strict) for item in value]}
+
+    if isinstance(value, dict):
+        return {"dict": [[_to_json(key, strict), _to_json(item, strict)] for key, item in value.items()]}
+
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return {"array": value.tolist(), "dtype": value.dtype.str}
+
+    if hasattr(value, "get_params"):
+        return {"parameters": _to_json(value.get_params(deep=False), strict)}
+
+    if strict:
+        raise TypeError("A value of type {} cannot be sent to a worker".format(type(value).__name__))
+
+    return repr(value)
+
+
+def _from_json(value: Any, template: Any = None) -> Any:
+    """ Reverses _to_json, the template is the chromosome or blueprint that generated the value
+    """
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "tuple" in value:
+        return tuple(_from_json(item) for item in value["tuple"])
+
+    if "dict" in value:
+        blueprint: Dict[Any, Any] = template if isinstance(template, dict) else {}
+
+        # genotypes are ordered, the keys are decoded first so that integer
+        # keys e.g. those of an array find their generator
+        items = [(_from_json(key), item) for key, item in value["dict"]]
+
+        return OrderedDict((key, _from_json(item, blueprint.get(key))) for key, item in items)
+
+    if "array" in value:
+        return np.array(value["array"], dtype=np.dtype(value["dtype"]))
+
+    if "parameters" in value:
+        if not callable(getattr(template, "express", None)):
+            raise ValueError("The blueprint of the worker cannot construct a value from its parameters")
+
+        return template.derive(_from_json(value["parameters"], template.blueprint)).express()
+
+    raise ValueError("Unknown value {}".format(value))
+
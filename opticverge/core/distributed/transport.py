@@ -0,0 +1,240 @@
+import os
+import time
+import uuid
+from abc import ABCMeta, abstractmethod
+from typing import List, Tuple
+
+
+class AbstractTransport(metaclass=ABCMeta):
+    """ Moves serialised tasks from a coordinator to its workers and their results back
+
+    A task fetched by a worker is leased to it rather than removed, a lease
+    that is not renewed within the lease timeout e.g. because the worker was
+    lost is returned to the queue so that another worker evaluates the task.
+    """
+
+    @abstractmethod
+    def put_task(self, task_id: str, payload: bytes):
+        """Adds a task to the queue
+
+        Args:
+            task_id (str): The unique identifier of the task
+            payload (bytes): The serialised task
+        """
+        pass
+
+    @abstractmethod
+    def get_task(self, worker_id: str) -> Tuple[str, bytes] or None:
+        """Leases the next task in the queue to a worker
+
+        Args:
+            worker_id (str): The unique identifier of the worker
+
+        Returns:
+            Tuple[str, bytes] or None: The identifier and payload of the task, None if the queue is empty
+        """
+        pass
+
+    @abstractmethod
+    def renew_lease(self, task_id: str, worker_id: str):
+        """Extends the lease of a task held by a worker
+
+        Args:
+            task_id (str): The unique identifier of the task
+            worker_id (str): The unique identifier of the worker
+        """
+        pass
+
+    @abstractmethod
+    def put_result(self, task_id: str, worker_id: str, payload: bytes) -> bool:
+        """Returns the result of a task and releases its lease
+
+        The result is discarded if the worker no longer holds the lease e.g.
+        because it expired and the task was requeued or cancelled, so that no
+        result outlives its task.
+
+        Args:
+            task_id (str): The unique identifier of the task
+            worker_id (str): The unique identifier of the worker
+            payload (bytes): The serialised result
+
+        Returns:
+            bool: True if the result was returned, False if it was discarded
+        """
+        pass
+
+    @abstractmethod
+    def get_result(self, task_id: str) -> bytes or None:
+        """Removes the result of a task
+
+        Args:
+            task_id (str): The unique identifier of the task
+
+        Returns:
+            bytes or None: The serialised result, None if the task has not completed
+        """
+        pass
+
+    @abstractmethod
+    def requeue_expired(self, lease_timeout: float) -> List[str]:
+        """Returns the tasks whose lease has not been renewed within the lease timeout to the queue
+
+        Args:
+            lease_timeout (float): The number of seconds a lease remains valid without being renewed
+
+        Returns:
+            List[str]: The identifiers of the requeued tasks
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, task_id: str):
+        """Removes a task from the queue along with its lease and result
+
+        Args:
+            task_id (str): The unique identifier of the task
+        """
+        pass
+
+
+class FileTransport(AbstractTransport):
+    """ A broker backed by a directory e.g. on a network share or the local disk for testing
+
+    Each task, lease and result is a file, a task is leased by atomically
+    renaming it into the leased directory so that only a single worker can
+    claim it, and the modification time of the leased file records when its
+    lease was last renewed.
+    """
+
+    def __init__(self, directory: str):
+        """ The constructor for this class
+
+        Args:
+            directory (str): The directory shared by the coordinator and its workers
+        """
+        self.__directory = directory
+
+        self.__task_directory = os.path.join(directory, "tasks")
+        self.__lease_directory = os.path.join(directory, "leased")
+        self.__result_directory = os.path.join(directory, "results")
+
+        for path in [self.__task_directory, self.__lease_directory, self.__result_directory]:
+            os.makedirs(path, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    def put_task(self, task_id: str, payload: bytes):
+        self.__write(os.path.join(self.__task_directory, task_id), payload)
+
+    def get_task(self, worker_id: str) -> Tuple[str, bytes] or None:
+
+        # oldest tasks first, the name of a task never contains a separator
+        # so the lease is named by the task followed by the worker
+        for task_id in sorted(os.listdir(self.__task_directory), key=self.__task_time):
+
+            if task_id.startswith("."):
+                continue
+
+            lease = self.__lease_path(task_id, worker_id)
+
+            try:
+                os.rename(os.path.join(self.__task_directory, task_id), lease)
+            except FileNotFoundError:
+                # another worker leased the task first
+                continue
+
+            os.utime(lease)
+
+            with open(lease, "rb") as file:
+                return task_id, file.read()
+
+        return None
+
+    def renew_lease(self, task_id: str, worker_id: str):
+        try:
+            os.utime(self.__lease_path(task_id, worker_id))
+        except FileNotFoundError:
+            # the lease expired and the task was requeued
+            pass
+
+    def put_result(self, task_id: str, worker_id: str, payload: bytes) -> bool:
+
+        # releasing the lease first claims the task, a lease that was requeued
+        # or cancelled no longer exists
+        try:
+            os.remove(self.__lease_path(task_id, worker_id))
+        except FileNotFoundError:
+            return False
+
+        self.__write(os.path.join(self.__result_directory, task_id), payload)
+
+        return True
+
+    def get_result(self, task_id: str) -> bytes or None:
+        path = os.path.join(self.__result_directory, task_id)
+
+        try:
+            with open(path, "rb") as file:
+                payload = file.read()
+        except FileNotFoundError:
+            return None
+
+        os.remove(path)
+
+        return payload
+
+    def requeue_expired(self, lease_timeout: float) -> List[str]:
+        requeued: List[str] = []
+        expiry: float = time.time() - lease_timeout
+
+        for lease in os.listdir(self.__lease_directory):
+
+            path = os.path.join(self.__lease_directory, lease)
+            task_id = lease.split("@")[0]
+
+            try:
+                if os.path.getmtime(path) >= expiry:
+                    continue
+
+                os.rename(path, os.path.join(self.__task_directory, task_id))
+                requeued.append(task_id)
+
+            except FileNotFoundError:
+                # the worker completed the task or the lease was requeued elsewhere
+                continue
+
+        return requeued
+
+    def cancel(self, task_id: str):
+        paths = [os.path.join(self.__task_directory, task_id), os.path.join(self.__result_directory, task_id)]
+        paths += [
+            os.path.join(self.__lease_directory, lease) for lease in os.listdir(self.__lease_directory)
+            if lease.split("@")[0] == task_id
+        ]
+
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def __lease_path(self, task_id: str, worker_id: str) -> str:
+        return os.path.join(self.__lease_directory, "{}@{}".format(task_id, worker_id))
+
+    def __task_time(self, task_id: str) -> float:
+        try:
+            return os.path.getmtime(os.path.join(self.__task_directory, task_id))
+        except FileNotFoundError:
+            return 0
+
+    def __write(self, path: str, payload: bytes):
+        # write to a hidden temporary file and rename it so that readers never
+        # observe a partially written file
+        temporary = os.path.join(os.path.dirname(path), ".{}".format(uuid.uuid4().hex))
+
+        with open(temporary, "wb") as file:
+            file.write(payload)
+
+        os.replace(temporary, path)
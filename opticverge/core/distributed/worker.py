@@ -0,0 +1,172 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.distributed.payload import decode_task, encode_result
+from opticverge.core.distributed.transport import AbstractTransport
+from opticverge.core.log.logger import application_logger
+from opticverge.core.problem.abstract_problem import AbstractProblem
+
+
+class Worker(object):
+    """ Fetches chromosomes from a transport, evaluates them and returns their fitness and timing
+
+    A worker is typically started on every machine taking part in the search
+    with its own instance of the problem and of the chromosome the search
+    generates its chromosomes from e.g.
+
+        Worker(FileTransport("/mnt/shared/search"), problem, chromosome).run()
+
+    Each task holds the genotype of a chromosome rather than a pickle, the
+    worker rebuilds the chromosome from the blueprint of its own chromosome,
+    see decode_task.
+
+    While a chromosome is evaluated the lease of its task is renewed in the
+    background, if the worker is lost the lease expires and the coordinator
+    requeues the task.
+    """
+
+    def __init__(self, transport: AbstractTransport, problem: AbstractProblem, chromosome: AbstractChromosome,
+                 lease_timeout: float = 60, poll_interval: float = 0.1, worker_id: str = None):
+        """ The constructor for this class
+
+        Args:
+            transport (AbstractTransport): The transport shared with the coordinator
+            problem (AbstractProblem): The problem evaluating the chromosomes
+            chromosome (AbstractChromosome): The chromosome whose blueprint the chromosomes of the tasks are rebuilt
+                from
+            lease_timeout (float, optional): Defaults to 60. Must match the lease timeout of the coordinator, the lease
+                is renewed three times within it
+            poll_interval (float, optional): Defaults to 0.1. The number of seconds to wait when there are no tasks
+            worker_id (str, optional): Defaults to the host, process and a random suffix. Identifies the worker
+        """
+        self.__transport = transport
+        self.__problem = problem
+        self.__chromosome = chromosome
+        self.__lease_timeout = lease_timeout
+        self.__poll_interval = poll_interval
+        self.__worker_id = worker_id if worker_id is not None else "{}-{}-{}".format(
+            socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+
+        self.__stopped = threading.Event()
+
+    @property
+    def worker_id(self) -> str:
+        return self.__worker_id
+
+    def stop(self):
+        """Stops the worker once it has finished its current task
+        """
+        self.__stopped.set()
+
+    def run(self, max_tasks: int = None, idle_timeout: float = None) -> int:
+        """Evaluates tasks until stopped
+
+        Args:
+            max_tasks (int, optional): Defaults to None. The number of tasks to evaluate before stopping
+            idle_timeout (float, optional): Defaults to None. The number of seconds without a task before stopping
+
+        Returns:
+            int: The number of tasks evaluated
+        """
+        completed: int = 0
+        idle_since: float = time.time()
+
+        try:
+            while not self.__stopped.is_set() and (max_tasks is None or completed < max_tasks):
+
+                task = self.__transport.get_task(self.__worker_id)
+
+                if task is None:
+                    if idle_timeout is not None and time.time() - idle_since > idle_timeout:
+                        break
+
+                    self.__stopped.wait(self.__poll_interval)
+                    continue
+
+                task_id, payload = task
+
+                if not self.__transport.put_result(task_id, self.__worker_id, encode_result(
+                        self.evaluate_task(task_id, payload))):
+                    application_logger.warning("Worker-run: Discarded the result of task {} as its lease expired"
+                                               .format(task_id))
+
+                completed += 1
+                idle_since = time.time()
+
+        finally:
+            self.__problem.shutdown()
+
+        return completed
+
+    def evaluate_task(self, task_id: str, payload: bytes) -> Dict[str, Any]:
+        """Rebuilds the chromosome of a task and evaluates it
+
+        Args:
+            task_id (str): The unique identifier of the task
+            payload (bytes): The payload of the task, see encode_task
+
+        Returns:
+            Dict[str, Any]: The fitness, output and timing of the evaluation, or the error if the task was refused
+        """
+        try:
+            chromosome, identity = decode_task(payload, self.__chromosome)
+        except Exception as ex:
+            application_logger.exception("Worker-evaluate_task: Failed to decode task {}".format(task_id), exc_info=ex)
+            return {"worker_id": self.__worker_id, "fitness": None, "output": None, "error": repr(ex)}
+
+        # a problem with another identity e.g. other data or folds would
+        # return a fitness the coordinator cannot compare
+        if identity is not None and identity != self.__problem.identity:
+            application_logger.error("Worker-evaluate_task: The problem {} does not match the coordinator {}".format(
+                self.__problem.identity, identity))
+            return {"worker_id": self.__worker_id, "fitness": None, "output": None,
+                    "error": "The problem of the worker does not match the coordinator"}
+
+        return self.evaluate(task_id, chromosome)
+
+    def evaluate(self, task_id: str, chromosome: AbstractChromosome) -> Dict[str, Any]:
+        """Evaluates a chromosome while renewing the lease of its task
+
+        Args:
+            task_id (str): The unique identifier of the task
+            chromosome (AbstractChromosome): The chromosome to evaluate
+
+        Returns:
+            Dict[str, Any]: The fitness, output of the objective function and timing of the evaluation
+        """
+        finished = threading.Event()
+
+        def renew_lease():
+            while not finished.wait(self.__lease_timeout / 3):
+                self.__transport.renew_lease(task_id, self.__worker_id)
+
+        heartbeat = threading.Thread(target=renew_lease, daemon=True)
+        heartbeat.start()
+
+        result: Dict[str, Any] = {"worker_id": self.__worker_id, "fitness": None, "output": None, "error": None}
+
+        try:
+            result["output"] = self.__problem.evaluate(chromosome)
+            result["fitness"] = chromosome.fitness
+            result["abandoned"] = chromosome.meta.abandoned
+
+        except Exception as ex:
+            application_logger.exception(
+                "Worker-evaluate: Failed to evaluate chromosome {}".format(chromosome.id), exc_info=ex)
+            result["error"] = repr(ex)
+
+        finally:
+            finished.set()
+            heartbeat.join()
+
+        # the time taken by the evaluation and each of its stages e.g. the
+        # folds of a regression problem, the rebuilt chromosome records no
+        # other stage
+        result["timings"] = dict(chromosome.meta.timings)
+
+        return result
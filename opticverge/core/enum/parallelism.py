@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Parallelism(Enum):
+    """The kind of workers a solver uses to mutate and evaluate chromosomes in parallel"""
+
+    Thread = 'Thread'
+    Process = 'Process'
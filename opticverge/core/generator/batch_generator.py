@@ -0,0 +1,34 @@
+from typing import Callable, Dict
+
+from opticverge.core.generator.bool_generator import rand_uniform_bool, rand_uniform_bool_batch
+from opticverge.core.generator.int_distribution_generator import rand_int, rand_int_batch, rand_poisson, \
+    rand_poisson_batch
+from opticverge.core.generator.options_generator import rand_options, rand_options_batch
+from opticverge.core.generator.real_distribution_generator import rand_gauss, rand_gauss_batch
+from opticverge.core.generator.real_generator import rand_real, rand_real_batch
+
+"""
+The batch equivalent of each generator function keyed by the generator
+function, each takes the number of values to generate followed by the
+arguments of the generator function
+"""
+_batch_generators: Dict[Callable, Callable] = {
+    rand_gauss: rand_gauss_batch,
+    rand_poisson: rand_poisson_batch,
+    rand_int: rand_int_batch,
+    rand_real: rand_real_batch,
+    rand_uniform_bool: rand_uniform_bool_batch,
+    rand_options: rand_options_batch
+}
+
+
+def get_batch_generator(function: Callable) -> Callable or None:
+    """ Get the batch equivalent of a generator function e.g. rand_real_batch for rand_real
+
+    Args:
+        function (Callable): The generator function
+
+    Returns:
+        Callable or None: The batch generator, None if the function has no batch equivalent
+    """
+    return _batch_generators.get(function)
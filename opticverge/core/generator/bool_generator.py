@@ -1,5 +1,9 @@
+from typing import Tuple
+
 import numpy as np
 
+from opticverge.core.generator.sampler import get_sampler
+
 
 def rand_uniform_bool(loc=0.5) -> bool:
     """ Generates a boolean derived from a uniform distribution biased towards the value of loc
@@ -10,6 +14,17 @@ def rand_uniform_bool(loc=0.5) -> bool:
     Returns:
         bool
     """
-    return np.random.uniform() > loc
+    return get_sampler().random() > loc
+
+
+def rand_uniform_bool_batch(count: int or Tuple[int, ...], loc=0.5, **kwargs) -> np.ndarray:
+    """ The array equivalent of rand_uniform_bool, generates count booleans at once
 
+    Args:
+        count: The number of booleans or the shape of the array of booleans
+        loc: The bias, if higher tends towards producing false more and vice versa
 
+    Returns:
+        np.ndarray
+    """
+    return get_sampler().generator.random(count) > loc
@@ -1,11 +1,10 @@
-from typing import List
+from typing import Tuple
 
 import numpy as np
-from scipy.stats import poisson
 
-from opticverge.core.generator.options_generator import rand_options
+from opticverge.core.generator.sampler import get_sampler
 from opticverge.core.globals import DEFAULT_SAMPLE_SIZE
-from opticverge.core.numeric.safe import safe_value
+from opticverge.core.numeric.safe import safe_array, safe_value
 
 
 def rand_int(
@@ -19,7 +18,8 @@ def rand_int(
     Args:
         min_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): The lower boundary.
         max_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): The upper boundary.
-        sample_size (int): Defaults to DEFAULT_SAMPLE_SIZE. The number of samples to take from the distribution
+        sample_size (int): Defaults to DEFAULT_SAMPLE_SIZE. Retained for compatibility, selecting one of a number of
+            samples of the distribution is equivalent to drawing a single sample
         rounding (int): The amount of rounding to apply
         output_dtype (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to np.int64.
 
@@ -32,9 +32,7 @@ def rand_int(
             "rand_int: min_val {} or max_val {} cannot be None".format(min_val, max_val)
         )
 
-    options: List[np.int64] = np.random.randint(min_val, max_val, sample_size)
-
-    choice: np.int64 = rand_options(options)
+    choice: np.int64 = np.int64(get_sampler().integers(min_val, max_val))
 
     return safe_value(choice, min_val, max_val, rounding, output_dtype)
 
@@ -52,7 +50,8 @@ def rand_poisson(value: int or np.int8 or np.int16 or np.int32 or np.int64 or np
         min_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to None. The lower boundary.
         max_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to None. The upper boundary.
         rounding (int): Defaults to None. The number of places to round to.
-        sample_size (int): Defaults to None. The number of samples to take from the distribution.
+        sample_size (int): Defaults to DEFAULT_SAMPLE_SIZE. Retained for compatibility, selecting one of a number of
+            samples of the distribution is equivalent to drawing a single sample
         output_dtype (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults  to None. If set converts the output value to the dtype or uses the default of the output of the distribution
 
     Returns:
@@ -62,8 +61,70 @@ def rand_poisson(value: int or np.int8 or np.int16 or np.int32 or np.int64 or np
         if min_val is not None and max_val is not None:
             value = rand_int(min_val, max_val)
 
-    options: List[np.int64] = poisson.rvs(value, size=sample_size)
-
-    choice: np.int64 = rand_options(options)
+    choice: np.int64 = np.int64(get_sampler().poisson(value))
 
     return safe_value(choice, min_val, max_val, rounding, output_dtype)
+
+
+def rand_int_batch(
+        count: int or Tuple[int, ...],
+        min_val: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128,
+        max_val: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128,
+        rounding: int = None,
+        output_dtype: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128 = None,
+        **kwargs) -> np.ndarray:
+    """ The array equivalent of rand_int, generates count ints at once
+
+    Args:
+        count (int or Tuple[int, ...]): The number of ints or the shape of the array of ints
+        min_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): The lower boundary.
+        max_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): The upper boundary.
+        rounding (int): The amount of rounding to apply
+        output_dtype (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to np.int64.
+
+    Returns:
+        np.ndarray
+    """
+
+    if min_val is None or max_val is None:
+        raise ValueError(
+            "rand_int_batch: min_val {} or max_val {} cannot be None".format(min_val, max_val)
+        )
+
+    values = get_sampler().generator.integers(min_val, max_val, count)
+
+    return safe_array(values, min_val, max_val, rounding, output_dtype)
+
+
+def rand_poisson_batch(
+        count: int or Tuple[int, ...],
+        value: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128 = None,
+        min_val: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128 = None,
+        max_val: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128 = None,
+        rounding: int = None,
+        output_dtype: int or np.int8 or np.int16 or np.int32 or np.int64 or np.int128 = None,
+        **kwargs) -> np.ndarray:
+    """ The array equivalent of rand_poisson, generates count ints at once
+
+    Args:
+        count (int or Tuple[int, ...]): The number of ints or the shape of the array of ints
+        value (int, np.int8, np.int16, np.int32, np.int64, np.int128): The centre of the distribution
+        min_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to None. The lower boundary.
+        max_val (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults to None. The upper boundary.
+        rounding (int): Defaults to None. The number of places to round to.
+        output_dtype (int, np.int8, np.int16, np.int32, np.int64, np.int128): Defaults  to None. If set converts the
+            output values to the dtype
+
+    Returns:
+        np.ndarray
+    """
+    generator: np.random.Generator = get_sampler().generator
+
+    # every value without a centre draws its own centre as rand_poisson does
+    if value is None:
+        if min_val is not None and max_val is not None:
+            value = generator.integers(min_val, max_val, count)
+
+    values = generator.poisson(value, count)
+
+    return safe_array(values, min_val, max_val, rounding, output_dtype)
@@ -1,7 +1,9 @@
-from typing import List, Any
+from typing import Any, List
 
 import numpy as np
 
+from opticverge.core.generator.sampler import get_sampler
+
 
 def rand_options(options: List[Any] or int, size: int = None, replacement: bool = False):
     """
@@ -15,4 +17,31 @@ def rand_options(options: List[Any] or int, size: int = None, replacement: bool
         Any, List[Any]
 
     """
-    return np.random.choice(options, size, replacement)
+    if size is None:
+        return get_sampler().choice(options)
+
+    return get_sampler().generator.choice(options, size, replacement)
+
+
+def rand_options_batch(count: int, options: List[Any] or int, size: int = None, replacement: bool = False,
+                       **kwargs) -> List[Any]:
+    """ The batch equivalent of rand_options, selects count times at once
+
+    Args:
+        count: The number of selections
+        options: The list of items to choose from
+        size: The number of items to choose on each selection
+        replacement: Select unique (false) or repeating (true) values
+
+    Returns:
+        List[Any]: The selections, the items of the options are returned as they are rather than as NumPy scalars
+    """
+    generator: np.random.Generator = get_sampler().generator
+
+    if size is not None:
+        return [generator.choice(options, size, replacement) for _ in range(count)]
+
+    if isinstance(options, (int, np.integer)):
+        return generator.integers(0, options, count).tolist()
+
+    return [options[i] for i in generator.integers(0, len(options), count).tolist()]
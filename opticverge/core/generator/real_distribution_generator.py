@@ -1,9 +1,10 @@
+from typing import Tuple
+
 import numpy as np
-from scipy.stats import norm
 
-from opticverge.core.generator.options_generator import rand_options
+from opticverge.core.generator.sampler import get_sampler
 from opticverge.core.globals import DEFAULT_SAMPLE_SIZE
-from opticverge.core.numeric.safe import safe_value
+from opticverge.core.numeric.safe import safe_array, safe_value
 
 
 def rand_gauss(
@@ -19,7 +20,8 @@ def rand_gauss(
         value: The centre of the distribution
         min_val: The lower boundary
         max_val: The upper boundary
-        sample_size: The number of samples generate
+        sample_size: Retained for compatibility, selecting one of a number of samples of the distribution is
+            equivalent to drawing a single sample
         rounding: The amount of rounding to apply to the samples
         output_dtype: The output type of the operation
 
@@ -27,14 +29,36 @@ def rand_gauss(
         float, np.float32, np.float64
     """
 
-    # retrieve the options from sampling the normal distribution
-    choices = norm.rvs(size=sample_size)
-
-    # select one of them
-    choice = rand_options(choices)
+    # draw a sample from the standard normal distribution
+    choice = get_sampler().standard_normal()
 
     # change the value based on the choice
     result = (choice * np.float64(value)) + np.float64(value)
 
     # safely evaluate the result respecting the boundaries, rounding an output type
     return safe_value(result, min_val, max_val, rounding, output_dtype)
+
+
+def rand_gauss_batch(count: int or Tuple[int, ...],
+                     value: float or np.float32 or np.float64,
+                     min_val: float or np.float32 or np.float64 = None,
+                     max_val: float or np.float32 or np.float64 = None,
+                     rounding: int = None,
+                     output_dtype: float or np.float32 or np.float64 = None,
+                     **kwargs) -> np.ndarray:
+    """ The array equivalent of rand_gauss, generates count values at once
+
+    Args:
+        count: The number of values or the shape of the array of values
+        value: The value to modify
+        min_val: The lower boundary of the values
+        max_val: The upper boundary of the values
+        rounding: The amount of rounding to apply
+        output_dtype: The dtype of the values
+
+    Returns:
+        np.ndarray
+    """
+    values = (get_sampler().generator.standard_normal(count) * np.float64(value)) + np.float64(value)
+
+    return safe_array(values, min_val, max_val, rounding, output_dtype)
@@ -1,9 +1,9 @@
-from typing import Any
+from typing import Any, Tuple
 
 import numpy as np
 
-from opticverge.core.generator.options_generator import rand_options
-from opticverge.core.numeric.safe import safe_value
+from opticverge.core.generator.sampler import get_sampler
+from opticverge.core.numeric.safe import safe_array, safe_value
 
 
 def rand_real(min_val: float or np.float32 or np.float64 = 0.0,
@@ -16,7 +16,8 @@ def rand_real(min_val: float or np.float32 or np.float64 = 0.0,
     Args:
         min_val (float, np.float32, np.float64, optional): Defaults to 0.0. The lower boundary
         max_val (float, np.float32, np.float64, optional): Defaults to 1.0. The upper boundary
-        sample_size(int): Defaults to 1. The number of samples to take from the normal distribution
+        sample_size(int): Defaults to 1. Retained for compatibility, selecting one of a number of samples of the
+            distribution is equivalent to drawing a single sample
         rounding (int, optional): Defaults to None. If set applies np.round to the value
         output_dtype (Any, optional): Defaults to None. If set converts the value to the desired type
     
@@ -34,8 +35,40 @@ def rand_real(min_val: float or np.float32 or np.float64 = 0.0,
     if output_dtype is None:
         output_dtype = np.float64
 
-    options = np.random.uniform(min_val, max_val, sample_size)
-
-    choice = rand_options(options)
+    choice = get_sampler().uniform(min_val, max_val)
 
     return safe_value(choice, min_val, max_val, rounding, output_dtype)
+
+
+def rand_real_batch(count: int or Tuple[int, ...],
+                    min_val: float or np.float32 or np.float64 = 0.0,
+                    max_val: float or np.float32 or np.float64 = 1.0,
+                    rounding: int = None,
+                    output_dtype: Any = None,
+                    **kwargs) -> np.ndarray:
+    """ The array equivalent of rand_real, generates count values at once
+
+    Args:
+        count (int or Tuple[int, ...]): The number of values or the shape of the array of values
+        min_val (float, np.float32, np.float64, optional): Defaults to 0.0. The lower boundary
+        max_val (float, np.float32, np.float64, optional): Defaults to 1.0. The upper boundary
+        rounding (int, optional): Defaults to None. If set applies np.round to the values
+        output_dtype (Any, optional): Defaults to None. If set converts the values to the desired type
+
+    Raises:
+        ValueError:
+
+    Returns:
+        np.ndarray: np.float64 by default otherwise the type specified in output_dtype
+    """
+    if min_val is None or max_val is None:
+        raise ValueError(
+            "rand_real_batch: min_val {} or max_val {} cannot be None".format(min_val, max_val)
+        )
+
+    if output_dtype is None:
+        output_dtype = np.float64
+
+    values = get_sampler().generator.uniform(min_val, max_val, count)
+
+    return safe_array(values, min_val, max_val, rounding, output_dtype)
@@ -0,0 +1,215 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, List
+
+import numpy as np
+
+"""
+The maximum number of distinct poisson rates that are buffered, samples of
+further rates are drawn individually
+"""
+_max_poisson_buffers: int = 256
+
+
+class Sampler(object):
+    """ Serves random samples from buffers drawn in bulk from a NumPy Generator
+
+    Drawing a single sample from NumPy or SciPy is dominated by the cost of
+    the call itself, the sampler draws thousands of samples of a distribution
+    at once and serves them one at a time. Samples are popped from lists,
+    which is atomic, so threads may share a sampler.
+
+    Samplers spawned from a sampler draw from independent streams of its seed,
+    see spawn, so parallel workers never repeat each other's samples and a
+    run is reproducible from a single seed.
+    """
+
+    def __init__(self, seed: int or np.random.SeedSequence = None, buffer_size: int = 4096):
+        """ The constructor for this class
+
+        Args:
+            seed (int or np.random.SeedSequence, optional): Defaults to None. The seed of the generator, None draws
+                fresh entropy from the operating system
+            buffer_size (int, optional): Defaults to 4096. The number of samples drawn at once
+        """
+        self.__seed_sequence: np.random.SeedSequence = seed if isinstance(seed, np.random.SeedSequence) \
+            else np.random.SeedSequence(seed)
+        self.__generator: np.random.Generator = np.random.default_rng(self.__seed_sequence)
+        self.__buffer_size = buffer_size
+
+        self.__normal: List[float] = []
+        self.__uniform: List[float] = []
+        self.__poisson: Dict[float, List[int]] = {}
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Get the generator backing the buffers, used directly for vectorised sampling
+
+        Returns:
+            np.random.Generator: The generator
+        """
+        return self.__generator
+
+    def spawn(self, count: int = 1) -> List['Sampler']:
+        """Creates samplers drawing from independent streams derived from the seed of this sampler
+
+        Spawning is deterministic, the nth sampler spawned from a seed always
+        draws the same samples.
+
+        Args:
+            count (int, optional): Defaults to 1. The number of samplers
+
+        Returns:
+            List[Sampler]: The spawned samplers
+        """
+        return [Sampler(seed_sequence, self.__buffer_size) for seed_sequence in self.__seed_sequence.spawn(count)]
+
+    def standard_normal(self) -> float:
+        """Draws a sample from the standard normal distribution
+
+        Returns:
+            float
+        """
+        try:
+            return self.__normal.pop()
+        except IndexError:
+            self.__normal = self.__generator.standard_normal(self.__buffer_size).tolist()
+            return self.__normal.pop()
+
+    def random(self) -> float:
+        """Draws a sample from the uniform distribution over [0, 1)
+
+        Returns:
+            float
+        """
+        try:
+            return self.__uniform.pop()
+        except IndexError:
+            self.__uniform = self.__generator.random(self.__buffer_size).tolist()
+            return self.__uniform.pop()
+
+    def uniform(self, low: float = 0.0, high: float = 1.0) -> float:
+        """Draws a sample from the uniform distribution over [low, high)
+
+        Args:
+            low (float, optional): Defaults to 0.0. The lower boundary
+            high (float, optional): Defaults to 1.0. The upper boundary
+
+        Returns:
+            float
+        """
+        return low + (high - low) * self.random()
+
+    def integers(self, low: int, high: int) -> int:
+        """Draws an int from the discrete uniform distribution over [low, high)
+
+        Args:
+            low (int): The lower boundary
+            high (int): The upper boundary, exclusive
+
+        Returns:
+            int
+        """
+        low, high = int(low), int(high)
+
+        if high <= low:
+            raise ValueError("Sampler-integers: low {} must be less than high {}".format(low, high))
+
+        # guard against the product rounding up to the span
+        return min(low + int(self.random() * (high - low)), high - 1)
+
+    def poisson(self, lam: float) -> int:
+        """Draws a sample from the poisson distribution
+
+        Args:
+            lam (float): The rate of the distribution
+
+        Returns:
+            int
+        """
+        buffer = self.__poisson.get(lam)
+
+        if buffer is None:
+            if len(self.__poisson) >= _max_poisson_buffers:
+                return int(self.__generator.poisson(lam))
+
+            buffer = self.__poisson[lam] = []
+
+        try:
+            return buffer.pop()
+        except IndexError:
+            # each rate holds a smaller buffer as there may be many rates
+            buffer = self.__poisson[lam] = self.__generator.poisson(lam, max(1, self.__buffer_size // 16)).tolist()
+            return buffer.pop()
+
+    def choice(self, options: List or int):
+        """Selects one of the options with equal likelihood
+
+        Args:
+            options (List or int): The options, or the number of options to select an index from
+
+        Returns:
+            Any: The selected option
+        """
+        if isinstance(options, (int, np.integer)):
+            return self.integers(0, options)
+
+        return options[self.integers(0, len(options))]
+
+
+"""
+The sampler used by the generators unless the thread has activated its own,
+see get_sampler and active_sampler
+"""
+_sampler: Sampler = Sampler()
+_local = threading.local()
+
+
+def get_sampler() -> Sampler:
+    """ Get the sampler the generators draw from, the sampler activated by the thread otherwise the shared sampler
+
+    Returns:
+        Sampler: The sampler
+    """
+    sampler: Sampler = getattr(_local, "sampler", None)
+
+    return sampler if sampler is not None else _sampler
+
+
+def set_sampler(sampler: Sampler):
+    """ Set the sampler the generators draw from e.g. a seeded sampler for a reproducible run
+
+    Args:
+        sampler (Sampler): The sampler
+    """
+    global _sampler
+    _sampler = sampler
+
+
+def activate_sampler(sampler: Sampler or None) -> Sampler or None:
+    """ Set the sampler the generators draw from within the calling thread
+
+    Args:
+        sampler (Sampler or None): The sampler, None reverts the thread to the shared sampler
+
+    Returns:
+        Sampler or None: The sampler previously activated by the thread
+    """
+    previous: Sampler = getattr(_local, "sampler", None)
+    _local.sampler = sampler
+    return previous
+
+
+@contextmanager
+def active_sampler(sampler: Sampler or None):
+    """ Activates a sampler within the calling thread for the duration of the context, see activate_sampler
+
+    Args:
+        sampler (Sampler or None): The sampler, None leaves the thread drawing from the shared sampler
+    """
+    previous: Sampler = activate_sampler(sampler)
+
+    try:
+        yield sampler
+    finally:
+        activate_sampler(previous)
@@ -0,0 +1,230 @@
+import threading
+from math import ceil, log
+from typing import Any, List, Tuple
+
+import numpy as np
+import xxhash
+
+
+class ChromosomeIndex(object):
+    """ Tracks the ids of the evaluated chromosomes without keeping the chromosomes
+
+    The id of a chromosome is a 64 bit hash of its genotype, the index stores
+    the hash and fitness of each chromosome in an open addressing hash table
+    backed by two arrays, i.e. 16 bytes for each chromosome held at no more
+    than half of the capacity of the table.
+
+    When a false positive rate is given the hashes are instead added to a
+    Bloom filter whose size is fixed by the capacity, the memory is then
+    bounded however long the solver runs for at the cost of occasionally
+    treating a new chromosome as evaluated. The fitness is not retained.
+
+    The threads of a solver read the index whilst the solver adds to it.
+    Writers hold a lock and a resize builds a new table that replaces the
+    previous one in a single assignment, so readers never observe a table
+    that is partially rebuilt.
+    """
+
+    def __init__(self, capacity: int = 1024, false_positive_rate: float = None):
+        """ The constructor for this class
+
+        Args:
+            capacity (int, optional): Defaults to 1024. The expected number of chromosomes, the hash table grows when
+                it is exceeded whereas the Bloom filter is sized for it
+            false_positive_rate (float, optional): Defaults to None. The likelihood that the Bloom filter reports an
+                unseen chromosome as evaluated once it holds the capacity, None stores the exact hashes
+        """
+        self.__false_positive_rate = false_positive_rate
+        self.__size: int = 0
+        self.__lock = threading.Lock()
+
+        if false_positive_rate is None:
+            # the table is a power of two so that the slot is a mask of the hash
+            slots = 1 << max(3, int(ceil(log(max(capacity, 1) * 2, 2))))
+
+            # the keys and fitness of the table are replaced together
+            self.__table: Tuple[np.ndarray, np.ndarray] = _empty_table(slots)
+            self.__bits: np.ndarray = None
+        else:
+            bit_count = int(ceil(-max(capacity, 1) * log(false_positive_rate) / (log(2) ** 2)))
+
+            self.__hash_count: int = max(1, int(round(bit_count / max(capacity, 1) * log(2))))
+            self.__bit_count: int = bit_count
+            self.__bits: bytearray = bytearray((bit_count + 7) // 8)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_ChromosomeIndex__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    @property
+    def false_positive_rate(self) -> float:
+        return self.__false_positive_rate
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory held by the index
+
+        Returns:
+            int: The number of bytes
+        """
+        if self.__bits is not None:
+            return len(self.__bits)
+
+        keys, fitness = self.__table
+
+        return keys.nbytes + fitness.nbytes
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, chromosome_id: str) -> bool:
+        key = _key(chromosome_id)
+
+        if self.__bits is not None:
+            return all(self.__bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(key))
+
+        keys, _ = self.__table
+
+        return keys.item(_slot(keys, key)) == key
+
+    def __getitem__(self, chromosome_id: str) -> float or None:
+        if chromosome_id not in self:
+            raise KeyError(chromosome_id)
+
+        return self.get(chromosome_id)
+
+    def __setitem__(self, chromosome_id: str, chromosome: Any):
+        self.add(chromosome_id, getattr(chromosome, "fitness", chromosome))
+
+    def get(self, chromosome_id: str, default: float = None) -> float or None:
+        """Get the fitness of an evaluated chromosome
+
+        Args:
+            chromosome_id (str): The id of the chromosome
+            default (float, optional): Defaults to None. The value returned when the fitness is unknown
+
+        Returns:
+            float or None: The fitness of the chromosome
+        """
+        if self.__bits is not None:
+            return default
+
+        key = _key(chromosome_id)
+        keys, fitness = self.__table
+        slot = _slot(keys, key)
+
+        if keys.item(slot) != key or np.isnan(fitness[slot]):
+            return default
+
+        return float(fitness[slot])
+
+    def add(self, chromosome_id: str, fitness: float = None):
+        """Records that a chromosome was evaluated
+
+        Args:
+            chromosome_id (str): The id of the chromosome
+            fitness (float, optional): Defaults to None. The fitness of the chromosome
+        """
+        key = _key(chromosome_id)
+
+        with self.__lock:
+
+            if self.__bits is not None:
+                added: bool = False
+
+                for position in self.__positions(key):
+                    mask = 1 << (position & 7)
+
+                    if not self.__bits[position >> 3] & mask:
+                        self.__bits[position >> 3] |= mask
+                        added = True
+
+                # a chromosome whose bits are all set was already counted
+                if added:
+                    self.__size += 1
+
+                return
+
+            keys, values = self.__table
+            slot = _slot(keys, key)
+
+            # the fitness is assigned before the key so that a reader never
+            # finds the key with the fitness of a previous chromosome
+            values[slot] = np.nan if fitness is None else fitness
+
+            if keys.item(slot) != key:
+                keys[slot] = key
+                self.__size += 1
+
+            if self.__size * 2 > len(keys):
+                self.__resize(len(keys) * 2)
+
+    def __resize(self, slots: int):
+        keys, values = self.__table
+        occupied = keys != 0
+
+        table: Tuple[np.ndarray, np.ndarray] = _empty_table(slots)
+
+        for key, value in zip(keys[occupied].tolist(), values[occupied].tolist()):
+            slot = _slot(table[0], key)
+            table[0][slot] = key
+            table[1][slot] = value
+
+        self.__table = table
+
+    def __positions(self, key: int) -> List[int]:
+        """Derives the bits of a key in the Bloom filter from the two halves of its hash
+        """
+        first, second = key & 0xffffffff, (key >> 32) | 1
+        return [(first + i * second) % self.__bit_count for i in range(self.__hash_count)]
+
+
+def _empty_table(slots: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.zeros(slots, dtype=np.uint64), np.full(slots, np.nan, dtype=np.float64)
+
+
+def _slot(keys: np.ndarray, key: int) -> int:
+    """ Finds the slot holding the key or the empty slot it would be inserted into using linear probing
+
+    Args:
+        keys (np.ndarray): The keys of the table, a power of two in length
+        key (int): The hash of the chromosome
+
+    Returns:
+        int: The slot
+    """
+    mask = len(keys) - 1
+    slot = key & mask
+
+    # item returns a Python int, comparing numpy scalars is far slower
+    item = keys.item
+
+    while True:
+        current = item(slot)
+
+        if current == 0 or current == key:
+            return slot
+
+        slot = (slot + 1) & mask
+
+
+def _key(chromosome_id: str) -> int:
+    """ Converts the id of a chromosome to the 64 bit hash stored by the index, zero marks an empty slot
+
+    Args:
+        chromosome_id: The hexadecimal xxh64 id of the chromosome
+
+    Returns:
+        int: The hash
+    """
+    try:
+        key = int(chromosome_id, 16) & 0xffffffffffffffff
+    except (TypeError, ValueError):
+        key = xxhash.xxh64(str(chromosome_id).encode()).intdigest()
+
+    return key if key != 0 else 1
@@ -1,5 +1,4 @@
-import copy
-from typing import TypeVar
+from typing import Dict, Tuple, TypeVar
 
 """Typing for the chromosome meta class to be returned"""
 ChromosomeMetaEntity = TypeVar('ChromosomeMeta')
@@ -7,6 +6,9 @@ ChromosomeMetaEntity = TypeVar('ChromosomeMeta')
 
 class ChromosomeMeta(object):
 
+    __slots__ = ("__id", "__evaluation_time", "__cpu_time", "__timings", "__parent_id", "__evaluated", "__threshold",
+                 "__abandoned", "__fidelity")
+
     def __init__(self):
         """The constructor for this class
         """
@@ -18,11 +20,31 @@ class ChromosomeMeta(object):
         # the time taken in milliseconds to evaluate the chromosome
         self.__evaluation_time: int = None
 
+        # the CPU time taken in milliseconds to evaluate the chromosome,
+        # including the time of the worker processes fitting its folds
+        self.__cpu_time: int = None
+
+        # the wall clock and CPU time in milliseconds of each stage the
+        # chromosome passed through e.g. its mutation, created on first use
+        self.__timings: Dict[str, Tuple[float, float]] = None
+
         # the parent chromosome id
         self.__parent_id: str = None
 
         # tracks whether the chromosome was evaluated
         self.__evaluated: bool = False
+
+        # the fitness the chromosome must beat to be selected, assigned by the
+        # solver before the evaluation
+        self.__threshold: float = None
+
+        # whether the evaluation stopped early because the chromosome could
+        # not beat the threshold
+        self.__abandoned: bool = False
+
+        # the fraction of the full evaluation the fitness is derived from,
+        # None represents a full evaluation
+        self.__fidelity: float = None
     
     @property
     def evaluated(self) -> bool:
@@ -96,12 +118,115 @@ class ChromosomeMeta(object):
         """
         self.__evaluation_time = value
 
+    @property
+    def cpu_time(self) -> int:
+        """Get the CPU time taken to evaluate the chromosome
+
+        Returns:
+            int: The CPU time in milliseconds
+        """
+        return self.__cpu_time
+
+    @cpu_time.setter
+    def cpu_time(self, value: int):
+        """Set the CPU time taken to evaluate the chromosome
+
+        Args:
+            value (int): The CPU time in milliseconds
+        """
+        self.__cpu_time = value
+
+    @property
+    def timings(self) -> Dict[str, Tuple[float, float]]:
+        """Get the time taken by each stage the chromosome passed through
+
+        The stages are generation or mutation, evaluation and, for regression
+        problems, the fit and predict of every fold e.g. fold_0_fit.
+
+        Returns:
+            Dict[str, Tuple[float, float]]: The wall clock and CPU time in milliseconds keyed by the stage
+        """
+        return {} if self.__timings is None else self.__timings
+
+    def record_time(self, stage: str, wall: float, cpu: float):
+        """Adds the time taken by a stage to the timings, the evaluation stage also adds to evaluation_time and cpu_time
+
+        Args:
+            stage (str): The name of the stage e.g. mutation
+            wall (float): The wall clock time in milliseconds
+            cpu (float): The CPU time in milliseconds
+        """
+        if self.__timings is None:
+            self.__timings = {}
+
+        previous_wall, previous_cpu = self.__timings.get(stage, (0., 0.))
+        self.__timings[stage] = (previous_wall + wall, previous_cpu + cpu)
+
+        if stage == "evaluation":
+            self.__evaluation_time = int(round(self.__timings[stage][0]))
+            self.__cpu_time = int(round(self.__timings[stage][1]))
+
+    @property
+    def threshold(self) -> float:
+        """Get the fitness the chromosome must beat to be selected
+
+        Returns:
+            float: The threshold, None if the chromosome is not competing with another chromosome
+        """
+        return self.__threshold
+
+    @threshold.setter
+    def threshold(self, value: float):
+        """Set the fitness the chromosome must beat to be selected, a problem may stop evaluating it once it cannot
+
+        Args:
+            value (float): The threshold
+        """
+        self.__threshold = value
+
+    @property
+    def abandoned(self) -> bool:
+        """Get whether the evaluation stopped early because the chromosome could not beat the threshold
+
+        Returns:
+            bool: True if the fitness was derived from part of the evaluation
+        """
+        return self.__abandoned
+
+    @abandoned.setter
+    def abandoned(self, value: bool):
+        """Set whether the evaluation stopped early
+
+        Args:
+            value (bool): The abandoned value
+        """
+        self.__abandoned = value
+
+    @property
+    def fidelity(self) -> float:
+        """Get the fraction of the full evaluation the fitness is derived from e.g. the fraction of the training data
+
+        Returns:
+            float: The fidelity, None represents a full evaluation
+        """
+        return self.__fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: float):
+        """Set the fidelity the chromosome is evaluated at
+
+        Args:
+            value (float): The fidelity
+        """
+        self.__fidelity = value
+
     def clone(self) -> ChromosomeMetaEntity:
+        """Creates the meta of a clone, which descends from this chromosome and is yet to be evaluated
 
-        clone = copy.deepcopy(self)
-        clone.__id = None
-        clone.__parent_id = self.id
-        clone.__evaluation_time = None
-        clone.__evaluated = False
+        Returns:
+            ChromosomeMeta: The meta of the clone
+        """
+        clone = ChromosomeMeta()
+        clone.__parent_id = self.__id
 
-        return clone 
+        return clone
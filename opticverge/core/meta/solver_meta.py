@@ -1,7 +1,6 @@
 import uuid
-from typing import Dict
 
-from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.meta.chromosome_index import ChromosomeIndex
 
 
 class SolverMeta(object):
@@ -17,19 +16,33 @@ class SolverMeta(object):
         self.__chromosome_count = 0
 
         """
-        Tracks the generated chromosomes during the lifecycle of the evolutionary
-        process.
+        Tracks the ids of the evaluated chromosomes during the lifecycle of the
+        evolutionary process.
         """
-        self.__chromosome_tracker: Dict[str, AbstractChromosome] = {}
+        self.__chromosome_index: ChromosomeIndex = ChromosomeIndex()
         
     @property
     def id(self) -> str:
         return self.__id
 
-    @property 
-    def chromosome_tracker(self) -> Dict[str, AbstractChromosome]:
-        return self.__chromosome_tracker
-    
-    @chromosome_tracker.setter
-    def chromosome_tracker(self, chromosome_id: str, chromosome: AbstractChromosome):
-        self.__chromosome_tracker[chromosome_id] = chromosome
+    @id.setter
+    def id(self, value: str):
+        """Set the id of the solver e.g. when it is resumed from a checkpoint
+
+        Args:
+            value (str): The id
+        """
+        self.__id = value
+
+    @property
+    def chromosome_index(self) -> ChromosomeIndex:
+        return self.__chromosome_index
+
+    @chromosome_index.setter
+    def chromosome_index(self, chromosome_index: ChromosomeIndex):
+        """Set the index tracking the evaluated chromosomes e.g. a Bloom filter bounding its memory
+
+        Args:
+            chromosome_index (ChromosomeIndex): The index
+        """
+        self.__chromosome_index = chromosome_index
@@ -54,3 +54,63 @@ def safe_round(value: Any, rounding: int):
         return np.round(value, rounding)
 
     return value
+
+
+def safe_array(
+        values: np.ndarray,
+        min_val: int or float or None,
+        max_val: int or float or None,
+        rounding: int,
+        output_dtype: Any or None) -> np.ndarray:
+    """ The array equivalent of safe_value, ensures that every value exists
+    within the bounds of the minimum and maximum if specified.
+
+    Values outside of both boundaries are wrapped around the range in the same
+    way as the repeated adjustment in safe_value, values outside of a single
+    boundary are reflected about it.
+
+    Args:
+        values: The values to be modified
+        min_val: The lower boundary for the values
+        max_val: The upper boundary for the values
+        rounding: The amount of rounding to apply
+        output_dtype: The output type of the values
+
+    Returns:
+        np.ndarray
+    """
+
+    values = np.asarray(values)
+
+    if min_val is not None and max_val is not None:
+
+        span = max_val - min_val
+
+        outside = (values < min_val) | (values > max_val)
+
+        if np.any(outside):
+
+            if span == 0:
+                values = np.where(outside, min_val, values)
+            else:
+                offset = np.mod(values - min_val, span)
+
+                # values above the upper boundary settle within (min_val, max_val]
+                # whereas values below the lower boundary settle within
+                # [min_val, max_val)
+                wrapped = np.where((values > max_val) & (offset == 0), max_val, min_val + offset)
+
+                values = np.where(outside, wrapped, values)
+
+    elif min_val is not None and max_val is None:
+        values = np.abs(min_val - values) + min_val
+
+    elif min_val is None and max_val is not None:
+        values = max_val - np.abs(values - max_val)
+
+    values = safe_round(values, rounding)
+
+    if output_dtype is not None:
+        values = values.astype(output_dtype)
+
+    return values
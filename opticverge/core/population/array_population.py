@@ -0,0 +1,270 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import xxhash
+
+from opticverge.core.chromosome.array_chromosome import RandArrayChromosome
+from opticverge.core.chromosome.function_chromosome import FunctionChromosome
+from opticverge.core.enum.objective import Objective
+from opticverge.core.generator.bool_generator import rand_uniform_bool, rand_uniform_bool_batch
+from opticverge.core.generator.int_distribution_generator import rand_int, rand_int_batch, rand_poisson, \
+    rand_poisson_batch
+from opticverge.core.generator.real_distribution_generator import rand_gauss, rand_gauss_batch
+from opticverge.core.generator.real_generator import rand_real, rand_real_batch
+from opticverge.core.generator.sampler import get_sampler
+from opticverge.core.strategy.selection import fitness_key
+from opticverge.core.util.encoding import encode_rows
+
+
+class ArrayPopulation(object):
+    """ A population of fixed length array chromosomes stored as a single matrix
+
+    Each row of the matrix represents the genotype of one chromosome and the
+    fitness of each row is held in a separate vector, which allows generation,
+    mutation, bounds handling and selection to be applied to the entire
+    population at once rather than one gene at a time.
+    """
+
+    def __init__(self, chromosome: RandArrayChromosome, objective: Objective):
+        """ The constructor for this class
+
+        Args:
+            chromosome (RandArrayChromosome): The fixed length array chromosome describing every row
+            objective (Objective): Whether the population is maximising or minimising the fitness
+        """
+
+        if not isinstance(chromosome, RandArrayChromosome) or chromosome.fixed is not True:
+            raise TypeError(
+                "Expected a fixed length RandArrayChromosome, received type {}".format(type(chromosome))
+            )
+
+        if not isinstance(chromosome.generator, FunctionChromosome) or \
+                chromosome.generator.function not in _array_samplers():
+            raise TypeError(
+                "The generator {} cannot be sampled as an array".format(type(chromosome.generator))
+            )
+
+        self.__chromosome = chromosome
+        self.__objective = objective
+
+        """
+        The parameters of the generator are fixed at construction so we can
+        extract them once rather than on every sample
+        """
+        self.__parameters: Dict[str, Any] = dict(chromosome.generator.genotype)
+        self.__sampler: Callable = _array_samplers()[chromosome.generator.function]
+
+        """
+        The genes hold one chromosome per row and the fitness holds the
+        fitness of each row, np.nan represents a chromosome that is yet to be
+        evaluated or that failed evaluation.
+        """
+        self.__genes: np.ndarray = self.generate(0)
+        self.__fitness: np.ndarray = np.empty(0, dtype=np.float64)
+
+    @property
+    def chromosome(self) -> RandArrayChromosome:
+        return self.__chromosome
+
+    @property
+    def objective(self) -> Objective:
+        return self.__objective
+
+    @property
+    def length(self) -> int:
+        """Get the number of genes of each chromosome
+
+        Returns:
+            int: The length of each row
+        """
+        return self.__chromosome.length
+
+    @property
+    def genes(self) -> np.ndarray:
+        """Get the genes of the population
+
+        Returns:
+            np.ndarray: A matrix with one chromosome per row
+        """
+        return self.__genes
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """Get the fitness of the population
+
+        Returns:
+            np.ndarray: The fitness of each row of the genes
+        """
+        return self.__fitness
+
+    def __len__(self) -> int:
+        return len(self.__fitness)
+
+    def assign(self, genes: np.ndarray, fitness: np.ndarray):
+        """Replaces the contents of the population
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+            fitness (np.ndarray): The fitness of each row
+        """
+        if len(genes) != len(fitness):
+            raise ValueError(
+                "Expected a fitness for each of the {} rows, received {}".format(len(genes), len(fitness))
+            )
+
+        self.__genes = genes
+        self.__fitness = np.asarray(fitness, dtype=np.float64)
+
+    def extend(self, genes: np.ndarray, fitness: np.ndarray):
+        """Adds chromosomes to the end of the population
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+            fitness (np.ndarray): The fitness of each row
+        """
+        self.assign(np.concatenate((self.__genes, genes)), np.concatenate((self.__fitness, fitness)))
+
+    def truncate(self, size: int):
+        """Removes the chromosomes beyond the size of the population
+
+        Args:
+            size (int): The number of chromosomes to keep
+        """
+        self.assign(self.__genes[:size], self.__fitness[:size])
+
+    def sort(self):
+        """Sorts the population so the best chromosome is the first row, unevaluated chromosomes are placed last
+        """
+        order = np.argsort(fitness_key(self.__fitness, self.__objective), kind="stable")
+        self.assign(self.__genes[order], self.__fitness[order])
+
+    def generate(self, count: int) -> np.ndarray:
+        """Generates new chromosomes using the generator of the array chromosome
+
+        Args:
+            count (int): The number of chromosomes to generate
+
+        Returns:
+            np.ndarray: A matrix with one generated chromosome per row
+        """
+        return self.__sample((count, self.length))
+
+    def mutate(self, genes: np.ndarray, mutation_probabilities: np.ndarray) -> np.ndarray:
+        """ Mutates a copy of each row using the same techniques as RandArrayChromosome.mutate
+
+        1. Each gene is regenerated with the mutation probability of its row
+        2. The positions selected with the mutation probability of the row are
+           shuffled amongst themselves
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+            mutation_probabilities (np.ndarray): The likelihood of change for each row
+
+        Returns:
+            np.ndarray: The mutated matrix
+        """
+        mutated = np.array(genes, copy=True)
+
+        if mutated.size == 0:
+            return mutated
+
+        probabilities = np.asarray(mutation_probabilities, dtype=np.float64)[:, np.newaxis]
+
+        generator: np.random.Generator = get_sampler().generator
+
+        # 1. Attempt to mutate each value
+        regenerate = generator.random(mutated.shape) < probabilities
+        regenerate_count = int(np.count_nonzero(regenerate))
+        if regenerate_count > 0:
+            mutated[regenerate] = self.__sample(regenerate_count)
+
+        # 2. Attempt to swap positions of the array
+        if self.length > 1:
+
+            selected = generator.random(mutated.shape) < probabilities
+            selected_count = np.count_nonzero(selected, axis=1)
+
+            # the selected positions of each row in ascending order and in a
+            # random order, both sit at the front of their row
+            ordered = np.argsort(~selected, axis=1, kind="stable")
+            shuffled = np.argsort(np.where(selected, generator.random(mutated.shape), 2.0), axis=1)
+
+            rows, columns = np.nonzero(np.arange(self.length) < selected_count[:, np.newaxis])
+
+            mutated[rows, ordered[rows, columns]] = mutated[rows, shuffled[rows, columns]]
+
+        return mutated
+
+    def identify(self, genes: np.ndarray) -> List[str]:
+        """Derives an id for each row from the canonical encoding of its genes, equal to the id of the chromosome
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+
+        Returns:
+            List[str]: The id of each row
+        """
+        return [xxhash.xxh64(encoding).hexdigest() for encoding in encode_rows(genes)]
+
+    def to_chromosome(self, index: int) -> RandArrayChromosome:
+        """Materialises a row of the population as a chromosome
+
+        Args:
+            index (int): The row to materialise
+
+        Returns:
+            RandArrayChromosome: The chromosome with the genotype, phenotype and fitness of the row
+        """
+        row = self.__genes[index]
+
+        chromosome: RandArrayChromosome = self.__chromosome.derive(OrderedDict(zip(range(len(row)), row)))
+        chromosome.phenotype = list(chromosome.genotype.values())
+
+        if not np.isnan(self.__fitness[index]):
+            chromosome.fitness = self.__fitness[index]
+
+        return chromosome
+
+    def to_chromosomes(self) -> List[RandArrayChromosome]:
+        """Materialises every row of the population as a chromosome
+
+        Returns:
+            List[RandArrayChromosome]: The chromosomes in the order of the rows
+        """
+        return [self.to_chromosome(i) for i in range(len(self))]
+
+    def view(self, row: np.ndarray, chromosome_id: str = None) -> RandArrayChromosome:
+        """Creates a chromosome whose phenotype is the row without building the genotype
+
+        This is the representation passed to the objective function of a
+        problem that cannot evaluate the matrix at once, building the genotype
+        for every row would reintroduce the per gene overhead the population
+        avoids. The id is derived from the row when it is first read unless
+        it is given, see identify.
+
+        Args:
+            row (np.ndarray): The genes of the chromosome
+            chromosome_id (str, optional): Defaults to None. The id of the row
+
+        Returns:
+            RandArrayChromosome: The chromosome whose phenotype is the row
+        """
+        chromosome: RandArrayChromosome = self.__chromosome.derive(OrderedDict())
+        chromosome.phenotype = row
+        chromosome.meta.id = chromosome_id
+        return chromosome
+
+    def __sample(self, shape: Tuple[int, ...] or int) -> np.ndarray:
+        return self.__sampler(shape, **self.__parameters)
+
+
+def _array_samplers() -> Dict[Callable, Callable]:
+    """ The array equivalent of each generator function keyed by the generator function """
+    return {
+        rand_gauss: rand_gauss_batch,
+        rand_poisson: rand_poisson_batch,
+        rand_int: rand_int_batch,
+        rand_real: rand_real_batch,
+        rand_uniform_bool: rand_uniform_bool_batch
+    }
@@ -1,11 +1,14 @@
 import re
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
-from typing import Any, Dict, TypeVar
+from typing import Any, Dict, List, TypeVar
+
+import numpy as np
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
 from opticverge.core.enum.objective import Objective
 from opticverge.core.solver.abstract_solver import AbstractSolver
+from opticverge.core.util.timer import Timer
 
 AbstractSolverEntity = TypeVar('AbstractSolver')
 
@@ -31,6 +34,19 @@ class AbstractProblem(metaclass=ABCMeta):
         """
         return self.__problem_name
 
+    @property
+    def identity(self) -> str:
+        """Get the identity of the problem, problems that score chromosomes identically share the same identity
+
+        The identity keys the fitness of chromosomes in the FitnessCache,
+        problems whose objective depends on their configuration e.g. the data
+        should include it.
+
+        Returns:
+            str: The problem identity
+        """
+        return self.__problem_name
+
     @property
     def objective(self) -> Objective:
         """Get the objective of the problem
@@ -50,6 +66,91 @@ class AbstractProblem(metaclass=ABCMeta):
         """
         chromosome.meta.evaluated = True
 
+    def evaluate(self, chromosome: AbstractChromosome) -> Any:
+        """Evaluates a chromosome with the objective function, recording the time taken on its meta
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome to measure
+
+        Returns:
+            Any: The output of the objective function
+        """
+        with Timer() as timer:
+            output = self.objective_function(chromosome)
+
+        chromosome.meta.record_time("evaluation", timer.wall, timer.cpu)
+
+        return output
+
+    def objective_function_batch(self, chromosomes: List[AbstractChromosome]):
+        """Evaluates the quality of a list of chromosomes
+
+        The solver evaluates chromosomes through this method, see
+        evaluate_batch, by default each chromosome is passed to the objective
+        function in turn. Problems whose
+        objective can be computed for many chromosomes at once e.g. as a single
+        NumPy operation should override it.
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The chromosomes to measure
+
+        """
+        for chromosome in chromosomes:
+            self.evaluate(chromosome)
+
+    def objective_function_array(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates the quality of a matrix of phenotypes, one per row, at once
+
+        Problems whose objective is vectorised over the phenotypes of fixed
+        length array chromosomes may implement it so that an ArrayAIS
+        evaluates its rows without creating a chromosome for each row, see
+        evaluates_arrays.
+
+        Args:
+            x (np.ndarray): A matrix with the phenotype of one chromosome per row
+
+        Returns:
+            np.ndarray: The fitness of each row
+        """
+        raise NotImplementedError(
+            "You must implement the objective_function_array method for the problem to evaluate arrays"
+        )
+
+    @property
+    def evaluates_arrays(self) -> bool:
+        """Get whether the problem implements objective_function_array
+
+        Returns:
+            bool: True if a matrix of phenotypes can be evaluated at once
+        """
+        return type(self).objective_function_array is not AbstractProblem.objective_function_array
+
+    def evaluate_batch(self, chromosomes: List[AbstractChromosome]):
+        """Evaluates the chromosomes with the batch objective function, recording the time taken on their meta
+
+        The solver evaluates chromosomes through this method. The default
+        objective_function_batch records the time of each chromosome, see
+        evaluate, otherwise e.g. for a vectorised objective each chromosome
+        records an equal share of the time taken by the batch.
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The chromosomes to measure
+        """
+        untimed: List[AbstractChromosome] = [c for c in chromosomes if "evaluation" not in c.meta.timings]
+
+        with Timer() as timer:
+            self.objective_function_batch(chromosomes)
+
+        untimed = [c for c in untimed if "evaluation" not in c.meta.timings]
+
+        for chromosome in untimed:
+            chromosome.meta.record_time("evaluation", timer.wall / len(untimed), timer.cpu / len(untimed))
+
+    def shutdown(self):
+        """Releases any resources held by the problem e.g. worker pools, called by the solver once it has finished
+        """
+        pass
+
     @abstractmethod
     def log_chromosome(self, chromosome: AbstractChromosome, solver: AbstractSolverEntity,
                        additional_data: Dict[str, Any] = None, separator="|") -> str:
@@ -79,6 +180,26 @@ class AbstractProblem(metaclass=ABCMeta):
         if additional_data is not None:
             log_data.update(additional_data)
 
+        # the timings follow every other column so that the existing columns
+        # keep their position
+        log_data.update({
+            "evaluation_time": chromosome.meta.evaluation_time,
+            "cpu_time": chromosome.meta.cpu_time,
+            "timings": _format_timings(chromosome.meta.timings)
+        })
+
         placeholder_string = ["{}" for i in range(len(log_data))]
 
         return separator.join(placeholder_string).format(*log_data.values())
+
+
+def _format_timings(timings: Dict[str, Any]) -> str:
+    """ Formats the timings of a chromosome as stage=wall/cpu in milliseconds e.g. mutation=2.1/1.9
+
+    Args:
+        timings (Dict[str, Any]): The wall clock and CPU time keyed by the stage, see ChromosomeMeta.timings
+
+    Returns:
+        str: The timings separated by spaces
+    """
+    return " ".join("{}={:.1f}/{:.1f}".format(stage, wall, cpu) for stage, (wall, cpu) in timings.items())
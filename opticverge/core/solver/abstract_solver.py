@@ -1,15 +1,24 @@
 import copy
 from abc import ABCMeta, abstractmethod
 from math import ceil
-from typing import Dict, List, TypeVar
+from typing import Any, Callable, Dict, List, TypeVar
+
+import numpy as np
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
 from opticverge.core.enum.objective import Objective
 from opticverge.core.enum.policy import Policy
 # from opticverge.core.problem.abstract_problem import AbstractProblem
+from opticverge.core.generator.sampler import Sampler, activate_sampler, get_sampler
 from opticverge.core.log.logger import application_logger
 from opticverge.core.meta.solver_meta import SolverMeta
+from opticverge.core.strategy.migration import Migration
+from opticverge.core.strategy.selection import elitist_selection
+from opticverge.core.strategy.surrogate import Surrogate
+from opticverge.core.util.checkpoint import Checkpoint
 from opticverge.core.util.exception import reset_signal, signal_ttl, register_signal, TimeoutException
+from opticverge.core.util.fitness_cache import FitnessCache
+from opticverge.core.util.timer import Timer
 
 AbstractProblem = TypeVar('AbstractProblem')
 
@@ -44,6 +53,14 @@ class AbstractSolver(metaclass=ABCMeta):
         self.__duration = duration
         self.__policies = policies or []
         self.__meta = SolverMeta()
+        self.__migration: Migration = None
+        self.__checkpoint: Checkpoint = None
+        self.__fitness_cache: FitnessCache = None
+        self.__surrogate: Surrogate = None
+
+        # the sampler is spawned from the shared sampler when the solver runs
+        # unless one is assigned
+        self.__sampler: Sampler = None
 
     """ GETTERS """
 
@@ -94,6 +111,73 @@ class AbstractSolver(metaclass=ABCMeta):
     def policies(self) -> List[Policy]:
         return self.__policies
 
+    @property
+    def migration(self) -> Migration:
+        return self.__migration
+
+    @migration.setter
+    def migration(self, migration: Migration):
+        """Set the migration exchanging chromosomes with other solvers after each generation
+
+        Args:
+            migration (Migration): The migration
+        """
+        self.__migration = migration
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        return self.__checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, checkpoint: Checkpoint):
+        """Set the checkpoint saving the state of the solver after each generation
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint
+        """
+        self.__checkpoint = checkpoint
+
+    @property
+    def fitness_cache(self) -> FitnessCache:
+        return self.__fitness_cache
+
+    @fitness_cache.setter
+    def fitness_cache(self, fitness_cache: FitnessCache):
+        """Set the cache consulted for the fitness of chromosomes evaluated by earlier runs
+
+        Args:
+            fitness_cache (FitnessCache): The fitness cache
+        """
+        self.__fitness_cache = fitness_cache
+
+    @property
+    def surrogate(self) -> Surrogate:
+        return self.__surrogate
+
+    @surrogate.setter
+    def surrogate(self, surrogate: Surrogate):
+        """Set the surrogate screening the mutated clones before they are evaluated
+
+        Args:
+            surrogate (Surrogate): The surrogate
+        """
+        self.__surrogate = surrogate
+
+    @property
+    def sampler(self) -> Sampler:
+        return self.__sampler
+
+    @sampler.setter
+    def sampler(self, sampler: Sampler):
+        """Set the sampler the solver draws from, the workers of the solver draw from samplers spawned from it
+
+        A seeded sampler makes the evolutionary process reproducible.
+
+        Args:
+            sampler (Sampler): The sampler
+        """
+        self.__sampler = sampler
+
     """ ABSTRACT METHODS """
 
     @abstractmethod
@@ -106,9 +190,46 @@ class AbstractSolver(metaclass=ABCMeta):
         Returns:
             AbstractChromosome: The chromosome with the best fitness 
         """
+        return self.__solve(self.initialise)
+
+    def resume(self, path: str = None) -> AbstractChromosome:
+        """Continues the evolutionary process from a checkpoint without evaluating the population again
+
+        Args:
+            path (str, optional): Defaults to the path of the checkpoint of the solver. The checkpoint to resume from
+
+        Returns:
+            AbstractChromosome: The chromosome with the best fitness
+        """
+        state: Dict[str, Any] = Checkpoint.load(path if path is not None else self.__checkpoint.path)
+
+        return self.__solve(lambda: self.set_state(state))
+
+    def __solve(self, initialise: Callable):
+        """Runs the generations of the evolutionary process once the population is initialised
+
+        Args:
+            initialise (Callable): Creates or restores the population
+
+        Returns:
+            AbstractChromosome: The chromosome with the best fitness
+        """
+
+        if self.__sampler is None:
+            self.__sampler = get_sampler().spawn()[0]
+
+        previous_sampler: Sampler = activate_sampler(self.__sampler)
+
+        # the state is only checkpointed when the run stopped cleanly, and
+        # then only the state of the last completed generation since a timeout
+        # or interrupt may stop the run part way through a generation
+        stopped_cleanly: bool = False
 
         try:
-            self.initialise()
+            initialise()
+
+            if self.__checkpoint is not None:
+                self.__checkpoint.capture(self)
 
             if self.duration is not None:
 
@@ -117,27 +238,42 @@ class AbstractSolver(metaclass=ABCMeta):
                     signal_ttl(self.duration)
 
                     while True:
-                        self.__generation += 1
-                        self.evolve()
+                        self.__next_generation()
 
                 except TimeoutException:
                     reset_signal()
             else:
                 while self.__epochs == -1 or self.generation < self.__epochs:
-                    self.__generation += 1
-                    self.evolve()
+                    self.__next_generation()
+
+            stopped_cleanly = True
         except KeyboardInterrupt:
             application_logger.info(msg="Keyboard interrupt received, exiting simulation")
+            stopped_cleanly = True
         except Exception as ex:
             application_logger.exception(exc_info=ex, msg="Exception occurred whilst attempting to solve the {}".format(
                 self.problem.name))
+        finally:
+            if stopped_cleanly and self.__checkpoint is not None:
+                self.__checkpoint.save_captured()
 
-        self.sort_population()
-        return self.population[0]
+            self.shutdown()
+
+            activate_sampler(previous_sampler)
+
+        return self.best()[0]
 
     def mutate(self):
         self.mutate_population()
 
+    def shutdown(self):
+        """Releases any resources held by the solver and its problem once the evolutionary process has finished
+
+        The fitness cache is supplied by the caller, who may share it with other
+        solvers, so closing it is left to the caller.
+        """
+        self.__problem.shutdown()
+
     @abstractmethod
     def mutate_population(self):
         raise NotImplementedError(
@@ -176,6 +312,17 @@ class AbstractSolver(metaclass=ABCMeta):
 
     def generate_chromosomes(self, count: int = 100) -> List[AbstractChromosome]:
         """Creates a list of chromosomes
+
+        A chromosome whose genotype_factory draws its blueprint e.g. around
+        random centres of the hyperparameters of a regressor is generated one
+        at a time from its own blueprint, see generate_chromosome, so that the
+        chromosomes are as diverse as their blueprints. Any other chromosome
+        has a single blueprint, so the chromosomes are generated in batches
+        from a single copy of the base chromosome, see
+        AbstractChromosome.generate_batch. Each chromosome records an equal
+        share of the time taken to generate its batch.
+
+        Args:
             count (int, optional): Defaults to 100. The number of chromosomes to generate
         
         Returns:
@@ -184,24 +331,38 @@ class AbstractSolver(metaclass=ABCMeta):
 
         chromosomes: Dict[str, AbstractChromosome] = {}
 
+        template: AbstractChromosome = None
+
+        if not _draws_blueprint(self.__chromosome):
+            template = copy.deepcopy(self.__chromosome)
+            template.generate_genotype()
+
         generated_count: int = 0
 
         while generated_count < count:
 
-            chromosome: AbstractChromosome = self.generate_chromosome()
+            with Timer() as timer:
+                if template is None:
+                    batch: List[AbstractChromosome] = [self.generate_chromosome()]
+                else:
+                    batch: List[AbstractChromosome] = template.generate_batch(count - generated_count)
 
-            id: int = generated_count
+            for chromosome in batch:
 
-            if Policy.EnforceUniqueChromosome in self.policies:
+                chromosome.meta.record_time("generation", timer.wall / len(batch), timer.cpu / len(batch))
 
-                id = chromosome.id
+                id: int = generated_count
 
-                if id in chromosomes or id in self.meta.chromosome_tracker:
-                    continue
+                if Policy.EnforceUniqueChromosome in self.policies:
 
-            chromosomes[id] = chromosome
+                    id = chromosome.id
 
-            generated_count += 1
+                    if id in chromosomes or id in self.meta.chromosome_index:
+                        continue
+
+                chromosomes[id] = chromosome
+
+                generated_count += 1
 
         return list(chromosomes.values())
 
@@ -214,24 +375,52 @@ class AbstractSolver(metaclass=ABCMeta):
 
         if chromosome.meta.evaluated is False:
 
-            self.__problem.objective_function(chromosome)
-
-            if Policy.EnforceUniqueChromosome in self.policies:
-                self.__meta.chromosome_tracker[chromosome.id] = chromosome
+            if self.__fitness_cache is not None:
+                self.__fitness_cache.evaluate(self.__problem, [chromosome])
+            else:
+                self.__problem.evaluate(chromosome)
 
-            self.__problem.log_chromosome(chromosome, self)
+            self.record_chromosome(chromosome)
 
     def evaluate_chromosomes(self, chromosomes: List[AbstractChromosome]):
         """Evaluates the list of chromosomes
 
-        The evaluation is synchronous by default given that the evaluation
-        mechanism may utilise multiple threads.
+        The chromosomes that are yet to be evaluated are passed to the problem
+        in a single call so that problems implementing a batch objective
+        function can evaluate them at once.
         
         Args:
             chromosomes (List[AbstractChromosome]): [description]
         """
-        for i, chromosome in enumerate(chromosomes):
-            self.evaluate_chromosome(chromosome)
+        pending: List[AbstractChromosome] = [c for c in chromosomes if c.meta.evaluated is False]
+
+        if len(pending) == 0:
+            return
+
+        if self.__fitness_cache is not None:
+            self.__fitness_cache.evaluate(self.__problem, pending)
+        else:
+            self.__problem.evaluate_batch(pending)
+
+        for chromosome in pending:
+            self.record_chromosome(chromosome)
+
+    def record_chromosome(self, chromosome: AbstractChromosome):
+        """Tracks and logs a chromosome once it has been evaluated
+
+        Args:
+            chromosome (AbstractChromosome): The evaluated chromosome
+        """
+        # an abandoned chromosome e.g. at a lower fidelity was never evaluated
+        # in full, so it may be generated and evaluated again
+        if Policy.EnforceUniqueChromosome in self.policies and not chromosome.meta.abandoned:
+            self.__meta.chromosome_index.add(chromosome.id, chromosome.fitness)
+
+        # only full evaluations are representative of the fitness
+        if self.__surrogate is not None and not chromosome.meta.abandoned:
+            self.__surrogate.observe(chromosome)
+
+        self.__problem.log_chromosome(chromosome, self)
 
     def sort_chromosomes(self, chromosomes: List[AbstractChromosome]):
         """Sorts a list of chromosomes according to the objective function of the problem
@@ -262,10 +451,86 @@ class AbstractSolver(metaclass=ABCMeta):
         """
         self.sort_chromosomes(self.__population)
 
+    def best(self, count: int = 1) -> List[AbstractChromosome]:
+        """Get the fittest chromosomes of the population
+
+        Args:
+            count (int, optional): Defaults to 1. The number of chromosomes
+
+        Returns:
+            List[AbstractChromosome]: At most count chromosomes ordered from the fittest
+        """
+        self.sort_population()
+        return list(self.population[:count])
+
     def evolve(self):
         self.mutate()
         self.replace()
 
+    def immigrate(self, chromosome: AbstractChromosome):
+        """Introduces a chromosome evaluated by another solver
+
+        The chromosome competes with the worst chromosome of the population
+        using the elitist strategy.
+
+        Args:
+            chromosome (AbstractChromosome): The evaluated chromosome
+        """
+        if Policy.EnforceUniqueChromosome in self.policies:
+
+            if chromosome.id in self.__meta.chromosome_index:
+                return
+
+            self.__meta.chromosome_index.add(chromosome.id, chromosome.fitness)
+
+        self.sort_population()
+        self.__population[-1] = elitist_selection(self.__population[-1], [chromosome], self.__problem.objective)
+        self.sort_population()
+
+    def __next_generation(self):
+        """Evolves the population by one generation and migrates chromosomes if the solver is a part of an island model
+        """
+        self.__generation += 1
+        self.evolve()
+
+        if self.__migration is not None:
+            self.__migration.migrate(self)
+
+        if self.__checkpoint is not None:
+            self.__checkpoint.save(self)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the state required to resume the evolutionary process, see Checkpoint
+
+        Returns:
+            Dict[str, Any]: The state of the solver
+        """
+        return {
+            "solver_id": self.__meta.id,
+            "generation": self.__generation,
+            "population": self.__population,
+            "chromosome_index": self.__meta.chromosome_index,
+            "random_state": np.random.get_state(),
+            "sampler": self.__sampler
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restores the state of the solver returned by get_state
+
+        Args:
+            state (Dict[str, Any]): The state of the solver
+        """
+        self.__meta.id = state["solver_id"]
+        self.__generation = state["generation"]
+        self.__population = state["population"]
+        self.__meta.chromosome_index = state["chromosome_index"]
+
+        np.random.set_state(state["random_state"])
+
+        # the restored sampler replaces the sampler activated by the run
+        self.__sampler = state["sampler"]
+        activate_sampler(self.__sampler)
+
     def replace(self, ratio=0.1):
         amount_to_replace = int(ceil(self.__population_size * ratio) + self.__population_size - len(self.__population))
         replacement_count: int = max(1, amount_to_replace)
@@ -277,3 +542,15 @@ class AbstractSolver(metaclass=ABCMeta):
         self.evaluate_chromosomes(new_chromosomes)
 
         self.__population.extend(new_chromosomes)
+
+
+def _draws_blueprint(chromosome: AbstractChromosome) -> bool:
+    """ Whether the chromosome draws a new blueprint each time its genotype is generated, see generate_genotype
+
+    Args:
+        chromosome (AbstractChromosome): The base chromosome of a solver
+
+    Returns:
+        bool: True if the chromosome overrides genotype_factory
+    """
+    return type(chromosome).genotype_factory is not AbstractChromosome.genotype_factory
@@ -0,0 +1,298 @@
+from math import ceil
+from typing import Any, Dict, List, Set
+
+import numpy as np
+
+from opticverge.core.chromosome.array_chromosome import RandArrayChromosome
+from opticverge.core.enum.policy import Policy
+from opticverge.core.population.array_population import ArrayPopulation
+from opticverge.core.solver.generic_ais import AIS, _evaluate, _mutation_probabilities
+from opticverge.core.strategy.selection import elitist_array_selection
+
+
+class ArrayAIS(AIS):
+    """ The Artificial Immune System for fixed length array chromosomes
+
+    The population is held in an ArrayPopulation so that cloning, mutation,
+    bounds handling and selection operate on the whole population at once.
+    The solver is a drop in replacement for the AIS when the chromosome is a
+    fixed length RandArrayChromosome e.g. the Rastrigin, Ackley and OneMax
+    problems.
+    """
+
+    def __init__(self, chromosome: RandArrayChromosome, problem, population_size, epochs, policies, duration=None):
+        """
+
+        Args:
+            chromosome: The fixed length array chromosome this solver is optimising
+            problem: The problem to be solved
+            population_size: The size of the population
+            epochs: The number of generations to run for
+            policies: The policies to abide by during the evolutionary process
+            duration: The length of time in seconds to evolve the chromosomes
+        """
+
+        super(ArrayAIS, self).__init__(
+            chromosome=chromosome,
+            problem=problem,
+            population_size=population_size,
+            epochs=epochs,
+            policies=policies,
+            duration=duration
+        )
+
+        self.__array_population = ArrayPopulation(chromosome, problem.objective)
+
+    @property
+    def array_population(self) -> ArrayPopulation:
+        return self.__array_population
+
+    @property
+    def population(self) -> List[RandArrayChromosome]:
+        """Get the population of chromosomes
+
+        Every row of the array population is materialised on each access, the
+        solver itself only materialises the chromosomes it returns, see best.
+        Use array_population for access without the conversion.
+
+        Returns:
+            List[RandArrayChromosome]: The population of chromosomes
+        """
+        return self.__array_population.to_chromosomes()
+
+    def initialise(self):
+        """Generates, scores and sorts the initial population
+        """
+        genes = self.generate_genes(self.population_size)
+        self.__array_population.assign(genes, self.evaluate_genes(genes))
+        self.sort_population()
+
+    def sort_population(self):
+        """Sorts the population of chromosomes
+        """
+        self.__array_population.sort()
+
+    def best(self, count: int = 1) -> List[RandArrayChromosome]:
+        """Get the fittest chromosomes, materialising only their rows
+
+        Args:
+            count (int, optional): Defaults to 1. The number of chromosomes
+
+        Returns:
+            List[RandArrayChromosome]: At most count chromosomes ordered from the fittest
+        """
+        self.sort_population()
+
+        population = self.__array_population
+
+        return [population.to_chromosome(i) for i in range(min(count, len(population)))]
+
+    def generate_genes(self, count: int) -> np.ndarray:
+        """Generates the genes of a number of chromosomes
+
+        Args:
+            count (int): The number of chromosomes to generate
+
+        Returns:
+            np.ndarray: A matrix with one chromosome per row
+        """
+        genes = self.__array_population.generate(count)
+
+        if Policy.EnforceUniqueChromosome in self.policies:
+
+            genes = genes[self.unique_mask(genes)]
+
+            while len(genes) < count:
+                generated = self.__array_population.generate(count - len(genes))
+                genes = np.concatenate((genes, generated[self.unique_mask(generated, genes)]))
+
+        return genes
+
+    def unique_mask(self, genes: np.ndarray, existing_genes: np.ndarray = None) -> np.ndarray:
+        """Identifies the rows that were not already evaluated and that are not repeated
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+            existing_genes (np.ndarray, optional): Defaults to None. Rows pending evaluation that must not be repeated
+
+        Returns:
+            np.ndarray: True for each row that is unique
+        """
+        pending: Set[str] = set()
+
+        if existing_genes is not None:
+            pending.update(self.__array_population.identify(existing_genes))
+
+        keep = np.zeros(len(genes), dtype=bool)
+
+        for i, identifier in enumerate(self.__array_population.identify(genes)):
+            if identifier in pending or identifier in self.meta.chromosome_index:
+                continue
+
+            pending.add(identifier)
+            keep[i] = True
+
+        return keep
+
+    def evaluate_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Evaluates each row using the objective function of the problem
+
+        A problem that evaluates arrays receives the matrix itself, otherwise
+        e.g. when the fitness cache needs a chromosome for each row the rows
+        are viewed as chromosomes, see ArrayPopulation.view.
+
+        Args:
+            genes (np.ndarray): A matrix with one chromosome per row
+
+        Returns:
+            np.ndarray: The fitness of each row, np.nan where the evaluation did not produce a fitness
+        """
+        unique: bool = Policy.EnforceUniqueChromosome in self.policies
+
+        # the ids are only derived for the index and the fitness cache
+        ids: List[str] = None
+        if len(genes) > 0 and (unique or self.fitness_cache is not None):
+            ids = self.__array_population.identify(genes)
+
+        if len(genes) == 0:
+            fitness = np.empty(0, dtype=np.float64)
+
+        elif self.fitness_cache is None and self.problem.evaluates_arrays:
+            fitness = np.asarray(self.problem.objective_function_array(genes), dtype=np.float64)
+
+        else:
+            chromosomes: List[RandArrayChromosome] = [
+                self.__array_population.view(row, None if ids is None else ids[i]) for i, row in enumerate(genes)
+            ]
+
+            _evaluate(chromosomes, self.problem, self.fitness_cache)
+
+            fitness = np.array(
+                [np.nan if chromosome.fitness is None else chromosome.fitness for chromosome in chromosomes],
+                dtype=np.float64
+            )
+
+        if unique and ids is not None:
+            for identifier, chromosome_fitness in zip(ids, fitness):
+                self.meta.chromosome_index.add(identifier, chromosome_fitness)
+
+        return fitness
+
+    def mutation_probability(self, chromosome: RandArrayChromosome) -> float:
+        """ Extracts the mutation probability of a chromosome from its fitness relative to the array population
+
+        Args:
+            chromosome (RandArrayChromosome): The chromosome
+
+        Returns:
+            float
+        """
+        fitness = np.array([np.nan if chromosome.fitness is None else chromosome.fitness], dtype=np.float64)
+
+        return float(_mutation_probabilities(fitness, self.problem.objective, self.__array_population.fitness)[0])
+
+    def mutation_probabilities(self) -> np.ndarray:
+        """ Extracts the mutation probability of every chromosome from the fitness of the array population
+
+        Returns:
+            np.ndarray
+        """
+        return _mutation_probabilities(self.__array_population.fitness, self.problem.objective)
+
+    def mutate_population(self):
+
+        self.sort_population()
+
+        population = self.__array_population
+
+        # the number of clones generated for each chromosome decreases with
+        # its rank in the population
+        amount_to_generate = np.maximum(np.round(self.population_size / np.arange(1, len(population) + 1)), 1)
+
+        parents = np.repeat(np.arange(len(population)), amount_to_generate.astype(np.int64))
+
+        clones = population.mutate(population.genes[parents], self.mutation_probabilities()[parents])
+
+        if Policy.EnforceUniqueChromosome in self.policies:
+            keep = self.unique_mask(clones)
+            clones, parents = clones[keep], parents[keep]
+
+        clone_fitness = self.evaluate_genes(clones)
+
+        selected = elitist_array_selection(population.fitness, clone_fitness, parents, self.problem.objective)
+
+        improved = selected >= 0
+
+        genes, fitness = population.genes.copy(), population.fitness.copy()
+        genes[improved] = clones[selected[improved]]
+        fitness[improved] = clone_fitness[selected[improved]]
+
+        population.assign(genes, fitness)
+
+    def immigrate(self, chromosome: RandArrayChromosome):
+        """Introduces a chromosome evaluated by another solver, it replaces the worst row if it is at least as good
+
+        Args:
+            chromosome (RandArrayChromosome): The evaluated chromosome
+        """
+        population = self.__array_population
+
+        row = np.asarray(chromosome.phenotype, dtype=population.genes.dtype)[np.newaxis, :]
+
+        fitness = np.array([np.nan if chromosome.fitness is None else chromosome.fitness], dtype=np.float64)
+
+        if Policy.EnforceUniqueChromosome in self.policies:
+
+            if not self.unique_mask(row)[0]:
+                return
+
+            self.meta.chromosome_index.add(population.identify(row)[0], fitness[0])
+
+        self.sort_population()
+
+        if elitist_array_selection(population.fitness[-1:], fitness, np.zeros(1, dtype=np.int64),
+                                   self.problem.objective)[0] == 0:
+            population.truncate(len(population) - 1)
+            population.extend(row, fitness)
+            self.sort_population()
+
+    def replace(self, ratio=0.1):
+        population = self.__array_population
+
+        amount_to_replace = int(ceil(self.population_size * ratio) + self.population_size - len(population))
+        replacement_count: int = max(1, amount_to_replace)
+
+        self.sort_population()
+        population.truncate(max(0, len(population) - replacement_count))
+
+        genes = self.generate_genes(replacement_count)
+
+        population.extend(genes, self.evaluate_genes(genes))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the state required to resume the evolutionary process, the population is saved as arrays
+
+        The state holds the genes and fitness of the population in place of
+        the chromosomes of the population.
+
+        Returns:
+            Dict[str, Any]: The state of the solver
+        """
+        state = super(ArrayAIS, self).get_state()
+        del state["population"]
+        state.update({
+            "genes": self.__array_population.genes,
+            "fitness": self.__array_population.fitness
+        })
+
+        return state
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restores the state of the solver returned by get_state
+
+        Args:
+            state (Dict[str, Any]): The state of the solver
+        """
+        super(ArrayAIS, self).set_state({**state, "population": []})
+
+        self.__array_population.assign(state["genes"], state["fitness"])
@@ -1,22 +1,42 @@
 import concurrent
-from concurrent.futures import Future
-from math import exp
-from typing import List, Dict
+from collections import ChainMap
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List, Dict, TypeVar
 
+import numpy as np
 import psutil
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.enum.objective import Objective
+from opticverge.core.enum.parallelism import Parallelism
 from opticverge.core.enum.policy import Policy
-from opticverge.core.numeric.convert import scale
+from opticverge.core.generator.sampler import Sampler, active_sampler
+from opticverge.core.meta.chromosome_index import ChromosomeIndex
 from opticverge.core.solver.abstract_solver import AbstractSolver
 from opticverge.core.strategy.selection import elitist_selection
+from opticverge.core.strategy.surrogate import Surrogate
+from opticverge.core.util.fitness_cache import FitnessCache
+from opticverge.core.util.timer import Timer
+
+AbstractProblem = TypeVar('AbstractProblem')
+
+"""
+The problem and fitness cache assigned to a worker process when the solver
+uses process based parallelism, they are sent once when the worker starts
+rather than with each task. The problem is a copy taken when the worker
+starts, so changes the solver makes to its problem afterwards are not seen by
+the workers.
+"""
+_worker_problem: AbstractProblem = None
+_worker_fitness_cache: FitnessCache = None
 
 
 class AIS(AbstractSolver):
     """ The Artificial Immune system is an evolutionary search method
 
     """
-    def __init__(self, chromosome, problem, population_size, epochs, policies, duration=None):
+    def __init__(self, chromosome, problem, population_size, epochs, policies, duration=None,
+                 parallelism: Parallelism = Parallelism.Thread, workers: int = None):
         """
 
         Args:
@@ -26,6 +46,9 @@ class AIS(AbstractSolver):
             epochs: The number of generations to run for
             policies: The policies to abide by during the evolutionary process
             duration: The length of time in seconds to evolve the chromosomes
+            parallelism: Defaults to Parallelism.Thread. Whether clones are mutated and evaluated in threads or
+                processes, threads are preferable when the objective function releases the GIL
+            workers: Defaults to the number of cpus. The number of workers mutating and evaluating clones
         """
 
         super(AIS, self).__init__(
@@ -37,11 +60,64 @@ class AIS(AbstractSolver):
             duration=duration
         )
 
+        self.__parallelism = parallelism
+        self.__workers = workers if workers is not None else psutil.cpu_count()
+
+        """
+        The executor is created on first use and lives for the duration of the
+        evolutionary process so workers are not restarted every generation
+        """
+        self.__executor: Executor = None
+
+        """
+        The lowest and highest fitness of the population that the mutation
+        probability of a single chromosome is scaled between, derived on first
+        use and discarded whenever the population changes
+        """
+        self.__fitness_range: np.ndarray = None
+
+    @property
+    def parallelism(self) -> Parallelism:
+        return self.__parallelism
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    @property
+    def executor(self) -> Executor:
+        """Get the executor that mutates and evaluates clones, creating it on first use
+
+        Returns:
+            Executor: A ThreadPoolExecutor or ProcessPoolExecutor depending on the parallelism
+        """
+        if self.__executor is None:
+
+            if self.__parallelism is Parallelism.Process:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__workers,
+                    initializer=_initialise_worker,
+                    initargs=(self.problem, self.fitness_cache)
+                )
+            else:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__workers)
+
+        return self.__executor
+
+    def shutdown(self):
+        """Stops the workers of the executor
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+        super(AIS, self).shutdown()
+
     def run(self) -> AbstractChromosome:
         return super(AIS, self).run()
 
     def mutation_probability(self, chromosome: AbstractChromosome) -> float:
-        """ Extracts the mutation probability for the current chromosome based on its position within the population
+        """ Extracts the mutation probability for the current chromosome based on its fitness relative to the population
 
         Args:
             chromosome:
@@ -49,44 +125,232 @@ class AIS(AbstractSolver):
         Returns:
             float
         """
+        fitness = np.array([np.nan if chromosome.fitness is None else chromosome.fitness], dtype=np.float64)
 
-        self.sort_population()
+        if self.__fitness_range is None:
+            population_fitness: np.ndarray = _fitness_array(self.population)
+            evaluated: np.ndarray = population_fitness[~np.isnan(population_fitness)]
 
-        best_chromosome: AbstractChromosome = self.population[0]
-        worst_chromosome: AbstractChromosome = self.population[-1]
+            self.__fitness_range = np.array([evaluated.min(), evaluated.max()]) if len(evaluated) > 0 else evaluated
 
-        if worst_chromosome is None:
-            for population_chromosome in reversed(self.population):
-                if population_chromosome.fitness is None:
-                    continue
-                worst_chromosome = population_chromosome
-                break
+        return float(_mutation_probabilities(fitness, self.problem.objective, self.__fitness_range)[0])
+
+    def sort_population(self):
+        """Sorts the population of chromosomes, discarding the fitness range as the population may have changed
+        """
+        super(AIS, self).sort_population()
+        self.__fitness_range = None
 
-        return _mutation_probability(chromosome.fitness, best_chromosome.fitness, worst_chromosome.fitness)
+    def replace(self, ratio=0.1):
+        super(AIS, self).replace(ratio)
+        self.__fitness_range = None
+
+    def mutation_probabilities(self) -> np.ndarray:
+        """ Extracts the mutation probability of every chromosome of the population in a single pass
+
+        Returns:
+            np.ndarray: The mutation probability of each chromosome in the order of the population
+        """
+        return _mutation_probabilities(_fitness_array(self.population), self.problem.objective)
 
     def mutate_population(self):
+        """ Mutates and evaluates the clones of every chromosome in the workers of the executor
+
+        With threads each task clones, mutates and evaluates the clones of one
+        chromosome so that both happen in parallel across the population. A
+        worker process would receive a copy of the index of the evaluated
+        chromosomes with every task, so the clones are instead mutated here
+        against the index, as SteadyStateAIS.dispatch does, and only their
+        evaluation is sent to the workers. The results are recorded and
+        selected as each task completes.
+        """
 
         self.sort_population()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=psutil.cpu_count()) as executor:
-            futures: List[Future] = []
-            for i, chromosome in enumerate(self.population):
-                future: Future = executor.submit(
-                    _mutate_chromosome,
-                    chromosome=chromosome,
-                    mutation_probability=self.mutation_probability(chromosome),
-                    amount_to_generate=int(max(round(self.population_size / (i + 1)), 1)),
-                    policies=self.policies,
-                    existing_chromosomes=self.meta.chromosome_tracker
+        mutation_probabilities: np.ndarray = self.mutation_probabilities()
+
+        # each task draws from its own stream so that parallel tasks never
+        # produce the same mutants
+        samplers: List[Sampler] = self.sampler.spawn(len(self.population))
+
+        if self.surrogate is not None:
+            self.surrogate.fit()
+
+        # the clones mutated here that are yet to be recorded in the index
+        pending: Dict[str, AbstractChromosome] = {}
+
+        futures: Dict[Future, int] = {}
+        for i, chromosome in enumerate(self.population):
+            arguments: Dict[str, Any] = dict(
+                chromosome=chromosome,
+                mutation_probability=float(mutation_probabilities[i]),
+                amount_to_generate=int(max(round(self.population_size / (i + 1)), 1)),
+                policies=self.policies,
+                sampler=samplers[i],
+                surrogate=self.surrogate,
+                objective=self.problem.objective
+            )
+
+            if self.__parallelism is Parallelism.Process:
+                mutated_chromosomes: List[AbstractChromosome] = _mutate_clones(
+                    existing_chromosomes=ChainMap(self.meta.chromosome_index, pending),
+                    **arguments
+                )
+
+                pending.update((c.id, c) for c in mutated_chromosomes)
+
+                # the worker evaluates with its own problem and fitness cache
+                future: Future = self.executor.submit(_evaluate, chromosomes=mutated_chromosomes)
+            else:
+                future: Future = self.executor.submit(
+                    _mutate_and_evaluate,
+                    existing_chromosomes=self.meta.chromosome_index,
+                    problem=self.problem,
+                    fitness_cache=self.fitness_cache,
+                    **arguments
                 )
 
-                futures.insert(i, future)
+            futures[future] = i
+
+        for future in concurrent.futures.as_completed(futures):
+            i: int = futures[future]
+            mutated_chromosomes: List[AbstractChromosome] = future.result()
+
+            for mutated_chromosome in mutated_chromosomes:
+                self.record_chromosome(mutated_chromosome)
+
+            # a clone whose evaluation was abandoned e.g. at a lower fidelity
+            # is recorded but does not compete
+            candidates: List[AbstractChromosome] = [c for c in mutated_chromosomes if not c.meta.abandoned]
+
+            self.sort_chromosomes(candidates)
+            self.population[i] = elitist_selection(self.population[i], candidates, self.problem.objective)
+
+        self.__fitness_range = None
+
+
+def _initialise_worker(problem: AbstractProblem, fitness_cache: FitnessCache = None):
+    """ Assigns the problem and fitness cache to a worker process when it starts
+
+    Args:
+        problem: The problem evaluating the clones
+        fitness_cache: Defaults to None. The cache consulted before the problem evaluates the clones
+    """
+    global _worker_problem, _worker_fitness_cache
+    _worker_problem = problem
+    _worker_fitness_cache = fitness_cache
+
+
+def _mutate_and_evaluate(
+        chromosome: AbstractChromosome,
+        mutation_probability: float,
+        amount_to_generate: int,
+        policies: List[Policy] = None,
+        existing_chromosomes: ChromosomeIndex or Dict[str, AbstractChromosome] = None,
+        problem: AbstractProblem = None,
+        fitness_cache: FitnessCache = None,
+        sampler: Sampler = None,
+        surrogate: Surrogate = None,
+        objective: Objective = None) -> List[AbstractChromosome]:
+    """ Generates the mutated clones of a chromosome and evaluates them within the same worker
+
+    Args:
+        chromosome: The chromosome to clone
+        mutation_probability: The likelihood of change
+        amount_to_generate: The number of clones to generate
+        policies: The policies of the solver
+        existing_chromosomes: The ids of the chromosomes that were already evaluated
+        problem: Defaults to the problem of the worker process. The problem evaluating the clones
+        fitness_cache: Defaults to None. The cache consulted before the problem evaluates the clones
+        sampler: Defaults to the sampler of the worker. The sampler the mutations draw from
+        surrogate: Defaults to None. The surrogate selecting the clones that are evaluated
+        objective: Defaults to None. The objective of the problem, required by the surrogate
+
+    Returns:
+        List[AbstractChromosome]: The evaluated clones
+    """
+    mutated_chromosomes: List[AbstractChromosome] = _mutate_clones(
+        chromosome=chromosome,
+        mutation_probability=mutation_probability,
+        amount_to_generate=amount_to_generate,
+        policies=policies,
+        existing_chromosomes=existing_chromosomes,
+        sampler=sampler,
+        surrogate=surrogate,
+        objective=objective
+    )
 
-            for j, future in enumerate(concurrent.futures.as_completed(futures)):
-                mutated_chromosomes: List[AbstractChromosome] = future.result()
-                self.evaluate_chromosomes(mutated_chromosomes)
-                self.sort_chromosomes(mutated_chromosomes)
-                self.population[j] = elitist_selection(self.population[j], mutated_chromosomes, self.problem.objective)
+    return _evaluate(mutated_chromosomes, problem, fitness_cache)
+
+
+def _mutate_clones(
+        chromosome: AbstractChromosome,
+        mutation_probability: float,
+        amount_to_generate: int,
+        policies: List[Policy] = None,
+        existing_chromosomes: ChromosomeIndex or Dict[str, AbstractChromosome] = None,
+        sampler: Sampler = None,
+        surrogate: Surrogate = None,
+        objective: Objective = None) -> List[AbstractChromosome]:
+    """ Generates the mutated clones of a chromosome that are to be evaluated
+
+    Args:
+        chromosome: The chromosome to clone
+        mutation_probability: The likelihood of change
+        amount_to_generate: The number of clones to generate
+        policies: The policies of the solver
+        existing_chromosomes: The ids of the chromosomes that were already evaluated
+        sampler: Defaults to the active sampler. The sampler the mutations draw from
+        surrogate: Defaults to None. The surrogate selecting the clones that are evaluated
+        objective: Defaults to None. The objective of the problem, required by the surrogate
+
+    Returns:
+        List[AbstractChromosome]: The clones, each with the fitness of the chromosome as its threshold
+    """
+    with active_sampler(sampler):
+        mutated_chromosomes: List[AbstractChromosome] = _mutate_chromosome(
+            chromosome=chromosome,
+            mutation_probability=mutation_probability,
+            amount_to_generate=amount_to_generate,
+            policies=policies,
+            existing_chromosomes=existing_chromosomes
+        )
+
+    if surrogate is not None:
+        mutated_chromosomes = surrogate.screen(mutated_chromosomes, objective)
+
+    # the clones compete with the chromosome they were cloned from
+    for mutated_chromosome in mutated_chromosomes:
+        mutated_chromosome.meta.threshold = chromosome.fitness
+
+    return mutated_chromosomes
+
+
+def _evaluate(chromosomes: List[AbstractChromosome], problem: AbstractProblem = None,
+              fitness_cache: FitnessCache = None) -> List[AbstractChromosome]:
+    """ Evaluates chromosomes within a worker
+
+    Args:
+        chromosomes: The chromosomes to evaluate
+        problem: Defaults to the problem and fitness cache of the worker process. The problem evaluating the
+            chromosomes
+        fitness_cache: Defaults to None. The cache consulted before the problem evaluates the chromosomes
+
+    Returns:
+        List[AbstractChromosome]: The evaluated chromosomes
+    """
+    if problem is None:
+        problem, fitness_cache = _worker_problem, _worker_fitness_cache
+
+    if len(chromosomes) == 0:
+        return chromosomes
+
+    if fitness_cache is not None:
+        fitness_cache.evaluate(problem, chromosomes)
+    else:
+        problem.evaluate_batch(chromosomes)
+
+    return chromosomes
 
 
 def _mutate_chromosome(
@@ -95,7 +359,7 @@ def _mutate_chromosome(
         amount_to_generate: int,
         policies: List[Policy] = None,
         attempts: int = 10000,
-        existing_chromosomes: Dict[str, AbstractChromosome] = None) -> List[AbstractChromosome]:
+        existing_chromosomes: ChromosomeIndex or Dict[str, AbstractChromosome] = None) -> List[AbstractChromosome]:
     """ This function is not a part of the Solver class as we do not want to serialize the entire class
 
     Args:
@@ -118,9 +382,12 @@ def _mutate_chromosome(
 
             attempts -= 1
 
-        clone: AbstractChromosome = chromosome.clone()
+        with Timer() as timer:
+            clone: AbstractChromosome = chromosome.clone()
 
-        clone.mutate(mutation_probability)
+            clone.mutate(mutation_probability)
+
+        clone.meta.record_time("mutation", timer.wall, timer.cpu)
 
         if Policy.EnforceUniqueChromosome in policies:
 
@@ -140,11 +407,46 @@ def _mutate_chromosome(
     return list(mutated_chromosomes.values())
 
 
-def _mutation_probability(chromosome_fitness: int or float, best_chromosome_fitness: int or float,
-                          worst_chromosome_fitness: int or float):
-    scaled_fitness: float = 0.5
+def _fitness_array(chromosomes: List[AbstractChromosome]) -> np.ndarray:
+    """ Collects the fitness of the chromosomes, np.nan represents a chromosome without a fitness
+
+    Args:
+        chromosomes: The chromosomes
+
+    Returns:
+        np.ndarray
+    """
+    return np.array([np.nan if c.fitness is None else c.fitness for c in chromosomes], dtype=np.float64)
+
+
+def _mutation_probabilities(fitness: np.ndarray, objective: Objective, population_fitness: np.ndarray = None):
+    """ Scales the fitness between the worst and best fitness of the population and maps it to a mutation probability
+
+    The best chromosome mutates least, a chromosome without a fitness or a
+    population whose chromosomes share the same fitness is given the midpoint.
+    The population does not need to be sorted.
+
+    Args:
+        fitness: The fitness of the chromosomes to mutate
+        objective: Whether the problem is maximising or minimising the fitness
+        population_fitness: Defaults to the fitness. The fitness of the population providing the best and worst
+
+    Returns:
+        np.ndarray
+    """
+    population_fitness = fitness if population_fitness is None else population_fitness
+
+    scaled_fitness = np.full(len(fitness), 0.5)
+
+    evaluated = population_fitness[~np.isnan(population_fitness)]
+
+    if len(evaluated) > 0:
+        lowest, highest = evaluated.min(), evaluated.max()
+
+        best_fitness, worst_fitness = (lowest, highest) if objective is Objective.Minimisation else (highest, lowest)
 
-    if best_chromosome_fitness is not None and worst_chromosome_fitness is not None and chromosome_fitness is not None:
-        scaled_fitness = scale(chromosome_fitness, worst_chromosome_fitness, best_chromosome_fitness, 0., 1.)
+        if best_fitness != worst_fitness:
+            scaled = (fitness - worst_fitness) / (best_fitness - worst_fitness)
+            scaled_fitness = np.where(np.isnan(fitness), 0.5, scaled)
 
-    return exp(-2.5 * scaled_fitness)
+    return np.exp(-2.5 * scaled_fitness)
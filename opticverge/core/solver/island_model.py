@@ -0,0 +1,173 @@
+import multiprocessing
+from functools import reduce
+from multiprocessing import Process, Queue
+from queue import Empty
+from typing import Any, Dict, List, Tuple, Type
+
+import numpy as np
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.globals import DEFAULT_NUM_JOBS, INT32_MAX
+from opticverge.core.generator.sampler import Sampler
+from opticverge.core.log.logger import application_logger
+from opticverge.core.solver.abstract_solver import AbstractSolver
+from opticverge.core.solver.generic_ais import AIS
+from opticverge.core.strategy.migration import Migration
+from opticverge.core.strategy.selection import elitist_selection
+
+
+class IslandModel(object):
+    """ Evolves several populations of the same problem in separate processes
+
+    Each island runs its own solver e.g. an AIS and every migration_interval
+    generations sends its best chromosomes to the next island in a ring, see
+    Migration. Islands share nothing else, so cheap objectives scale across
+    cores that a single solver cannot saturate.
+    """
+
+    def __init__(self,
+                 solver_class: Type[AbstractSolver] = AIS,
+                 islands: int = None,
+                 migration_interval: int = 10,
+                 migration_size: int = 2,
+                 seed: int = None,
+                 **kwargs):
+        """ The constructor for this class
+
+        Args:
+            solver_class (Type[AbstractSolver], optional): Defaults to AIS. The solver evolving each island
+            islands (int, optional): Defaults to DEFAULT_NUM_JOBS. The number of islands
+            migration_interval (int, optional): Defaults to 10. The number of generations between migrations
+            migration_size (int, optional): Defaults to 2. The number of chromosomes sent on each migration
+            seed (int, optional): Defaults to None. The seed every island derives its own stream of samples from, None
+                draws fresh entropy from the operating system
+            **kwargs: The arguments passed to the constructor of the solver of each island e.g. chromosome, problem,
+                population_size, epochs, policies and duration
+        """
+        self.__solver_class = solver_class
+        self.__islands = islands if islands is not None else DEFAULT_NUM_JOBS
+        self.__migration_interval = migration_interval
+        self.__migration_size = migration_size
+        self.__seed = seed
+        self.__solver_kwargs: Dict[str, Any] = kwargs
+
+        self.__results: List[AbstractChromosome] = []
+
+    @property
+    def islands(self) -> int:
+        return self.__islands
+
+    @property
+    def results(self) -> List[AbstractChromosome]:
+        """Get the best chromosome of each island once the model has run
+
+        Returns:
+            List[AbstractChromosome]: The best chromosome of each island in the order of the islands
+        """
+        return self.__results
+
+    def run(self) -> AbstractChromosome:
+        """Runs every island until its solver finishes
+
+        Returns:
+            AbstractChromosome: The best chromosome across the islands
+        """
+        channels: List[Queue] = [Queue() for _ in range(self.__islands)]
+        results: Queue = Queue()
+
+        # every island requires its own stream of samples otherwise forked
+        # islands evolve identically
+        samplers: List[Sampler] = Sampler(self.__seed).spawn(self.__islands)
+
+        processes: List[Process] = []
+
+        for i in range(self.__islands):
+            process = Process(
+                target=_run_island,
+                kwargs=dict(
+                    index=i,
+                    solver_class=self.__solver_class,
+                    solver_kwargs=self.__solver_kwargs,
+                    inbound=channels[i],
+                    outbound=channels[(i + 1) % self.__islands],
+                    migration_interval=self.__migration_interval,
+                    migration_size=self.__migration_size,
+                    sampler=samplers[i],
+                    results=results
+                )
+            )
+            process.start()
+            processes.append(process)
+
+        island_results: List[Tuple[int, AbstractChromosome]] = []
+
+        while len(island_results) < self.__islands:
+            try:
+                island_results.append(results.get(timeout=1))
+            except Empty:
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    application_logger.error("IslandModel-run: islands stopped without reporting their result")
+                    break
+
+        for process in processes:
+            process.join()
+
+        island_results.sort(key=lambda result: result[0])
+
+        self.__results = [chromosome for _, chromosome in island_results if chromosome is not None]
+
+        if len(self.__results) == 0:
+            return None
+
+        objective = self.__solver_kwargs["problem"].objective
+
+        return reduce(lambda best, chromosome: elitist_selection(best, [chromosome], objective), self.__results)
+
+
+def _run_island(index: int,
+                solver_class: Type[AbstractSolver],
+                solver_kwargs: Dict[str, Any],
+                inbound: Queue,
+                outbound: Queue,
+                migration_interval: int,
+                migration_size: int,
+                sampler: Sampler,
+                results: Queue):
+    """ Runs the solver of a single island within its own process
+
+    Args:
+        index: The index of the island
+        solver_class: The solver evolving the island
+        solver_kwargs: The arguments passed to the constructor of the solver
+        inbound: The queue receiving chromosomes from the previous island
+        outbound: The queue sending chromosomes to the next island
+        migration_interval: The number of generations between migrations
+        migration_size: The number of chromosomes sent on each migration
+        sampler: The sampler of the island
+        results: The queue receiving the best chromosome of the island
+    """
+    best_chromosome: AbstractChromosome = None
+
+    try:
+        # the global random state remains in use by third party code e.g. the
+        # learners of a problem
+        np.random.seed(sampler.generator.integers(INT32_MAX))
+
+        solver: AbstractSolver = solver_class(**solver_kwargs)
+        solver.sampler = sampler
+        solver.migration = Migration(inbound, outbound, migration_interval, migration_size)
+
+        best_chromosome = solver.run()
+
+    except Exception as ex:
+        application_logger.exception(
+            exc_info=ex,
+            msg="IslandModel-_run_island: Exception occurred on island {} of process {}".format(
+                index, multiprocessing.current_process().name)
+        )
+
+    # the next island may have finished already, in which case the chromosomes
+    # remaining in the queue are discarded rather than blocking the exit
+    outbound.cancel_join_thread()
+
+    results.put((index, best_chromosome))
@@ -0,0 +1,188 @@
+import concurrent
+import math
+from collections import ChainMap
+from concurrent.futures import Future
+from typing import Dict, List
+
+import numpy as np
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.enum.parallelism import Parallelism
+from opticverge.core.generator.real_generator import rand_real
+from opticverge.core.generator.sampler import get_sampler
+from opticverge.core.solver.generic_ais import AIS, _evaluate, _mutate_chromosome
+from opticverge.core.strategy.selection import elitist_selection
+
+
+class SteadyStateAIS(AIS):
+    """ The asynchronous steady state variant of the Artificial Immune System
+
+    Rather than waiting for every clone of a generation before selecting, each
+    completed evaluation immediately competes for its place in the population
+    and a new candidate is dispatched to the idle worker. Evaluations of very
+    different durations therefore never leave workers waiting on the slowest
+    evaluation of a generation.
+
+    A generation is counted for every population_size completed evaluations.
+    """
+
+    def __init__(self, chromosome, problem, population_size, epochs, policies, duration=None,
+                 parallelism: Parallelism = Parallelism.Thread, workers: int = None, replacement_ratio: float = 0.1):
+        """
+
+        Args:
+            chromosome: The chromosome this solver is optimising
+            problem: The problem to be solved
+            population_size: The size of the population
+            epochs: The number of generations to run for
+            policies: The policies to abide by during the evolutionary process
+            duration: The length of time in seconds to evolve the chromosomes
+            parallelism: Defaults to Parallelism.Thread. Whether candidates are evaluated in threads or processes
+            workers: Defaults to the number of cpus. The number of candidates evaluated at the same time
+            replacement_ratio: Defaults to 0.1. The likelihood that a new candidate is generated rather than mutated
+        """
+
+        super(SteadyStateAIS, self).__init__(
+            chromosome=chromosome,
+            problem=problem,
+            population_size=population_size,
+            epochs=epochs,
+            policies=policies,
+            duration=duration,
+            parallelism=parallelism,
+            workers=workers
+        )
+
+        self.__replacement_ratio = replacement_ratio
+
+        """
+        The candidates being evaluated keyed by their future, the futures
+        persist between generations so there is never a barrier
+        """
+        self.__futures: Dict[Future, str] = {}
+        self.__pending: Dict[str, AbstractChromosome] = {}
+
+    def evolve(self):
+        """ Integrates a generation worth of completed evaluations, keeping every worker busy throughout
+        """
+        completed: int = 0
+
+        # the population is kept sorted from here on, integrate sorts it
+        # whenever a candidate replaces a chromosome
+        self.sort_population()
+
+        if self.surrogate is not None:
+            self.surrogate.fit()
+
+        while completed < self.population_size:
+
+            while len(self.__futures) < self.workers:
+                self.dispatch()
+
+            done, _ = concurrent.futures.wait(self.__futures, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                self.__pending.pop(self.__futures.pop(future), None)
+
+                for chromosome in future.result():
+                    self.integrate(chromosome)
+
+                completed += 1
+
+    def mutate_population(self):
+        # the population is mutated one candidate at a time by dispatch
+        pass
+
+    def dispatch(self):
+        """ Submits a new candidate for evaluation
+
+        The candidate is a mutated clone of a chromosome selected with a
+        likelihood that decreases with its rank, mirroring the number of clones
+        of each chromosome in the AIS, or with the replacement ratio a newly
+        generated chromosome. With a surrogate several clones are mutated and
+        the clone with the best predicted fitness is dispatched.
+        """
+        chromosome: AbstractChromosome = None
+
+        if rand_real() >= self.__replacement_ratio:
+
+            weights = 1. / np.arange(1, len(self.population) + 1)
+            parent: AbstractChromosome = self.population[
+                get_sampler().generator.choice(len(weights), p=weights / weights.sum())
+            ]
+
+            mutated_chromosomes: List[AbstractChromosome] = _mutate_chromosome(
+                chromosome=parent,
+                mutation_probability=self.mutation_probability(parent),
+                amount_to_generate=1 if self.surrogate is None else int(math.ceil(1 / self.surrogate.ratio)),
+                policies=self.policies,
+                existing_chromosomes=ChainMap(self.meta.chromosome_index, self.__pending)
+            )
+
+            if self.surrogate is not None:
+                mutated_chromosomes = self.surrogate.screen(mutated_chromosomes, self.problem.objective)[:1]
+
+            if len(mutated_chromosomes) > 0:
+                chromosome = mutated_chromosomes[0]
+                chromosome.meta.threshold = parent.fitness
+
+        if chromosome is None:
+            chromosome = self.generate_chromosomes(1)[0]
+
+        if self.parallelism is Parallelism.Process:
+            # the worker evaluates with its own problem and fitness cache
+            future: Future = self.executor.submit(_evaluate, chromosomes=[chromosome])
+        else:
+            future: Future = self.executor.submit(
+                _evaluate,
+                chromosomes=[chromosome],
+                problem=self.problem,
+                fitness_cache=self.fitness_cache
+            )
+
+        self.__futures[future] = chromosome.id
+        self.__pending[chromosome.id] = chromosome
+
+    def integrate(self, chromosome: AbstractChromosome):
+        """ Records an evaluated candidate and selects between it and the chromosome it competes with
+
+        A mutated clone competes with its parent if the parent is still in the
+        population, otherwise the candidate competes with the worst chromosome.
+        A candidate whose evaluation was abandoned does not compete.
+
+        Args:
+            chromosome (AbstractChromosome): The evaluated candidate
+        """
+        self.record_chromosome(chromosome)
+
+        if chromosome.meta.abandoned:
+            return
+
+        population: List[AbstractChromosome] = self.population
+
+        index: int = len(population) - 1
+
+        if chromosome.meta.parent_id is not None:
+            for i, population_chromosome in enumerate(population):
+                if population_chromosome.meta.id == chromosome.meta.parent_id:
+                    index = i
+                    break
+
+        if elitist_selection(population[index], [chromosome], self.problem.objective) is chromosome:
+            population[index] = chromosome
+            self.sort_population()
+
+    def replace(self, ratio=0.1):
+        # new chromosomes are introduced by dispatch with the replacement ratio
+        pass
+
+    def shutdown(self):
+        """Cancels the candidates waiting to be evaluated and stops the workers
+        """
+        for future in self.__futures:
+            future.cancel()
+
+        self.__futures.clear()
+        self.__pending.clear()
+
+        super(SteadyStateAIS, self).shutdown()
@@ -0,0 +1,71 @@
+from multiprocessing import Queue
+from queue import Empty
+from typing import List, TypeVar
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+
+AbstractSolver = TypeVar('AbstractSolver')
+
+
+class Migration(object):
+    """ Exchanges the best chromosomes of a solver with other solvers through a pair of queues
+
+    Migration is asynchronous, the emigrants are sent without waiting and any
+    immigrants that have arrived since the last migration are received, so a
+    slower solver never holds up a faster one.
+    """
+
+    def __init__(self, inbound: Queue, outbound: Queue, interval: int = 10, size: int = 2):
+        """ The constructor for this class
+
+        Args:
+            inbound (Queue): The queue receiving chromosomes from another solver
+            outbound (Queue): The queue sending chromosomes to another solver
+            interval (int, optional): Defaults to 10. The number of generations between migrations
+            size (int, optional): Defaults to 2. The number of chromosomes sent on each migration
+        """
+        self.__inbound = inbound
+        self.__outbound = outbound
+        self.__interval = interval
+        self.__size = size
+
+    @property
+    def interval(self) -> int:
+        return self.__interval
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def migrate(self, solver: AbstractSolver):
+        """ Sends the best chromosomes of the solver and integrates the chromosomes received from other solvers
+
+        Each immigrant competes with the worst chromosome of the population,
+        see AbstractSolver.immigrate.
+
+        Args:
+            solver (AbstractSolver): The solver whose population is exchanged
+        """
+        if solver.generation % self.__interval != 0:
+            return
+
+        self.__outbound.put(solver.best(self.__size))
+
+        for immigrant in self.receive():
+            solver.immigrate(immigrant)
+
+    def receive(self) -> List[AbstractChromosome]:
+        """ Retrieves every chromosome that has arrived without waiting
+
+        Returns:
+            List[AbstractChromosome]: The immigrants
+        """
+        immigrants: List[AbstractChromosome] = []
+
+        while True:
+            try:
+                immigrants.extend(self.__inbound.get_nowait())
+            except Empty:
+                break
+
+        return immigrants
@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
 from opticverge.core.enum.objective import Objective
 
@@ -39,3 +41,68 @@ def elitist_selection(chromosome: AbstractChromosome, mutated_chromosomes: List[
             return best_chromosome
 
     return chromosome
+
+
+def fitness_key(fitness: np.ndarray, objective: Objective) -> np.ndarray:
+    """ Converts an array of fitness values to ascending sort keys where the best fitness comes first
+
+    Args:
+        fitness (np.ndarray): The fitness values, np.nan represents an unevaluated or failed chromosome
+        objective (Objective): The objective of the problem
+
+    Returns:
+        np.ndarray: The sort keys with np.inf in place of np.nan
+    """
+    key = np.array(fitness, dtype=np.float64)
+
+    if objective is Objective.Maximisation:
+        key = -key
+
+    key[np.isnan(key)] = np.inf
+
+    return key
+
+
+def elitist_array_selection(fitness: np.ndarray, mutated_fitness: np.ndarray, parents: np.ndarray,
+                            objective: Objective) -> np.ndarray:
+    """ Selects chromosomes using the elitist strategy over arrays of fitness values
+
+    This is the array equivalent of elitist_selection where the mutated
+    chromosomes of every parent are selected at once.
+
+    Args:
+        fitness (np.ndarray): The fitness of each source chromosome
+        mutated_fitness (np.ndarray): The fitness of each mutated chromosome
+        parents (np.ndarray): The index of the source chromosome for each mutated chromosome
+        objective (Objective): The objective of the problem
+
+    Returns:
+        np.ndarray: For each source chromosome the index of the selected mutated chromosome or -1 to keep the source
+    """
+    selected = np.full(len(fitness), -1, dtype=np.int64)
+
+    if len(mutated_fitness) == 0:
+        return selected
+
+    mutated_key = fitness_key(mutated_fitness, objective)
+
+    # order by parent and then by fitness so that the first mutated chromosome
+    # of each parent is its best
+    order = np.lexsort((mutated_key, parents))
+    ordered_parents = parents[order]
+
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ordered_parents[1:] != ordered_parents[:-1]
+
+    best = order[first]
+    best_parents = parents[best]
+
+    key = fitness_key(fitness, objective)
+
+    # the mutated chromosome must be evaluated and at least as good as the
+    # source chromosome
+    improved = np.isfinite(mutated_key[best]) & (mutated_key[best] <= key[best_parents])
+
+    selected[best_parents[improved]] = best[improved]
+
+    return selected
@@ -0,0 +1,214 @@
+import math
+from functools import lru_cache
+from numbers import Number
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import xxhash
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.enum.objective import Objective
+from opticverge.core.strategy.selection import fitness_key
+
+
+class Surrogate(object):
+    """ Predicts the fitness of chromosomes from the evaluated chromosomes they resemble
+
+    The surrogate is a k nearest neighbours regressor over a fixed number of
+    features of the genotype, see _features, that screens the mutated clones
+    of a chromosome so that only the clones predicted to be the best are
+    evaluated by the problem. It is worthwhile when an evaluation takes far
+    longer than predicting the fitness of the clones.
+
+    The solver observes every evaluated chromosome and fits the surrogate
+    once per generation, screening only reads the fitted arrays so that
+    threads may screen whilst further chromosomes are observed.
+    """
+
+    def __init__(self, ratio: float = 0.25, neighbours: int = 5, min_observations: int = 20,
+                 capacity: int = 1024, dimensions: int = 64):
+        """ The constructor for this class
+
+        Args:
+            ratio (float, optional): Defaults to 0.25. The fraction of the clones of a chromosome that are evaluated
+            neighbours (int, optional): Defaults to 5. The number of evaluated chromosomes each prediction is derived
+                from
+            min_observations (int, optional): Defaults to 20. The number of evaluated chromosomes required before the
+                clones are screened
+            capacity (int, optional): Defaults to 1024. The number of most recently evaluated chromosomes retained
+            dimensions (int, optional): Defaults to 64. The number of features the genotype is hashed into
+        """
+        self.__ratio = ratio
+        self.__neighbours = neighbours
+        self.__min_observations = min_observations
+        self.__capacity = capacity
+        self.__dimensions = dimensions
+
+        """
+        The features and fitness of the observed chromosomes, the oldest
+        observation is replaced once the capacity is reached
+        """
+        self.__observed_x: List[np.ndarray] = []
+        self.__observed_y: List[float] = []
+        self.__next: int = 0
+
+        """
+        The scaled features and fitness of the observations at the time the
+        surrogate was last fitted
+        """
+        self.__x: np.ndarray = None
+        self.__y: np.ndarray = None
+        self.__scale: np.ndarray = None
+
+        # the squared norm of each row of the scaled features, see predict
+        self.__norms: np.ndarray = None
+
+    def __getstate__(self):
+        # a worker process only screens, so only the fitted arrays are sent
+        state = self.__dict__.copy()
+        state["_Surrogate__observed_x"] = []
+        state["_Surrogate__observed_y"] = []
+        return state
+
+    @property
+    def ratio(self) -> float:
+        return self.__ratio
+
+    @property
+    def fitted(self) -> bool:
+        """Get whether the surrogate holds enough observations to screen chromosomes
+
+        Returns:
+            bool: True if the surrogate was fitted with at least min_observations chromosomes
+        """
+        return self.__y is not None
+
+    def observe(self, chromosome: AbstractChromosome):
+        """Retains the features and fitness of an evaluated chromosome for the next fit
+
+        Args:
+            chromosome (AbstractChromosome): The evaluated chromosome
+        """
+        if chromosome.fitness is None or np.isnan(chromosome.fitness):
+            return
+
+        features: np.ndarray = _features(chromosome.genotype, self.__dimensions)
+
+        if len(self.__observed_y) < self.__capacity:
+            self.__observed_x.append(features)
+            self.__observed_y.append(float(chromosome.fitness))
+        else:
+            self.__observed_x[self.__next] = features
+            self.__observed_y[self.__next] = float(chromosome.fitness)
+            self.__next = (self.__next + 1) % self.__capacity
+
+    def fit(self):
+        """Builds the arrays predictions are derived from out of the observations so far
+        """
+        if len(self.__observed_y) < self.__min_observations:
+            return
+
+        x: np.ndarray = np.array(self.__observed_x, dtype=np.float64)
+
+        # every feature contributes to the distance in proportion to its range
+        scale: np.ndarray = x.max(axis=0) - x.min(axis=0)
+        scale[scale == 0] = 1.0
+
+        self.__scale = scale
+        self.__x = x / scale
+        self.__norms = np.einsum("ij,ij->i", self.__x, self.__x)
+        self.__y = np.array(self.__observed_y, dtype=np.float64)
+
+    def predict(self, chromosomes: List[AbstractChromosome]) -> np.ndarray:
+        """Predicts the fitness of the chromosomes with the inverse distance weighted mean of their neighbours
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The chromosomes
+
+        Returns:
+            np.ndarray: The predicted fitness of each chromosome, np.nan if the surrogate is not fitted
+        """
+        if not self.fitted:
+            return np.full(len(chromosomes), np.nan)
+
+        x: np.ndarray = np.array([_features(c.genotype, self.__dimensions) for c in chromosomes]) / self.__scale
+
+        # |a - b|^2 = |a|^2 + |b|^2 - 2a.b keeps the memory to one distance
+        # per pair rather than one difference per pair and feature, rounding
+        # may leave the square of equal features slightly negative
+        squared: np.ndarray = np.einsum("ij,ij->i", x, x)[:, np.newaxis] + self.__norms - 2.0 * (x @ self.__x.T)
+        distances: np.ndarray = np.sqrt(np.maximum(squared, 0.0))
+
+        k: int = min(self.__neighbours, len(self.__y))
+        nearest: np.ndarray = np.argpartition(distances, k - 1, axis=1)[:, :k]
+
+        nearest_distances: np.ndarray = np.take_along_axis(distances, nearest, axis=1)
+        weights: np.ndarray = 1.0 / np.maximum(nearest_distances, 1e-12)
+
+        return (weights * self.__y[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+    def screen(self, chromosomes: List[AbstractChromosome], objective: Objective) -> List[AbstractChromosome]:
+        """Selects the fraction of the chromosomes with the best predicted fitness
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The candidates e.g. the mutated clones of a chromosome
+            objective (Objective): Whether the problem is maximising or minimising the fitness
+
+        Returns:
+            List[AbstractChromosome]: At least one of the chromosomes, every chromosome if the surrogate is not fitted
+        """
+        if not self.fitted or len(chromosomes) < 2:
+            return chromosomes
+
+        count: int = max(1, int(math.ceil(len(chromosomes) * self.__ratio)))
+
+        order: np.ndarray = np.argsort(fitness_key(self.predict(chromosomes), objective), kind="stable")
+
+        return [chromosomes[i] for i in order[:count]]
+
+
+def _features(genotype: Dict[str, Any], dimensions: int) -> np.ndarray:
+    """ Hashes the genotype into a fixed number of features
+
+    Numeric values are assigned to the feature of their path in the genotype
+    and any other value e.g. a string is one hot encoded as the feature of its
+    path and value. Nested genotypes, arrays and estimators are flattened.
+
+    Args:
+        genotype (Dict[str, Any]): The genotype
+        dimensions (int): The number of features
+
+    Returns:
+        np.ndarray: The features
+    """
+    features: np.ndarray = np.zeros(dimensions, dtype=np.float64)
+
+    for name, value in _flatten(genotype, ""):
+        features[_feature_index(name, dimensions)] += value
+
+    return features
+
+
+@lru_cache(maxsize=65536)
+def _feature_index(name: str, dimensions: int) -> int:
+    # hashing the name is comparatively expensive and the names repeat for
+    # every chromosome, the cache is bounded as the names of one hot encoded
+    # values are not
+    return xxhash.xxh32(name.encode()).intdigest() % dimensions
+
+
+def _flatten(value: Any, path: str) -> List[Tuple[str, float]]:
+    if isinstance(value, dict):
+        return [item for key, nested in value.items() for item in _flatten(nested, "{}.{}".format(path, key))]
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [item for i, nested in enumerate(value) for item in _flatten(nested, "{}[{}]".format(path, i))]
+
+    if isinstance(value, (Number, np.number, np.bool_)) and not isinstance(value, complex):
+        value = float(value)
+        return [(path, 0.0 if np.isnan(value) or np.isinf(value) else value)]
+
+    if hasattr(value, "get_params"):
+        return [("{}={}".format(path, type(value).__name__), 1.0)] + _flatten(value.get_params(deep=False), path)
+
+    return [("{}={!r}".format(path, value), 1.0)]
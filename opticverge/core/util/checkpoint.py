@@ -0,0 +1,95 @@
+import gzip
+import os
+import pickle
+from typing import Any, Dict, TypeVar
+
+AbstractSolver = TypeVar('AbstractSolver')
+
+
+class Checkpoint(object):
+    """ Periodically saves the state of a solver so that an interrupted run can be resumed
+
+    The state returned by AbstractSolver.get_state is pickled and compressed
+    into a single file, which is replaced atomically so that a crash whilst
+    saving never corrupts the previous checkpoint.
+
+    The state of every completed generation is also kept in memory, so a run
+    interrupted part way through a generation saves the last generation it
+    completed rather than a partially updated population, see save_captured.
+    """
+
+    def __init__(self, path: str, interval: int = 10, compression_level: int = 1):
+        """ The constructor for this class
+
+        Args:
+            path (str): The file the checkpoint is written to
+            interval (int, optional): Defaults to 10. The number of generations between checkpoints
+            compression_level (int, optional): Defaults to 1. The gzip compression level from 0 to 9
+        """
+        self.__path = path
+        self.__interval = interval
+        self.__compression_level = compression_level
+
+        # the pickled state of the last completed generation, None until the
+        # state of a solver is captured
+        self.__captured: bytes = None
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def interval(self) -> int:
+        return self.__interval
+
+    def capture(self, solver: AbstractSolver):
+        """Keeps the state of a solver whose generation has completed in memory, see save_captured
+
+        Args:
+            solver (AbstractSolver): The solver to checkpoint
+        """
+        self.__captured = pickle.dumps(solver.get_state(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def save(self, solver: AbstractSolver, force: bool = False):
+        """Captures the state of the solver once its generation completes, saving it when the generation falls on the
+        interval
+
+        Args:
+            solver (AbstractSolver): The solver to checkpoint
+            force (bool, optional): Defaults to False. Saves the state regardless of the interval
+        """
+        self.capture(solver)
+
+        if force or solver.generation % self.__interval == 0:
+            self.save_captured()
+
+    def save_captured(self):
+        """Saves the state of the last completed generation, if any was captured
+        """
+        if self.__captured is None:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.__path))
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temporary = "{}.tmp".format(self.__path)
+
+        with gzip.open(temporary, "wb", compresslevel=self.__compression_level) as file:
+            file.write(self.__captured)
+
+        os.replace(temporary, self.__path)
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """Reads the state of a solver from a checkpoint
+
+        Args:
+            path (str): The file the checkpoint was written to
+
+        Returns:
+            Dict[str, Any]: The state of the solver, see AbstractSolver.set_state
+        """
+        with gzip.open(path, "rb") as file:
+            return pickle.load(file)
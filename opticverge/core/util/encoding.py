@@ -0,0 +1,283 @@
+import struct
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+"""
+The dtypes that arrays are converted to before encoding so that equal values
+held in arrays of different precision share the same encoding
+"""
+_canonical_dtypes = {"b": np.dtype("|u1"), "i": np.dtype("<i8"), "u": np.dtype("<i8"), "f": np.dtype("<f8")}
+
+_pack_int = struct.Struct("<q").pack
+_pack_float = struct.Struct("<d").pack
+_pack_length = struct.Struct("<I").pack
+
+_nan = _pack_float(float("nan"))
+
+"""
+The encoder of each type that has been encoded, see _resolve_encoder
+"""
+_encoders: Dict[type, Callable[[Any, bytearray], None]] = {}
+
+
+def encode(value: Any) -> bytes:
+    """ Encodes a genotype or any of its values as canonical bytes
+
+    The encoding is tagged with the type of each value and independent of the
+    process and Python version, so the hash of the encoding identifies a
+    genotype across workers, caches and checkpoints. Numbers are encoded by
+    their value, i.e. 1, np.int8(1) and np.int64(1) share an encoding whereas
+    1 and 1.0 do not.
+
+    Args:
+        value (Any): The value to encode
+
+    Returns:
+        bytes: The encoding
+    """
+    buffer = bytearray()
+    _encode(value, buffer)
+    return bytes(buffer)
+
+
+def encode_array(values: np.ndarray) -> bytes:
+    """ Encodes a one dimensional array by the kind and values of its elements
+
+    Args:
+        values (np.ndarray): The values to encode
+
+    Returns:
+        bytes: The encoding
+    """
+    buffer = bytearray()
+    _encode_array(np.asarray(values), buffer)
+    return bytes(buffer)
+
+
+def encode_rows(values: np.ndarray) -> List[bytes]:
+    """ Encodes each row of a matrix as encode_array would, converting the matrix to the canonical dtype once
+
+    Args:
+        values (np.ndarray): A matrix with one array per row
+
+    Returns:
+        List[bytes]: The encoding of each row
+    """
+    values = np.asarray(values)
+
+    if _canonical_dtypes.get(values.dtype.kind) is None:
+        return [encode_array(row) for row in values]
+
+    prefix = _array_prefix(values.dtype, values.shape[1])
+
+    return [prefix + row.tobytes() for row in _canonical(values)]
+
+
+def _encode(value: Any, buffer: bytearray):
+    encoder = _encoders.get(type(value))
+
+    if encoder is None:
+        encoder = _encoders[type(value)] = _resolve_encoder(type(value))
+
+    encoder(value, buffer)
+
+
+def _resolve_encoder(value_type: type):
+    """ Selects the encoder of a type, the encoder is cached so that the checks only happen once per type
+    """
+    if value_type is type(None):
+        return _encode_none
+
+    if issubclass(value_type, (bool, np.bool_)):
+        return _encode_bool
+
+    if issubclass(value_type, (int, np.integer)):
+        return _encode_int
+
+    if issubclass(value_type, (float, np.floating)):
+        return _encode_float
+
+    if issubclass(value_type, str):
+        return _encode_str
+
+    if issubclass(value_type, (bytes, bytearray)):
+        return _encode_bytes
+
+    if issubclass(value_type, dict):
+        return _encode_dict
+
+    if issubclass(value_type, (list, tuple)):
+        return _encode_list
+
+    if issubclass(value_type, (set, frozenset)):
+        return _encode_set
+
+    if issubclass(value_type, np.ndarray):
+        return _encode_ndarray
+
+    if issubclass(value_type, Enum):
+        return _encode_enum
+
+    if issubclass(value_type, (type, FunctionType, BuiltinFunctionType, MethodType)):
+        return _encode_name
+
+    if hasattr(value_type, "get_params"):
+        return _encode_estimator
+
+    return _encode_object
+
+
+def _encode_none(value: None, buffer: bytearray):
+    buffer += b"N"
+
+
+def _encode_bool(value: bool, buffer: bytearray):
+    buffer += b"T" if value else b"F"
+
+
+def _encode_int(value: int, buffer: bytearray):
+    value = int(value)
+
+    if -2 ** 63 <= value < 2 ** 63:
+        buffer += b"I"
+        buffer += _pack_int(value)
+    else:
+        _encode_text(b"L", str(value), buffer)
+
+
+def _encode_float(value: float, buffer: bytearray):
+    value = float(value)
+
+    buffer += b"D"
+    # every nan shares an encoding as does -0.0 with 0.0
+    buffer += _nan if value != value else _pack_float(value + 0.0)
+
+
+def _encode_str(value: str, buffer: bytearray):
+    _encode_text(b"S", value, buffer)
+
+
+def _encode_bytes(value: bytes, buffer: bytearray):
+    buffer += b"B"
+    buffer += _pack_length(len(value))
+    buffer += value
+
+
+def _encode_dict(value: dict, buffer: bytearray):
+    buffer += b"{"
+    buffer += _pack_length(len(value))
+
+    for key, item in value.items():
+        _encode(key, buffer)
+        _encode(item, buffer)
+
+
+def _encode_list(value: list or tuple, buffer: bytearray):
+    buffer += b"["
+    buffer += _pack_length(len(value))
+
+    for item in value:
+        _encode(item, buffer)
+
+
+def _encode_set(value: set or frozenset, buffer: bytearray):
+    # the order of iteration depends on the hash seed of the process, so the
+    # items are ordered by their encoding
+    buffer += b"<"
+    buffer += _pack_length(len(value))
+
+    for item in sorted(encode(item) for item in value):
+        buffer += item
+
+
+def _encode_ndarray(value: np.ndarray, buffer: bytearray):
+    if value.ndim == 1:
+        _encode_array(value, buffer)
+    else:
+        buffer += b"M"
+        _encode(list(value.shape), buffer)
+        _encode_array(value.reshape(-1), buffer)
+
+
+def _encode_enum(value: Enum, buffer: bytearray):
+    _encode_text(b"E", "{}.{}".format(_qualified_name(type(value)), value.name), buffer)
+
+
+def _encode_name(value: Any, buffer: bytearray):
+    # classes and functions are identified by where they are defined
+    _encode_text(b"C", _qualified_name(value), buffer)
+
+
+def _encode_estimator(value: Any, buffer: bytearray):
+    # an estimator e.g. the base_estimator of an ensemble is identified by its
+    # class and parameters
+    _encode_text(b"O", _qualified_name(type(value)), buffer)
+    _encode(value.get_params(deep=False), buffer)
+
+
+def _encode_object(value: Any, buffer: bytearray):
+    # any other object is identified by how pickle would reconstruct it i.e.
+    # its class or constructor, arguments and state, which unlike its repr
+    # never includes a memory address
+    try:
+        reduced = value.__reduce_ex__(4)
+    except TypeError as error:
+        raise TypeError("Cannot encode an object of type {}".format(_qualified_name(type(value)))) from error
+
+    if isinstance(reduced, str):
+        # a global singleton that pickle looks up by name
+        _encode_text(b"C", "{}.{}".format(getattr(value, "__module__", ""), reduced), buffer)
+        return
+
+    buffer += b"O"
+    _encode_list([list(item) if _is_iterator(item) else item for item in reduced], buffer)
+
+
+def _is_iterator(value: Any) -> bool:
+    # the list and dict items of a reduction are iterators
+    return hasattr(value, "__next__")
+
+
+def _encode_array(values: np.ndarray, buffer: bytearray):
+    # arrays of other kinds e.g. objects are encoded value by value
+    if _canonical_dtypes.get(values.dtype.kind) is None:
+        buffer += b"["
+        buffer += _pack_length(len(values))
+
+        for item in values.tolist():
+            _encode(item, buffer)
+
+        return
+
+    buffer += _array_prefix(values.dtype, len(values))
+    buffer += _canonical(values).tobytes()
+
+
+def _array_prefix(dtype: np.dtype, length: int) -> bytes:
+    # unsigned and signed integers share the canonical dtype
+    kind = "i" if dtype.kind == "u" else dtype.kind
+    return b"A" + kind.encode() + _pack_length(length)
+
+
+def _canonical(values: np.ndarray) -> np.ndarray:
+    values = values.astype(_canonical_dtypes[values.dtype.kind], copy=False)
+
+    if values.dtype.kind == "f":
+        # collapse -0.0 and the payloads of nan as the scalar encoding does
+        values = np.where(np.isnan(values), np.nan, values + 0.0)
+
+    return np.ascontiguousarray(values)
+
+
+def _encode_text(tag: bytes, text: str, buffer: bytearray):
+    encoded = text.encode("utf-8")
+    buffer += tag
+    buffer += _pack_length(len(encoded))
+    buffer += encoded
+
+
+def _qualified_name(value: Any) -> str:
+    return "{}.{}".format(getattr(value, "__module__", ""), getattr(value, "__qualname__", repr(value)))
@@ -0,0 +1,164 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple, TypeVar
+
+from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.config import data_directory
+
+AbstractProblem = TypeVar('AbstractProblem')
+
+
+class FitnessCache(object):
+    """ A persistent store of the fitness of every evaluated chromosome
+
+    The fitness is keyed by the identity of the problem and the id of the
+    chromosome, so a search repeated on the same problem retrieves the fitness
+    of chromosomes scored by earlier runs rather than evaluating them again.
+
+    The store is an SQLite database, each thread and process opens its own
+    connection so the cache may be shared with the workers of a solver.
+    """
+
+    def __init__(self, path: str = None, timeout: float = 30):
+        """ The constructor for this class
+
+        Args:
+            path (str, optional): Defaults to fitness_cache.sqlite in the data directory. The database file
+            timeout (float, optional): Defaults to 30. The number of seconds to wait for a concurrent writer
+        """
+        self.__path = path if path is not None else os.path.join(data_directory, "fitness_cache.sqlite")
+        self.__timeout = timeout
+        self.__local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(self.__path))
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with self.connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fitness ("
+                "problem TEXT NOT NULL, chromosome_id TEXT NOT NULL, fitness REAL NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (problem, chromosome_id)) WITHOUT ROWID"
+            )
+
+    def __getstate__(self):
+        # connections cannot be shared with another process, the copy opens
+        # its own when it is first used
+        state = self.__dict__.copy()
+        del state["_FitnessCache__local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__local = threading.local()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread, opening it on first use
+
+        Returns:
+            sqlite3.Connection: The connection to the database
+        """
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.__path, timeout=self.__timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.__local.connection = connection
+
+        return connection
+
+    def get_many(self, problem: str, chromosome_ids: Iterable[str]) -> Dict[str, float]:
+        """Retrieves the fitness of the chromosomes that were already evaluated
+
+        Args:
+            problem (str): The identity of the problem, see AbstractProblem.identity
+            chromosome_ids (Iterable[str]): The ids of the chromosomes
+
+        Returns:
+            Dict[str, float]: The fitness keyed by the id of each chromosome found in the cache
+        """
+        chromosome_ids = list(chromosome_ids)
+        found: Dict[str, float] = {}
+
+        # sqlite limits the number of parameters of a single statement
+        for i in range(0, len(chromosome_ids), 500):
+            batch = chromosome_ids[i:i + 500]
+
+            rows = self.connection.execute(
+                "SELECT chromosome_id, fitness FROM fitness WHERE problem = ? AND chromosome_id IN ({})".format(
+                    ",".join("?" * len(batch))),
+                [problem] + batch
+            )
+
+            found.update(rows)
+
+        return found
+
+    def put_many(self, problem: str, items: Iterable[Tuple[str, float]]):
+        """Stores the fitness of evaluated chromosomes
+
+        Args:
+            problem (str): The identity of the problem, see AbstractProblem.identity
+            items (Iterable[Tuple[str, float]]): The id and fitness of each chromosome
+        """
+        created = time.time()
+
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO fitness (problem, chromosome_id, fitness, created) VALUES (?, ?, ?, ?)",
+                [(problem, chromosome_id, float(fitness), created) for chromosome_id, fitness in items]
+            )
+
+    def evaluate(self, problem: AbstractProblem, chromosomes: List[AbstractChromosome]):
+        """Assigns the cached fitness of the chromosomes and evaluates the rest with the problem
+
+        Chromosomes without a fitness e.g. because the evaluation failed, or
+        whose evaluation was abandoned, are not cached so that they are
+        evaluated again by later runs.
+
+        Args:
+            problem (AbstractProblem): The problem evaluating the chromosomes
+            chromosomes (List[AbstractChromosome]): The chromosomes to evaluate
+        """
+        identity: str = problem.identity
+
+        cached: Dict[str, float] = self.get_many(identity, set(chromosome.id for chromosome in chromosomes))
+
+        pending: List[AbstractChromosome] = []
+
+        for chromosome in chromosomes:
+            if chromosome.id in cached:
+                chromosome.fitness = cached[chromosome.id]
+                chromosome.meta.evaluated = True
+            else:
+                pending.append(chromosome)
+
+        if len(pending) == 0:
+            return
+
+        problem.evaluate_batch(pending)
+
+        self.put_many(identity, (
+            (chromosome.id, chromosome.fitness) for chromosome in pending
+            if chromosome.fitness is not None and not math.isnan(chromosome.fitness)
+            and not chromosome.meta.abandoned
+        ))
+
+    def close(self):
+        """Closes the connection of the current thread
+        """
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
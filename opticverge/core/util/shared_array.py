@@ -0,0 +1,126 @@
+import sys
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Tuple
+
+import numpy as np
+
+
+class SharedArray(object):
+    """ A NumPy array stored in a block of shared memory
+
+    When a SharedArray is pickled only the name, shape and dtype of the block
+    are serialised, unpickling it in another process attaches to the same
+    block so the data is never copied between processes.
+
+    Only the process that created the block tracks it, the block outlives the
+    processes attached to it until the creator calls unlink.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: Any, name: str = None):
+        """ The constructor for this class
+
+        Args:
+            shape (Tuple[int, ...]): The shape of the array
+            dtype (Any): The dtype of the array
+            name (str, optional): Defaults to None. The name of an existing block to attach to, if None a new block is
+                created
+        """
+
+        self.__shape: Tuple[int, ...] = tuple(shape)
+        self.__dtype: np.dtype = np.dtype(dtype)
+
+        if name is None:
+            # shared memory cannot be of size 0 so empty arrays use one byte
+            size = max(1, int(np.prod(self.__shape)) * self.__dtype.itemsize)
+            with _registration_lock:
+                self.__memory = SharedMemory(create=True, size=size)
+        else:
+            self.__memory = _attach(name)
+
+        self.__array: np.ndarray = np.ndarray(self.__shape, dtype=self.__dtype, buffer=self.__memory.buf)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, dtype: Any = None):
+        """ Copies an array into a new block of shared memory
+
+        Args:
+            array (np.ndarray): The array to copy
+            dtype (Any, optional): Defaults to the dtype of the array. The dtype of the shared array
+
+        Returns:
+            SharedArray: The shared copy of the array
+        """
+        array = np.asarray(array)
+
+        shared = cls(array.shape, dtype if dtype is not None else array.dtype)
+        shared.array[...] = array
+
+        return shared
+
+    def __reduce__(self):
+        return SharedArray, (self.__shape, self.__dtype.str, self.__memory.name)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def array(self) -> np.ndarray:
+        """Get the view of the shared memory
+
+        Returns:
+            np.ndarray: The array backed by the shared memory
+        """
+        return self.__array
+
+    def close(self):
+        """Detaches this process from the shared memory, views of the array must be released beforehand
+        """
+        self.__array = None
+        self.__memory.close()
+
+    def unlink(self):
+        """Detaches and destroys the shared memory, should only be called by the process that created it
+        """
+        self.close()
+        self.__memory.unlink()
+
+
+"""
+Held whilst the resource tracker registration is suppressed, so a block created
+by another thread of this process at the same time is still registered
+"""
+_registration_lock = threading.Lock()
+
+
+def _attach(name: str) -> SharedMemory:
+    """ Attaches to an existing block of shared memory without registering it with the resource tracker
+
+    Before Python 3.13 attaching registers the block as if this process created
+    it (bpo-38119), so a process with its own resource tracker destroys the
+    block when it exits whilst its creator is still using it.
+
+    Args:
+        name: The name of the block
+
+    Returns:
+        SharedMemory: The attached block
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    with _registration_lock:
+
+        register = resource_tracker.register
+        resource_tracker.register = _ignore
+
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _ignore(*args, **kwargs):
+    pass
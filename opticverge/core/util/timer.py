@@ -0,0 +1,63 @@
+import time
+
+
+class Timer(object):
+    """ Measures the wall clock and CPU time in milliseconds of the block it wraps
+
+    The CPU time of the current thread is measured by default so that threads
+    evaluating chromosomes at the same time are not charged for each other.
+    Worker processes that fit a single task at a time measure the CPU time of
+    the process instead, which includes any threads started by the task e.g.
+    BLAS.
+
+    Example:
+        with Timer() as timer:
+            chromosome.mutate(0.1)
+
+        chromosome.meta.record_time("mutation", timer.wall, timer.cpu)
+    """
+
+    __slots__ = ("__process", "__started_wall", "__started_cpu", "__wall", "__cpu")
+
+    def __init__(self, process: bool = False):
+        """ The constructor for this class
+
+        Args:
+            process (bool, optional): Defaults to False. Whether the CPU time of the process rather than the current
+                thread is measured
+        """
+        self.__process = process
+        self.__started_wall: float = None
+        self.__started_cpu: float = None
+        self.__wall: float = 0.
+        self.__cpu: float = 0.
+
+    def __enter__(self):
+        self.__started_wall = time.perf_counter()
+        self.__started_cpu = self.__cpu_clock()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.__wall = (time.perf_counter() - self.__started_wall) * 1000
+        self.__cpu = (self.__cpu_clock() - self.__started_cpu) * 1000
+
+    @property
+    def wall(self) -> float:
+        """Get the wall clock time of the block
+
+        Returns:
+            float: The elapsed time in milliseconds
+        """
+        return self.__wall
+
+    @property
+    def cpu(self) -> float:
+        """Get the CPU time of the block
+
+        Returns:
+            float: The CPU time in milliseconds
+        """
+        return self.__cpu
+
+    def __cpu_clock(self) -> float:
+        return time.process_time() if self.__process else time.thread_time()
@@ -6,6 +6,9 @@ from opticverge.core.generator.real_generator import rand_real
 
 
 class AckleyChromosome(RandArrayChromosome):
+
+    __slots__ = ()
+
     def __init__(self, dimensions: int):
         super(AckleyChromosome, self).__init__(
             length=dimensions,
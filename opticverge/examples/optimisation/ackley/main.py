@@ -1,6 +1,6 @@
 from opticverge.core.enum.policy import Policy
 from opticverge.core.log.logger import application_logger
-from opticverge.core.solver.generic_ais import AIS
+from opticverge.core.solver.array_ais import ArrayAIS
 from opticverge.examples.optimisation.ackley.chromosome import AckleyChromosome
 from opticverge.examples.optimisation.ackley.problem import AckleyProblem
 from opticverge.examples.optimisation.one_max.chromosome import OneMaxChromosome
@@ -13,7 +13,7 @@ def run():
 
     try:
 
-        solver = AIS(
+        solver = ArrayAIS(
             chromosome=AckleyChromosome(dimensions=10),
             problem=problem,
             population_size=100,
@@ -26,17 +26,37 @@ class AckleyProblem(AbstractProblem):
         data_logger.log(DATA, data_str)
 
     def objective_function(self, chromosome: AbstractChromosome):
-        a = 20
-        b = 0.2
-        c = 2 * np.pi
-        d = len(chromosome.phenotype)
-        x: List[float] = chromosome.phenotype
-        sum_squared = np.sum(np.square(x))
-        sum_cos = 0.0
-        for i, val in enumerate(x):
-            sum_cos += c * np.cos(val)
-
-        chromosome.fitness = np.abs(
-            -a * np.exp(-b * np.sqrt(1 / d * sum_squared)) - np.exp(1 / d * sum_cos) + a + np.exp(1))
+        x = np.asarray([chromosome.phenotype], dtype=np.float64)
+
+        chromosome.fitness = ackley(x)[0]
 
         super(AckleyProblem, self).objective_function(chromosome)
+
+    def objective_function_batch(self, chromosomes: List[AbstractChromosome]):
+        x = np.asarray([chromosome.phenotype for chromosome in chromosomes], dtype=np.float64)
+
+        for chromosome, fitness in zip(chromosomes, self.objective_function_array(x)):
+            chromosome.fitness = fitness
+            super(AckleyProblem, self).objective_function(chromosome)
+
+    def objective_function_array(self, x: np.ndarray) -> np.ndarray:
+        return ackley(np.asarray(x, dtype=np.float64))
+
+
+def ackley(x: np.ndarray) -> np.ndarray:
+    """ Computes the Ackley function for each row
+
+    Args:
+        x (np.ndarray): A matrix with one point per row
+
+    Returns:
+        np.ndarray: The value of the function for each row
+    """
+    a = 20
+    b = 0.2
+    c = 2 * np.pi
+    d = x.shape[1]
+    sum_squared = np.sum(np.square(x), axis=1)
+    sum_cos = np.sum(np.cos(c * x), axis=1)
+
+    return np.abs(-a * np.exp(-b * np.sqrt(1 / d * sum_squared)) - np.exp(1 / d * sum_cos) + a + np.exp(1))
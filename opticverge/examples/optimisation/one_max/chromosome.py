@@ -8,6 +8,9 @@ from opticverge.core.chromosome.distribution.int_distribution_chromosome import
 
 
 class OneMaxChromosome(RandArrayChromosome):
+
+    __slots__ = ()
+
     def blueprint_factory(self, **kwargs) -> Dict[str, AbstractChromosome]:
         pass
 
@@ -1,6 +1,6 @@
 from opticverge.core.enum.policy import Policy
 from opticverge.core.log.logger import application_logger
-from opticverge.core.solver.generic_ais import AIS
+from opticverge.core.solver.array_ais import ArrayAIS
 from opticverge.examples.optimisation.one_max.chromosome import OneMaxChromosome
 from opticverge.examples.optimisation.one_max.problem import OneMaxProblem
 
@@ -20,7 +20,7 @@ def run():
         is used here to demonstrate the application of the framework to the 
         OneMax problem. 
         """
-        solver = AIS(
+        solver = ArrayAIS(
             chromosome=OneMaxChromosome(dimensions=100),
             problem=problem,
             population_size=100,
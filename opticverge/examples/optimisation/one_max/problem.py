@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from typing import List
 
 import numpy as np
 
@@ -17,6 +18,16 @@ class OneMaxProblem(AbstractProblem):
         super(OneMaxProblem, self).objective_function(chromosome)
         chromosome.fitness = np.sum(chromosome.phenotype)
 
+    def objective_function_batch(self, chromosomes: List[AbstractChromosome]):
+        x = np.asarray([chromosome.phenotype for chromosome in chromosomes])
+
+        for chromosome, fitness in zip(chromosomes, self.objective_function_array(x)):
+            super(OneMaxProblem, self).objective_function(chromosome)
+            chromosome.fitness = fitness
+
+    def objective_function_array(self, x: np.ndarray) -> np.ndarray:
+        return np.sum(x, axis=1)
+
     def log_chromosome(self, chromosome: AbstractChromosome, solver: AbstractSolver):
         data_str = super(OneMaxProblem, self).log_chromosome(
             chromosome=chromosome,
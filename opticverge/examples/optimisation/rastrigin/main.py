@@ -1,7 +1,7 @@
 
 from opticverge.core.enum.policy import Policy
 from opticverge.core.log.logger import application_logger
-from opticverge.core.solver.generic_ais import AIS
+from opticverge.core.solver.array_ais import ArrayAIS
 from opticverge.examples.optimisation.rastrigin.chromosome import RastriginChromosome
 from opticverge.examples.optimisation.rastrigin.problem import RastriginProblem
 
@@ -11,7 +11,7 @@ def run():
 
     try:
 
-        solver = AIS(
+        solver = ArrayAIS(
             chromosome=RastriginChromosome(dimensions=10),
             problem=problem,
             population_size=100,
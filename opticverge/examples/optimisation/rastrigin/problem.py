@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import numpy as np
 
@@ -26,11 +26,32 @@ class RastriginProblem(AbstractProblem):
         data_logger.log(DATA, data_str)
 
     def objective_function(self, chromosome: AbstractChromosome):
-        x = chromosome.genotype
-        d = len(x)
-        formula_sum = 0.0
-        for i, val in enumerate(x):
-            formula_sum += np.square(val) - (10 * np.cos(2 * np.pi * val))
+        x = np.asarray([chromosome.phenotype], dtype=np.float64)
 
-        chromosome.fitness = np.abs((10 * d) + formula_sum)
+        chromosome.fitness = rastrigin(x)[0]
         super(RastriginProblem, self).objective_function(chromosome)
+
+    def objective_function_batch(self, chromosomes: List[AbstractChromosome]):
+        x = np.asarray([chromosome.phenotype for chromosome in chromosomes], dtype=np.float64)
+
+        for chromosome, fitness in zip(chromosomes, self.objective_function_array(x)):
+            chromosome.fitness = fitness
+            super(RastriginProblem, self).objective_function(chromosome)
+
+    def objective_function_array(self, x: np.ndarray) -> np.ndarray:
+        return rastrigin(np.asarray(x, dtype=np.float64))
+
+
+def rastrigin(x: np.ndarray) -> np.ndarray:
+    """ Computes the Rastrigin function for each row
+
+    Args:
+        x (np.ndarray): A matrix with one point per row
+
+    Returns:
+        np.ndarray: The value of the function for each row
+    """
+    d = x.shape[1]
+    formula_sum = np.sum(np.square(x) - (10 * np.cos(2 * np.pi * x)), axis=1)
+
+    return np.abs((10 * d) + formula_sum)
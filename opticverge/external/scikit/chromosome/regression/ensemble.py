@@ -19,6 +19,8 @@ from opticverge.external.scikit.chromosome.regression.tree import DecisionTreeRe
 class GradientBoostingRegressorChromosome(ClassChromosome):
     """ The chromosome class for the GradientBoostingRegressor from Scikit-learn """
 
+    __slots__ = ()
+
     def __init__(self, n_estimators: int or None = None, learning_rate: float or None = None,
                  max_depth: int or None = None):
         """ The constructor for this class
@@ -90,6 +92,9 @@ class GradientBoostingRegressorChromosome(ClassChromosome):
 
 
 class XGBRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, max_depth: int = None, learning_rate: float = None, n_estimators: int = None, num_jobs: int = None):
         super(XGBRegressorChromosome, self).__init__(
             XGBRegressor,
@@ -152,6 +157,9 @@ class XGBRegressorChromosome(ClassChromosome):
 
 
 class AdaBoostRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, n_estimators: int = None, learning_rate: float = None, regressor_chromosome=None):
         super(AdaBoostRegressorChromosome, self).__init__(
             AdaBoostRegressor,
@@ -188,6 +196,9 @@ class AdaBoostRegressorChromosome(ClassChromosome):
 
 
 class RandomForestRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, max_depth: int = None, n_estimators: int = None, num_jobs=None):
         super(RandomForestRegressorChromosome, self).__init__(
             RandomForestRegressor,
@@ -231,6 +242,9 @@ class RandomForestRegressorChromosome(ClassChromosome):
 
 
 class BaggingRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, regressor_chromosome=None, n_estimators: int = None, num_jobs=None):
         super(BaggingRegressorChromosome, self).__init__(
             BaggingRegressor,
@@ -11,6 +11,9 @@ from opticverge.core.globals import DEFAULT_NUM_JOBS
 
 
 class KNeighborsRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, num_jobs=None):
 
         super(KNeighborsRegressorChromosome, self).__init__(
@@ -13,6 +13,8 @@ from opticverge.core.globals import INT32_MAX
 
 class MLPRegressorChromosome(ClassChromosome):
 
+    __slots__ = ()
+
     def __init__(self, layers: int = 6, min_layers: int = 2, max_layers=512):
         super(MLPRegressorChromosome, self).__init__(
             MLPRegressor,
@@ -10,6 +10,9 @@ from opticverge.core.globals import INT32_MAX
 
 
 class DecisionTreeRegressorChromosome(ClassChromosome):
+
+    __slots__ = ()
+
     def __init__(self, max_depth: int = None):
         super(DecisionTreeRegressorChromosome, self).__init__(
             DecisionTreeRegressor,
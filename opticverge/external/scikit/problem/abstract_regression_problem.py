@@ -1,20 +1,35 @@
 import concurrent.futures
+import copy
+import math
+import multiprocessing
+import threading
 from abc import ABCMeta
 from collections import OrderedDict
-from typing import List, Callable, Dict, Any
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Callable, Dict, Any, Tuple
 
 import numpy as np
 import psutil
+import xxhash
+from scipy.stats import t
 from sklearn.model_selection import train_test_split, KFold
 
 from opticverge.core.chromosome.abstract_chromosome import AbstractChromosome
+from opticverge.core.distributed.coordinator import Coordinator
 from opticverge.core.globals import DEFAULT_NUM_JOBS
 from opticverge.core.log.logger import application_logger
 from opticverge.core.problem.abstract_problem import AbstractProblem
 from opticverge.core.enum.objective import Objective
 from opticverge.core.solver.abstract_solver import AbstractSolver
+from opticverge.core.strategy.selection import fitness_key
+from opticverge.core.util.encoding import encode
+from opticverge.core.util.shared_array import SharedArray
+from opticverge.core.util.timer import Timer
 from opticverge.external.scikit.enum.normaliser import Normaliser
 from opticverge.external.scikit.enum.scoring_function import Scoring
+from opticverge.external.scikit.problem.model_store import ModelStore
+from opticverge.external.scikit.problem.partition import Partition
 
 
 class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
@@ -27,7 +42,64 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
                  scoring_function: Scoring,
                  folds: int = 1,
                  train_test_ratio: float = 1.0,
-                 normaliser: Normaliser or Callable = None):
+                 normaliser: Normaliser or Callable = None,
+                 num_jobs: int = None,
+                 dtype: Any = np.float64,
+                 shared_memory: bool = True,
+                 coordinator: Coordinator = None,
+                 racing: bool = False,
+                 racing_confidence: float = 0.95,
+                 racing_folds: int = 2,
+                 fidelities: List[float] = None,
+                 promotion_ratio: float = 1 / 3,
+                 fidelity_parameters: List[str] = None,
+                 warm_start: bool = False,
+                 warm_start_capacity: int = 8,
+                 seed: int = 0):
+        """The constructor for the AbstractRegressionProblem
+
+        Args:
+            objective (Objective): Set whether this problem is maximising or minimising the scoring function
+            name (str): The name of the problem to be solved
+            data_x (np.array or List): The features of the data
+            target_x (np.array or List): The target variable of the data
+            scoring_function (Scoring): The function scoring the predictions of each fold
+            folds (int, optional): Defaults to 1. The number of folds used for cross validation
+            train_test_ratio (float, optional): Defaults to 1.0. The ratio of the data to be used
+            normaliser (Normaliser or Callable, optional): Defaults to None. The normalisation strategy of the data
+            num_jobs (int, optional): Defaults to DEFAULT_NUM_JOBS. The number of worker processes fitting the folds
+            dtype (Any, optional): Defaults to np.float64. The dtype of the partitions, np.float32 halves the memory
+            shared_memory (bool, optional): Defaults to True. Whether the workers attach to the partitions in shared
+                memory rather than receiving a copy. Workers started by fork inherit the partitions without copying
+                them, so shared memory only applies to the other start methods e.g. spawn, where this process keeps
+                its own partitions alongside the shared copy
+            coordinator (Coordinator, optional): Defaults to None. Evaluates the chromosomes on remote workers rather
+                than the local worker pool, the workers hold their own instance of this problem without a coordinator
+            racing (bool, optional): Defaults to False. Whether the folds of a chromosome with a threshold are fitted
+                progressively, abandoning the chromosome once it cannot beat the threshold, see ChromosomeMeta
+            racing_confidence (float, optional): Defaults to 0.95. The confidence that the mean score of every fold
+                cannot beat the threshold before the chromosome is abandoned
+            racing_folds (int, optional): Defaults to 2. The number of folds of a chromosome fitted at the same time
+                whilst racing
+            fidelities (List[float], optional): Defaults to None. The increasing fractions of the training rows each
+                batch of chromosomes is evaluated at by successive halving e.g. [0.1, 0.3, 1.0], see
+                objective_function_batch. The lower fidelities only apply to batches large enough to abandon a
+                chromosome, a batch of one e.g. each candidate of a SteadyStateAIS is always evaluated in full
+            promotion_ratio (float, optional): Defaults to 1 / 3. The fraction of the chromosomes evaluated at a
+                fidelity that are promoted to the next fidelity
+            fidelity_parameters (List[str], optional): Defaults to None. The integer parameters of the learners e.g.
+                n_estimators or max_iter that are scaled by the fidelity instead of the training rows, learners
+                without these parameters train on a fraction of the rows
+            warm_start (bool, optional): Defaults to False. Whether the fitted learners of the fittest chromosomes are
+                retained so that their mutants which only increase n_estimators or max_iter continue training them,
+                see ModelStore. A chromosome continuing a retained learner, or any continuable chromosome whilst the
+                store has room, is fitted by threads of this process so that fitted learners are never copied between
+                processes, every other chromosome is fitted by the worker pool and is not retained
+            warm_start_capacity (int, optional): Defaults to 8. The number of chromosomes whose fitted learners are
+                retained
+            seed (int, optional): Defaults to 0. The seed of the split of the data into partitions, so every run and
+                every remote worker with the same seed evaluates the chromosomes on the same folds
+        """
 
         super(AbstractRegressionProblem, self).__init__(objective, name)
 
@@ -38,10 +110,183 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
         self.__folds = folds
         self.__normaliser_enum = normaliser
         self.__train_test_ratio = train_test_ratio
+        self.__seed = seed
+
+        self.__num_jobs = num_jobs if num_jobs is not None else DEFAULT_NUM_JOBS
+        self.__dtype = dtype
+        self.__shared_memory = shared_memory
+        self.__coordinator = coordinator
+        self.__racing = racing
+        self.__racing_confidence = racing_confidence
+        self.__racing_folds = max(1, racing_folds)
+
+        # the last fidelity is always the full evaluation
+        self.__fidelities: List[float] = None
+        if fidelities is not None:
+            self.__fidelities = sorted(fidelity for fidelity in fidelities if fidelity < 1.0) + [1.0]
+
+        self.__promotion_ratio = promotion_ratio
+        self.__fidelity_parameters: List[str] = fidelity_parameters or []
+
+        # the fitted learners whose training the mutants of a chromosome may
+        # continue, None if every learner is trained from scratch
+        self.__model_store: ModelStore = ModelStore(objective, warm_start_capacity) if warm_start is True else None
 
         self.__partitioned_data = None
         self.__normalised_data = None
 
+        # the identity hashes the data so it is only derived once
+        self.__identity: str = None
+
+        """
+        The features and target variable as single contiguous buffers of the
+        dtype, every partition indexes into them
+        """
+        self.__x: np.ndarray = None
+        self.__y: np.ndarray = None
+
+        """
+        The worker pool is created on first use and persists until shutdown is
+        called, each worker receives the partitions once when it starts so
+        that only the learner is sent with each task.
+        """
+        self.__executor: ProcessPoolExecutor = None
+
+        # fits the learners that may be retained, created on first use
+        self.__warm_start_executor: ThreadPoolExecutor = None
+
+        """
+        The buffers copied into shared memory for the workers of the pool,
+        owned by this instance and destroyed on shutdown
+        """
+        self.__shared_data: List[SharedArray] = None
+
+        # the threads of a solver evaluate chromosomes at the same time, the
+        # lock ensures the partitions and worker pool are only created once
+        self.__lock = threading.RLock()
+
+    def __getstate__(self):
+        # the worker pool and shared memory cannot be shared with another
+        # process, a copy of the problem creates its own when it is first used
+        state = self.__dict__.copy()
+        state["_AbstractRegressionProblem__executor"] = None
+        state["_AbstractRegressionProblem__warm_start_executor"] = None
+        state["_AbstractRegressionProblem__shared_data"] = None
+        del state["_AbstractRegressionProblem__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.RLock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Get the pool of worker processes fitting the learners, creating it on first use
+
+        Returns:
+            ProcessPoolExecutor: The worker pool
+        """
+        executor: ProcessPoolExecutor = self.__executor
+
+        if executor is not None:
+            return executor
+
+        with self.__lock:
+
+            if self.__executor is not None:
+                return self.__executor
+
+            partitions = self.partitions
+
+            data: List[np.ndarray or SharedArray] = [self.__x, self.__y]
+
+            # forked workers inherit the buffers, copying them into shared
+            # memory would only hold the data twice
+            if self.__shared_memory is True and multiprocessing.get_start_method() != "fork":
+
+                if self.__shared_data is None:
+                    self.__shared_data = [SharedArray.from_array(self.__x), SharedArray.from_array(self.__y)]
+
+                data = self.__shared_data
+
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.__num_jobs,
+                initializer=_initialise_worker,
+                initargs=(
+                    data[0],
+                    data[1],
+                    [(partition.train_index, partition.test_index) for partition in partitions],
+                    self.__scoring_function,
+                    self.__fidelity_parameters
+                )
+            )
+
+            return self.__executor
+
+    def shutdown(self):
+        """Stops the worker pool and releases the shared memory
+        """
+        with self.__lock:
+
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+
+            if self.__warm_start_executor is not None:
+                self.__warm_start_executor.shutdown(wait=True)
+                self.__warm_start_executor = None
+
+            if self.__shared_data is not None:
+                for shared_array in self.__shared_data:
+                    shared_array.unlink()
+
+                self.__shared_data = None
+
+        super(AbstractRegressionProblem, self).shutdown()
+
+    def __discard_executor(self, executor: ProcessPoolExecutor):
+        """Discards a broken worker pool so that the next evaluation starts a new one
+
+        Other threads may observe the same broken pool, only the first discards
+        it and a pool started since is left running.
+
+        Args:
+            executor (ProcessPoolExecutor): The pool that stopped unexpectedly
+        """
+        with self.__lock:
+
+            if executor is None or self.__executor is not executor:
+                return
+
+            self.__executor = None
+
+        executor.shutdown(wait=False)
+
+    @property
+    def identity(self) -> str:
+        """Get the identity of the problem derived from its data and the configuration of its evaluation
+
+        Returns:
+            str: The problem identity
+        """
+        if self.__identity is None:
+
+            digest = xxhash.xxh64()
+
+            # the canonical encoding hashes the values rather than the memory
+            # layout, e.g. the pointers held by arrays of objects
+            for values in [self.__data_x, self.__target_x]:
+                digest.update(encode(np.asarray(values)))
+
+            digest.update("{}|{}|{}|{}|{}|{}".format(
+                self.__scoring_function_enum, self.__folds, self.__normaliser_enum, self.__train_test_ratio,
+                np.dtype(self.__dtype).str, self.__seed
+            ).encode())
+
+            self.__identity = "{}|{}".format(super(AbstractRegressionProblem, self).identity, digest.hexdigest())
+
+        return self.__identity
+
     @property
     def data(self, **kwargs):
 
@@ -68,34 +313,44 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
         return self.__normalised_data
 
     @property
-    def partitions(self, dtype=np.float64, test_size=0.1):
+    def partitions(self, test_size=0.1) -> List[Partition]:
 
         # if we haven't already partitioned the data then do so
-        if self.__partitioned_data is None:
+        if self.__partitioned_data is not None:
+            return self.__partitioned_data
+
+        with self.__lock:
+
+            if self.__partitioned_data is not None:
+                return self.__partitioned_data
+
+            partitioned_data: List[Partition] = []
 
-            self.__partitioned_data = []
+            # get the normalised data and its target variables as single
+            # buffers that each of the partitions index into
+            self.__x = np.ascontiguousarray(self.data, dtype=self.__dtype)
+            self.__y = np.ascontiguousarray(self.__target_x[:len(self.__x)], dtype=self.__dtype)
 
-            # get the normalised data and its target variables
-            data_x = self.data
-            target_x = self.__target_x
+            indices = np.arange(len(self.__x))
 
             # if the user prefers not to use a validation strategy then split
             # the data into a single fold.
-            if self.__folds < 2 or self.__folds is None:
-                x_train, x_test, y_train, y_test = train_test_split(data_x, target_x, test_size=test_size)
-                self.__partitioned_data.append(data_object(x_train, y_train, x_test, y_test, dtype))
+            if self.__folds is None or self.__folds < 2:
+                train_index, test_index = train_test_split(indices, test_size=test_size, random_state=self.__seed)
+                partitioned_data.append(Partition(self.__x, self.__y, train_index, test_index))
             else:
                 # use the default KFold validation strategy
                 # TODO: expose alternative folding strategies
-                validation_strategy = KFold(n_splits=self.__folds, shuffle=True)
+                validation_strategy = KFold(n_splits=self.__folds, shuffle=True, random_state=self.__seed)
 
                 # split the data and build the partitions to match the number
                 # of folds
-                cv_split = validation_strategy.split(data_x, target_x)
+                cv_split = validation_strategy.split(indices)
                 for train_index, test_index in cv_split:
-                    x_train, x_test = data_x[train_index], data_x[test_index]
-                    y_train, y_test = target_x[train_index], target_x[test_index]
-                    self.__partitioned_data.append(data_object(x_train, y_train, x_test, y_test, dtype))
+                    partitioned_data.append(Partition(self.__x, self.__y, train_index, test_index))
+
+            # assigned once complete so that threads never observe a partial list
+            self.__partitioned_data = partitioned_data
 
         return self.__partitioned_data
 
@@ -105,28 +360,28 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
         # occur during the learning phase
         scores = None
 
+        # the pool the folds are submitted to, discarded if it breaks
+        executor: ProcessPoolExecutor = None
+
         try:
 
-            # we prefer to farm out the learning to the number of cores assigned
-            # in DEFAULT_NUM_JOBS
-            with concurrent.futures.ProcessPoolExecutor(max_workers=DEFAULT_NUM_JOBS) as executor:
+            executor = self.executor
+
+            fidelity: float = chromosome.meta.fidelity if chromosome.meta.fidelity is not None else 1.0
+
+            if self.__racing is True and chromosome.meta.threshold is not None and fidelity >= 1.0:
+                scores = self.race(chromosome)
+            else:
+                fitted_learners, retain = self.__continuation(chromosome, fidelity)
 
                 # here we track the result of the training against the learners
                 futures = []
 
-                for i, partition in enumerate(self.partitions):
+                for i in range(len(self.partitions)):
 
                     # The phenotype of the chromosome represents an instance of
-                    # a learner that implements the fit function. The learn
-                    # function is not a part of this class simply because we
-                    # do not want to serialize the entire class in order to
-                    # call the method
-                    future = executor.submit(
-                        learn,
-                        learner=chromosome.phenotype,
-                        partition=partition,
-                        evaluation_function=self.__scoring_function
-                    )
+                    # a learner that implements the fit function.
+                    future = self.__submit(chromosome, i, fitted_learners, retain, fidelity)
 
                     # add the futures
                     futures.insert(i, future)
@@ -134,8 +389,19 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
                 # wait until the futures are complete
                 concurrent.futures.wait(futures)
 
-                # extract the output of each future into a list
-                scores = [future.result() for future in futures]
+                # extract the score of each future into a list
+                scores = [self.__record(chromosome, i, future.result()) for i, future in enumerate(futures)]
+
+                if retain is True:
+                    self.__retain(chromosome, scores, [future.result()[2] for future in futures])
+
+        except BrokenProcessPool as ex:
+            application_logger.exception(
+                "AbstractRegressionProblem-objective_function: The worker pool stopped unexpectedly",
+                exc_info=ex
+            )
+
+            self.__discard_executor(executor)
 
         except Exception as ex:
             application_logger.exception(
@@ -153,6 +419,237 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
         # what they want to do after the evaluation
         return scores
 
+    def evaluate(self, chromosome: AbstractChromosome) -> List[np.float64] or None:
+        """Evaluates a chromosome with the objective function, recording the time taken on its meta
+
+        The folds are fitted in worker processes, so the CPU time of the folds
+        is added to the CPU time of this thread once the evaluation completes.
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome to measure
+
+        Returns:
+            List[np.float64] or None: The score of each fold
+        """
+        fold_cpu: float = _fold_cpu_time(chromosome.meta.timings)
+
+        with Timer() as timer:
+            scores = self.objective_function(chromosome)
+
+        chromosome.meta.record_time(
+            "evaluation", timer.wall, timer.cpu + _fold_cpu_time(chromosome.meta.timings) - fold_cpu
+        )
+
+        return scores
+
+    def race(self, chromosome: AbstractChromosome) -> List[np.float64]:
+        """ Fits the folds of a chromosome progressively until it cannot beat the threshold of its meta
+
+        At most racing_folds folds are fitted at the same time. Each time a
+        fold completes the chromosome is abandoned if, with the racing
+        confidence, the mean score of every fold cannot beat the threshold, see
+        _cannot_beat. The remaining folds are then never fitted and the
+        fitness is the mean score of the completed folds.
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome whose meta holds the threshold
+
+        Returns:
+            List[np.float64]: The scores of the completed folds
+        """
+        fitted_learners, retain = self.__continuation(chromosome)
+
+        pending: List[int] = list(range(len(self.partitions)))
+        futures: Dict[Future, int] = {}
+        learners: Dict[int, Any] = {}
+        scores: List[np.float64] = []
+
+        try:
+            while len(pending) > 0 or len(futures) > 0:
+
+                while len(pending) > 0 and len(futures) < self.__racing_folds:
+                    future = self.__submit(chromosome, pending[0], fitted_learners, retain)
+                    futures[future] = pending.pop(0)
+
+                done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in done:
+                    partition_index: int = futures.pop(future)
+                    scores.append(self.__record(chromosome, partition_index, future.result()))
+                    learners[partition_index] = future.result()[2]
+
+                if len(pending) + len(futures) > 0 and _cannot_beat(
+                        scores, chromosome.meta.threshold, self.objective, self.__racing_confidence):
+                    chromosome.meta.abandoned = True
+                    break
+        finally:
+            # folds that have started are left to complete in the worker
+            for future in futures:
+                future.cancel()
+
+        if retain is True and chromosome.meta.abandoned is False:
+            self.__retain(chromosome, scores, [learners[i] for i in range(len(learners))])
+
+        return scores
+
+    def __continuation(self, chromosome: AbstractChromosome, fidelity: float = 1.0) -> Tuple[List[Any] or None, bool]:
+        """ Finds the fitted learners of the parent of a chromosome that the chromosome continues training
+
+        A learner continues training the fitted learners of its parent if the
+        parent is retained and the learners differ only by an increase of one
+        of the incremental parameters, see _incremental_parameter. Otherwise
+        the fitted learners are only returned to be retained whilst the store
+        has room, so that once it is full the fits that cannot continue a
+        retained learner stay in the worker pool.
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome to evaluate
+            fidelity (float, optional): Defaults to 1.0. The fraction of the full evaluation
+
+        Returns:
+            Tuple[List[Any] or None, bool]: A copy of the fitted learner of each fold of the parent, None if the
+                learner is trained from scratch, and whether the fitted learners are returned to be retained
+        """
+        if self.__model_store is None or fidelity < 1.0 or not _continuable(chromosome.phenotype):
+            return None, False
+
+        retained: Tuple[Dict[str, Any], List[Any]] = self.__model_store.get(chromosome.meta.parent_id)
+
+        if retained is None or _incremental_parameter(retained[0], chromosome.phenotype.get_params(deep=False)) is None:
+            return None, len(self.__model_store) < self.__model_store.capacity
+
+        return _copy_fitted_learners(retained[1]), True
+
+    def __submit(self, chromosome: AbstractChromosome, partition_index: int, fitted_learners: List[Any] or None,
+                 retain: bool, fidelity: float = 1.0) -> Future:
+        """ Submits the fit of the learner of a chromosome against one of the partitions
+
+        The workers of the pool already hold the partitions so only the
+        learner and the index of the partition are sent. A learner that may be
+        retained is fitted by a thread of this process instead, so neither it
+        nor the fitted learner of its parent is copied between processes.
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome to evaluate
+            partition_index (int): The index of the partition
+            fitted_learners (List[Any] or None): The copy of the fitted learner of each fold of the parent, see
+                __continuation
+            retain (bool): Whether the fitted learner is returned to be retained
+            fidelity (float, optional): Defaults to 1.0. The fraction of the full evaluation
+
+        Returns:
+            Future: The result of learn_partition or _learn_retained
+        """
+        if retain is False:
+            return self.executor.submit(
+                learn_partition,
+                learner=chromosome.phenotype,
+                partition_index=partition_index,
+                fidelity=fidelity
+            )
+
+        return self.__threads.submit(
+            _learn_retained,
+            learner=copy.deepcopy(chromosome.phenotype),
+            partition=self.partitions[partition_index],
+            evaluation_function=self.__scoring_function,
+            fitted_learner=None if fitted_learners is None else fitted_learners[partition_index]
+        )
+
+    @property
+    def __threads(self) -> ThreadPoolExecutor:
+        """Get the threads fitting the learners that may be retained, creating them on first use
+
+        Returns:
+            ThreadPoolExecutor: The threads
+        """
+        if self.__warm_start_executor is not None:
+            return self.__warm_start_executor
+
+        with self.__lock:
+
+            if self.__warm_start_executor is None:
+                self.__warm_start_executor = ThreadPoolExecutor(max_workers=self.__num_jobs)
+
+            return self.__warm_start_executor
+
+    def __record(self, chromosome: AbstractChromosome, partition_index: int, result: Tuple[Any, Dict, Any]) -> Any:
+        """ Records the time taken by a fold of the chromosome, see evaluate
+
+        Args:
+            chromosome (AbstractChromosome): The chromosome being evaluated
+            partition_index (int): The index of the fold
+            result (Tuple[Any, Dict, Any]): The result of learn_partition or _learn_retained
+
+        Returns:
+            The score of the fold
+        """
+        score, timings, _ = result
+
+        for stage, (wall, cpu) in timings.items():
+            chromosome.meta.record_time("fold_{}_{}".format(partition_index, stage), wall, cpu)
+
+        return score
+
+    def __retain(self, chromosome: AbstractChromosome, scores: List[np.float64], learners: List[Any]):
+        """ Retains the fitted learners of a chromosome whose every fold completed, see ModelStore
+
+        Args:
+            chromosome (AbstractChromosome): The evaluated chromosome
+            scores (List[np.float64]): The score of each fold
+            learners (List[Any]): The fitted learner of each fold
+        """
+        self.__model_store.put(chromosome.id, np.mean(scores), chromosome.phenotype.get_params(deep=False), learners)
+
+    def objective_function_batch(self, chromosomes: List[AbstractChromosome]):
+        """ Evaluates the chromosomes, by successive halving if the problem has fidelities
+
+        Successive halving evaluates every chromosome at the lowest fidelity
+        and promotes the best promotion_ratio of them to the next fidelity
+        until the promoted chromosomes are evaluated in full. A fidelity that
+        would promote every chromosome is skipped, so a batch of fewer than
+        1 / promotion_ratio chromosomes, including the single candidate of a
+        SteadyStateAIS, is evaluated in full only. The chromosomes that are not
+        promoted keep the fitness of their last fidelity, see
+        ChromosomeMeta.fidelity, and are marked as abandoned so that the solver
+        does not select them.
+
+        Args:
+            chromosomes (List[AbstractChromosome]): The chromosomes to measure
+        """
+        if self.__fidelities is None:
+            return self.__evaluate(chromosomes)
+
+        candidates: List[AbstractChromosome] = list(chromosomes)
+
+        for fidelity in self.__fidelities:
+
+            promoted_count: int = max(1, int(math.ceil(len(candidates) * self.__promotion_ratio)))
+
+            if fidelity < 1.0 and promoted_count >= len(candidates):
+                continue
+
+            for chromosome in candidates:
+                chromosome.meta.fidelity = fidelity if fidelity < 1.0 else None
+                chromosome.meta.abandoned = fidelity < 1.0
+
+            self.__evaluate(candidates)
+
+            if fidelity < 1.0:
+                fitness = np.array([np.nan if c.fitness is None else c.fitness for c in candidates], dtype=np.float64)
+                order: np.ndarray = np.argsort(fitness_key(fitness, self.objective), kind="stable")
+
+                candidates = [candidates[i] for i in order[:promoted_count]]
+
+    def __evaluate(self, chromosomes: List[AbstractChromosome]):
+
+        if self.__coordinator is None:
+            return super(AbstractRegressionProblem, self).objective_function_batch(chromosomes)
+
+        # the remote workers fit the folds, assigning the fitness and
+        # evaluation time of each chromosome
+        self.__coordinator.evaluate(chromosomes, self.identity)
+
     def log_chromosome(self, chromosome: AbstractChromosome, solver: AbstractSolver, additional_data: Dict[str, Any] = None, separator="|"):
 
         additional_data = OrderedDict({
@@ -164,16 +661,273 @@ class AbstractRegressionProblem(AbstractProblem, metaclass=ABCMeta):
         return super(AbstractRegressionProblem, self).log_chromosome(chromosome, solver, additional_data, separator)
 
 
-def learn(learner, partition, evaluation_function, **kwargs):
-    learner.fit(X=partition.get("x_train"), y=partition.get("y_train"), **kwargs)
-    predictions = list(learner.predict(partition.get("x_test")))
-    return evaluation_function(partition.get("y_test"), predictions)
+"""
+The partitions and scoring function held by a worker process, assigned once
+when the worker starts. The data is retained so that partitions backed by
+shared memory remain attached to it.
+"""
+_worker_partitions: List[Partition] = None
+_worker_data: List[np.ndarray or SharedArray] = None
+_worker_evaluation_function: Callable = None
+_worker_fidelity_parameters: List[str] = []
+
+
+def _initialise_worker(x: np.ndarray or SharedArray, y: np.ndarray or SharedArray,
+                       indices: List[Tuple[np.ndarray, np.ndarray]], evaluation_function: Callable,
+                       fidelity_parameters: List[str] = None):
+    global _worker_partitions, _worker_data, _worker_evaluation_function, _worker_fidelity_parameters
+
+    _worker_data = [x, y]
+
+    x = x.array if isinstance(x, SharedArray) else x
+    y = y.array if isinstance(y, SharedArray) else y
+
+    _worker_partitions = [Partition(x, y, train_index, test_index) for train_index, test_index in indices]
+    _worker_evaluation_function = evaluation_function
+    _worker_fidelity_parameters = fidelity_parameters or []
+
+
+def _cannot_beat(scores: List[np.float64], threshold: float, objective: Objective, confidence: float) -> bool:
+    """ Whether the mean score of every fold cannot beat the threshold given the scores of the completed folds
+
+    The mean of the completed scores is bounded by the one sided confidence
+    interval of the Student's t distribution, at least two scores are required.
+
+    Args:
+        scores (List[np.float64]): The scores of the completed folds
+        threshold (float): The fitness to beat
+        objective (Objective): Whether the scores are maximised or minimised
+        confidence (float): The confidence of the bound
+
+    Returns:
+        bool: True if the bound of the mean score is worse than the threshold
+    """
+    if len(scores) < 2 or threshold is None or np.isnan(threshold):
+        return False
+
+    mean = np.mean(scores)
+    margin = t.ppf(confidence, len(scores) - 1) * np.std(scores, ddof=1) / np.sqrt(len(scores))
+
+    if objective is Objective.Minimisation:
+        return mean - margin > threshold
+
+    return mean + margin < threshold
+
+
+def _fold_cpu_time(timings: Dict[str, Tuple[float, float]]) -> float:
+    """ Sums the CPU time of the folds fitted for a chromosome
+
+    Args:
+        timings (Dict[str, Tuple[float, float]]): The timings of the chromosome, see ChromosomeMeta.timings
+
+    Returns:
+        float: The CPU time in milliseconds
+    """
+    return sum(cpu for stage, (_, cpu) in timings.items() if stage.startswith("fold_"))
+
+
+"""
+The parameters counting the iterations of a learner that training may be
+continued from, keyed by whether the value counts every iteration of the
+fitted learner rather than only the iterations of the next fit
+"""
+_incremental_parameters: Dict[str, bool] = {"n_estimators": True, "max_iter": False}
+
+
+def _continuable(learner) -> bool:
+    """ Whether the training of the learner can be continued once fitted, see _continue_learner
+
+    Args:
+        learner: The learner implementing fit and predict
+
+    Returns:
+        bool: True if the learner supports warm_start or booster continuation
+    """
+    if not hasattr(learner, "get_params"):
+        return False
+
+    parameters: Dict[str, Any] = learner.get_params(deep=False)
+
+    return any(name in parameters for name in _incremental_parameters) and (
+        "warm_start" in parameters or hasattr(learner, "get_booster"))
+
+
+def _incremental_parameter(fitted_parameters: Dict[str, Any], parameters: Dict[str, Any]) -> str or None:
+    """ Finds the incremental parameter that is the only difference between a fitted learner and a learner
+
+    Args:
+        fitted_parameters (Dict[str, Any]): The parameters of the fitted learner
+        parameters (Dict[str, Any]): The parameters of the learner
+
+    Returns:
+        str or None: The name of the parameter the learner increases, None if the training cannot be continued
+    """
+    if set(fitted_parameters) != set(parameters):
+        return None
+
+    changed: List[str] = [
+        name for name, value in parameters.items() if name != "warm_start" and not _equal(fitted_parameters[name], value)
+    ]
+
+    if len(changed) != 1 or changed[0] not in _incremental_parameters:
+        return None
+
+    fitted_value, value = fitted_parameters[changed[0]], parameters[changed[0]]
+
+    if not isinstance(fitted_value, (int, np.integer)) or not isinstance(value, (int, np.integer)):
+        return None
+
+    return changed[0] if value > fitted_value else None
 
 
-def data_object(x_train, y_train, x_test, y_test, dtype=np.float64):
-    return {
-        "x_train": np.array(x_train, dtype=dtype),
-        "y_train": np.array(y_train, dtype=dtype),
-        "x_test": np.array(x_test, dtype=dtype),
-        "y_test": np.array(y_test, dtype=dtype)
-    }
+def _equal(a: Any, b: Any) -> bool:
+    try:
+        return a is b or bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _continue_learner(fitted_learner, learner) -> Tuple[Any, Dict[str, Any], Dict[str, Any]]:
+    """ Prepares a fitted learner to continue training up to the parameters of the learner
+
+    A learner supporting warm_start e.g. a RandomForestRegressor is fitted
+    again with warm_start enabled, whereas the booster of a learner such as an
+    XGBRegressor is passed to the fit of the learner so that only the missing
+    boosting rounds are trained.
+
+    Args:
+        fitted_learner: The fitted learner of the parent, a copy owned by the task, see _copy_fitted_learners
+        learner: The learner to be fitted
+
+    Returns:
+        Tuple[Any, Dict[str, Any], Dict[str, Any]]: The learner to fit, the parameters to restore once fitted and the
+            additional arguments of fit
+    """
+    parameters: Dict[str, Any] = learner.get_params(deep=False)
+    fitted_parameters: Dict[str, Any] = fitted_learner.get_params(deep=False)
+
+    name: str = _incremental_parameter(fitted_parameters, parameters)
+    remaining: int = parameters[name] - fitted_parameters[name]
+
+    if hasattr(fitted_learner, "get_booster"):
+        learner.set_params(**{name: remaining})
+        return learner, {name: parameters[name]}, {"xgb_model": fitted_learner.get_booster()}
+
+    fitted_learner.set_params(**parameters)
+    fitted_learner.set_params(warm_start=True)
+
+    restore: Dict[str, Any] = {"warm_start": parameters["warm_start"]}
+
+    if not _incremental_parameters[name]:
+        fitted_learner.set_params(**{name: remaining})
+        restore[name] = parameters[name]
+
+    return fitted_learner, restore, {}
+
+
+def learn_partition(learner, partition_index: int, fidelity: float = 1.0, **kwargs):
+    """ Fits and scores the learner against one of the partitions held by the worker process
+
+    Below full fidelity the fidelity parameters of the learner are scaled by
+    the fidelity, or if the learner has none of them the learner is trained on
+    the fraction of the training rows of the partition.
+
+    Args:
+        learner: The learner implementing fit and predict
+        partition_index (int): The index of the partition
+        fidelity (float, optional): Defaults to 1.0. The fraction of the full evaluation
+
+    Returns:
+        The score of the predictions, the wall clock and CPU time of the fit and predict, and None in place of the
+        fitted learner, see _learn_retained
+    """
+    partition: Partition = _worker_partitions[partition_index]
+
+    if fidelity < 1.0:
+
+        # the learner is a copy received by the worker so it can be changed
+        budgets: Dict[str, int] = {
+            name: max(1, int(round(value * fidelity))) for name, value in learner.get_params(deep=False).items()
+            if name in _worker_fidelity_parameters and isinstance(value, (int, np.integer))
+        }
+
+        if len(budgets) > 0:
+            learner.set_params(**budgets)
+        else:
+            partition = partition.subsample(fidelity, seed=partition_index)
+
+    timings: Dict[str, Tuple[float, float]] = {}
+
+    score = learn(learner, partition, _worker_evaluation_function, timings=timings, **kwargs)
+
+    return score, timings, None
+
+
+def _learn_retained(learner, partition: Partition, evaluation_function: Callable, fitted_learner=None):
+    """ Fits and scores a learner that may be retained within a thread of the process retaining it
+
+    Given the fitted learner of the parent the training continues from it,
+    see _continue_learner.
+
+    Args:
+        learner: The learner implementing fit and predict, a copy owned by the task
+        partition (Partition): The partition
+        evaluation_function (Callable): The function scoring the predictions
+        fitted_learner (optional): Defaults to None. The learner of the parent fitted against the same partition
+
+    Returns:
+        The score of the predictions, the wall clock and CPU time of the fit and predict, and the fitted learner
+    """
+    restore: Dict[str, Any] = {}
+    kwargs: Dict[str, Any] = {}
+
+    if fitted_learner is not None:
+        learner, restore, kwargs = _continue_learner(fitted_learner, learner)
+
+    timings: Dict[str, Tuple[float, float]] = {}
+
+    score = learn(learner, partition, evaluation_function, timings=timings, process=False, **kwargs)
+
+    if len(restore) > 0:
+        learner.set_params(**restore)
+
+    return score, timings, learner
+
+
+def _copy_fitted_learners(fitted_learners: List[Any]) -> List[Any]:
+    """ Copies the retained learners of a chromosome once so that its folds can continue training them
+
+    The booster of a learner such as an XGBRegressor is copied by fit, other
+    learners are fitted again in place so they are deep copied together,
+    sharing the copy of anything the learners of the folds share.
+
+    Args:
+        fitted_learners (List[Any]): The retained learner of each fold
+
+    Returns:
+        List[Any]: The learners the folds may change
+    """
+    if all(hasattr(fitted_learner, "get_booster") for fitted_learner in fitted_learners):
+        return list(fitted_learners)
+
+    return copy.deepcopy(fitted_learners)
+
+
+def learn(learner, partition, evaluation_function, timings: Dict[str, Tuple[float, float]] = None,
+          process: bool = True, **kwargs):
+
+    # a worker fits one learner at a time, so the CPU time of the process
+    # includes any threads the learner starts, whereas the threads of a
+    # process fitting several learners at once measure their own CPU time
+    with Timer(process=process) as fit_timer:
+        learner.fit(X=partition.get("x_train"), y=partition.get("y_train"), **kwargs)
+
+    with Timer(process=process) as predict_timer:
+        predictions = list(learner.predict(partition.get("x_test")))
+
+    if timings is not None:
+        timings["fit"] = (fit_timer.wall, fit_timer.cpu)
+        timings["predict"] = (predict_timer.wall, predict_timer.cpu)
+
+    return evaluation_function(partition.get("y_test"), predictions)
+
@@ -0,0 +1,115 @@
+import threading
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from opticverge.core.enum.objective import Objective
+from opticverge.core.strategy.selection import fitness_key
+
+
+class ModelStore(object):
+    """ Retains the fitted learner of every fold of the fittest chromosomes
+
+    The mutants of a retained chromosome that only increase the number of
+    iterations of its learner e.g. n_estimators continue training the fitted
+    learners rather than training from scratch, see
+    AbstractRegressionProblem.objective_function.
+
+    The store holds at most capacity chromosomes, once full a chromosome is
+    only retained in place of the least fit chromosome it beats.
+    """
+
+    def __init__(self, objective: Objective, capacity: int = 8):
+        """ The constructor for this class
+
+        Args:
+            objective (Objective): Whether the problem is maximising or minimising the fitness
+            capacity (int, optional): Defaults to 8. The number of chromosomes whose fitted learners are retained
+        """
+        self.__objective = objective
+        self.__capacity = capacity
+        self.__lock = threading.Lock()
+
+        """
+        The fitness, parameters of the learner and fitted learner of each fold
+        of the retained chromosomes keyed by their id
+        """
+        self.__entries: Dict[str, Tuple[float, Dict[str, Any], List[Any]]] = {}
+
+    def __getstate__(self):
+        # the fitted learners are only reused by the process that fitted them
+        state = self.__dict__.copy()
+        del state["_ModelStore__lock"]
+        state["_ModelStore__entries"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, chromosome_id: str) -> bool:
+        return chromosome_id in self.__entries
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def get(self, chromosome_id: str) -> Tuple[Dict[str, Any], List[Any]] or None:
+        """Get the parameters and fitted learners of a retained chromosome
+
+        Args:
+            chromosome_id (str): The id of the chromosome e.g. the parent of a mutant
+
+        Returns:
+            Tuple[Dict[str, Any], List[Any]] or None: The parameters of the learner and the fitted learner of each
+                fold, None if the chromosome is not retained
+        """
+        entry = self.__entries.get(chromosome_id)
+
+        return None if entry is None else entry[1:]
+
+    def put(self, chromosome_id: str, fitness: float, parameters: Dict[str, Any], learners: List[Any]) -> bool:
+        """Retains the fitted learners of a chromosome if it is among the fittest chromosomes
+
+        Args:
+            chromosome_id (str): The id of the chromosome
+            fitness (float): The fitness of the chromosome
+            parameters (Dict[str, Any]): The parameters of the learner, see get_params
+            learners (List[Any]): The fitted learner of each fold
+
+        Returns:
+            bool: True if the learners were retained
+        """
+        if self.__capacity < 1 or fitness is None or np.isnan(fitness):
+            return False
+
+        with self.__lock:
+
+            if chromosome_id not in self.__entries and len(self.__entries) >= self.__capacity:
+
+                ids: List[str] = list(self.__entries)
+                keys: np.ndarray = fitness_key(
+                    np.array([self.__entries[i][0] for i in ids] + [fitness], dtype=np.float64),
+                    self.__objective
+                )
+
+                worst: int = int(np.argmax(keys))
+
+                # the chromosome is the least fit, so nothing is replaced
+                if worst == len(ids):
+                    return False
+
+                del self.__entries[ids[worst]]
+
+            self.__entries[chromosome_id] = (float(fitness), parameters, learners)
+
+        return True
+
+    def clear(self):
+        """Discards every retained learner
+        """
+        with self.__lock:
+            self.__entries.clear()
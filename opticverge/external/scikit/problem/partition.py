@@ -0,0 +1,83 @@
+from typing import Any
+
+import numpy as np
+
+
+class Partition(object):
+    """ A fold of the data represented by the indices of its training and test rows
+
+    The partition holds references to the single buffer of the data rather than
+    copies, the rows of each fold are only gathered when a learner requests
+    them.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, train_index: np.ndarray, test_index: np.ndarray):
+        """ The constructor for this class
+
+        Args:
+            x (np.ndarray): The features of the data
+            y (np.ndarray): The target variable of the data
+            train_index (np.ndarray): The rows of the data used for training
+            test_index (np.ndarray): The rows of the data used for testing
+        """
+        self.__x = x
+        self.__y = y
+        self.__train_index = train_index
+        self.__test_index = test_index
+
+    @property
+    def train_index(self) -> np.ndarray:
+        return self.__train_index
+
+    @property
+    def test_index(self) -> np.ndarray:
+        return self.__test_index
+
+    @property
+    def x_train(self) -> np.ndarray:
+        return np.take(self.__x, self.__train_index, axis=0)
+
+    @property
+    def y_train(self) -> np.ndarray:
+        return np.take(self.__y, self.__train_index, axis=0)
+
+    @property
+    def x_test(self) -> np.ndarray:
+        return np.take(self.__x, self.__test_index, axis=0)
+
+    @property
+    def y_test(self) -> np.ndarray:
+        return np.take(self.__y, self.__test_index, axis=0)
+
+    def subsample(self, fraction: float, seed: int = 0):
+        """Creates a partition that trains on a fraction of the training rows, the test rows are unchanged
+
+        The same fraction and seed always select the same rows so that
+        learners evaluated on the subsample are compared fairly.
+
+        Args:
+            fraction (float): The fraction of the training rows
+            seed (int, optional): Defaults to 0. The seed selecting the rows
+
+        Returns:
+            Partition: The subsampled partition, this partition if the fraction is not less than 1
+        """
+        if fraction >= 1.0:
+            return self
+
+        size: int = max(1, int(np.ceil(fraction * len(self.__train_index))))
+
+        rows: np.ndarray = np.sort(np.random.default_rng(seed).choice(len(self.__train_index), size, replace=False))
+
+        return Partition(self.__x, self.__y, self.__train_index[rows], self.__test_index)
+
+    def get(self, key: str) -> Any:
+        """Gathers the rows of the fold by name e.g. x_train, y_train, x_test or y_test
+
+        Args:
+            key (str): The name of the rows to gather
+
+        Returns:
+            np.ndarray: The gathered rows
+        """
+        return getattr(self, key)
@@ -5,6 +5,7 @@ from typing import List
 import numpy as np
 
 from opticverge.core.chromosome.array_chromosome import RandArrayChromosome
+from opticverge.core.chromosome.class_chromosome import ClassChromosome
 from opticverge.core.chromosome.distribution.int_distribution_chromosome import RandIntChromosome
 from opticverge.core.generator.int_distribution_generator import rand_poisson
 
@@ -28,6 +29,120 @@ class TestHelpers(unittest.TestCase):
         actual = len(result)
         self.assertTrue(actual == expected)
 
+    def test_clone_copies_nested_chromosome_on_write(self):
+
+        # GIVEN
+        chromosome = ClassChromosome(dict, OrderedDict({
+            "estimator": ClassChromosome(dict, OrderedDict({"depth": RandIntChromosome(0, 1000)})),
+            "size": RandIntChromosome(0, 1000)
+        }))
+        chromosome.generate()
+
+        nested = chromosome.blueprint["estimator"]
+        genotype = dict(chromosome.genotype)
+        nested_genotype = dict(nested.genotype)
+
+        # WHEN
+        clone = chromosome.clone()
+        clone.mutate(1.0)
+
+        # THEN
+        self.assertIsNot(clone.blueprint["estimator"], nested)
+        self.assertIs(clone.blueprint["size"], chromosome.blueprint["size"])
+        self.assertEqual(dict(chromosome.genotype), genotype)
+        self.assertEqual(dict(nested.genotype), nested_genotype)
+        self.assertEqual(clone.phenotype["estimator"], clone.blueprint["estimator"].phenotype)
+
+    def test_clone_copies_mutable_values_of_the_genotype(self):
+
+        # GIVEN
+        chromosome = ClassChromosome(dict, OrderedDict({
+            "values": RandArrayChromosome(RandIntChromosome(0, 1000), length=5, fixed=True)
+        }))
+        chromosome.generate()
+
+        values = list(chromosome.genotype["values"])
+
+        # WHEN
+        clone = chromosome.clone()
+        clone.genotype["values"].append(-1)
+
+        # THEN
+        self.assertEqual(chromosome.genotype["values"], values)
+        self.assertEqual(clone.genotype["values"], values + [-1])
+
+    def test_array_clones_its_generator_only_when_shared(self):
+
+        # GIVEN
+        chromosome = RandArrayChromosome(
+            RandArrayChromosome(RandIntChromosome(0, 1000), length=3, fixed=True),
+            length=4,
+            fixed=True
+        )
+        chromosome.generate()
+
+        generator = chromosome.generator
+
+        # WHEN
+        chromosome.mutate(1.0)
+        owned = chromosome.generator
+
+        clone = chromosome.clone()
+        clone.mutate(1.0)
+
+        # THEN
+        self.assertIs(owned, generator)
+        self.assertIsNot(clone.generator, generator)
+        self.assertIs(chromosome.generator, generator)
+
+    def test_generate_and_mutate_batch(self):
+
+        # GIVEN
+        chromosome = ClassChromosome(dict, OrderedDict({
+            "estimator": ClassChromosome(dict, OrderedDict({"depth": RandIntChromosome(0, 1000)})),
+            "size": RandIntChromosome(0, 1000)
+        }))
+
+        # WHEN
+        generated = chromosome.generate_batch(20)
+        genotype = dict(generated[0].genotype)
+        mutated = generated[0].mutate_batch(1.0, 5)
+
+        # THEN
+        self.assertEqual(len(generated), 20)
+        self.assertTrue(all(0 <= c.phenotype["size"] < 1000 for c in generated))
+        self.assertTrue(all(0 <= c.phenotype["estimator"]["depth"] < 1000 for c in generated))
+        self.assertEqual(len(mutated), 5)
+        self.assertEqual(dict(generated[0].genotype), genotype)
+        self.assertTrue(all(c.phenotype == dict(c.genotype) for c in mutated))
+
+    def test_phenotype_is_constructed_on_access(self):
+
+        # GIVEN
+        constructed: List[dict] = []
+
+        def constructor(**kwargs):
+            constructed.append(kwargs)
+            return kwargs
+
+        chromosome = ClassChromosome(constructor, OrderedDict({"size": RandIntChromosome(0, 1000)}))
+        chromosome.generate_genotype()
+        chromosome.generate()
+        count = len(constructed)
+
+        # WHEN
+        clones = [chromosome.clone() for _ in range(5)]
+
+        for clone in clones:
+            clone.mutate(1.0)
+
+        # THEN
+        self.assertEqual(len(constructed), count)
+        self.assertEqual(clones[0].phenotype, dict(clones[0].genotype))
+        self.assertEqual(len(constructed), count + 1)
+        self.assertIs(clones[0].phenotype, clones[0].phenotype)
+        self.assertEqual(len(constructed), count + 1)
+
 
 def run_test():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
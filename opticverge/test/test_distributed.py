@@ -0,0 +1,170 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import OrderedDict
+
+from sklearn.ensemble import BaggingRegressor
+
+from opticverge.core.chromosome.class_chromosome import ClassChromosome
+from opticverge.core.distributed.coordinator import Coordinator
+from opticverge.core.distributed.payload import decode_task, encode_task
+from opticverge.core.distributed.transport import FileTransport
+from opticverge.core.distributed.worker import Worker
+from opticverge.examples.optimisation.one_max.chromosome import OneMaxChromosome
+from opticverge.examples.optimisation.one_max.problem import OneMaxProblem
+from opticverge.external.scikit.chromosome.regression.tree import DecisionTreeRegressorChromosome
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_coordinator_evaluates_on_workers(self):
+
+        # GIVEN
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FileTransport(directory)
+            workers = [Worker(transport, OneMaxProblem(), OneMaxChromosome(dimensions=10)) for _ in range(2)]
+            threads = [threading.Thread(target=worker.run, kwargs={"idle_timeout": 5}) for worker in workers]
+
+            chromosomes = [OneMaxChromosome(dimensions=10) for _ in range(6)]
+            for chromosome in chromosomes:
+                chromosome.generate()
+
+            for thread in threads:
+                thread.start()
+
+            # WHEN
+            Coordinator(transport, timeout=30).evaluate(chromosomes)
+
+            for worker, thread in zip(workers, threads):
+                worker.stop()
+                thread.join()
+
+        # THEN
+        for chromosome in chromosomes:
+            self.assertTrue(chromosome.meta.evaluated)
+            self.assertEqual(chromosome.fitness, sum(chromosome.phenotype))
+            self.assertIsNotNone(chromosome.meta.evaluation_time)
+
+    def test_timings_of_the_worker_are_merged_once(self):
+
+        # GIVEN
+        class TimedProblem(OneMaxProblem):
+
+            def evaluate(self, chromosome):
+                self.objective_function(chromosome)
+                chromosome.meta.record_time("evaluation", 5.0, 3.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FileTransport(directory)
+            worker = Worker(transport, TimedProblem(), OneMaxChromosome(dimensions=10))
+            thread = threading.Thread(target=worker.run, kwargs={"max_tasks": 1, "idle_timeout": 5})
+
+            chromosome = OneMaxChromosome(dimensions=10)
+            chromosome.generate()
+            chromosome.meta.record_time("mutation", 1.0, 1.0)
+
+            thread.start()
+
+            # WHEN
+            Coordinator(transport, poll_interval=0.01, timeout=30).evaluate([chromosome])
+            thread.join()
+
+        # THEN
+        self.assertEqual(chromosome.meta.timings, {"mutation": (1.0, 1.0), "evaluation": (5.0, 3.0)})
+        self.assertEqual(chromosome.meta.evaluation_time, 5)
+        self.assertEqual(chromosome.meta.cpu_time, 3)
+
+    def test_expired_lease_is_requeued(self):
+
+        # GIVEN
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FileTransport(directory)
+            transport.put_task("task", b"payload")
+            transport.get_task("lost-worker")
+
+            expired = time.time() - 120
+            os.utime(os.path.join(directory, "leased", "task@lost-worker"), (expired, expired))
+
+            # WHEN
+            requeued = transport.requeue_expired(lease_timeout=60)
+
+            # THEN
+            self.assertEqual(requeued, ["task"])
+            self.assertEqual(transport.get_task("worker"), ("task", b"payload"))
+
+    def test_result_of_a_requeued_task_is_discarded(self):
+
+        # GIVEN
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FileTransport(directory)
+            transport.put_task("task", b"payload")
+            transport.get_task("lost-worker")
+
+            expired = time.time() - 120
+            os.utime(os.path.join(directory, "leased", "task@lost-worker"), (expired, expired))
+            transport.requeue_expired(lease_timeout=60)
+
+            # WHEN
+            returned = transport.put_result("task", "lost-worker", b"result")
+
+            # THEN
+            self.assertFalse(returned)
+            self.assertIsNone(transport.get_result("task"))
+            self.assertEqual(os.listdir(os.path.join(directory, "results")), [])
+
+    def test_timed_out_chromosomes_fail(self):
+
+        # GIVEN
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FileTransport(directory)
+
+            chromosomes = [OneMaxChromosome(dimensions=10) for _ in range(2)]
+            for chromosome in chromosomes:
+                chromosome.generate()
+
+            # WHEN
+            Coordinator(transport, poll_interval=0.01, timeout=0.05).evaluate(chromosomes)
+
+            # THEN
+            for chromosome in chromosomes:
+                self.assertTrue(chromosome.meta.evaluated)
+                self.assertIsNone(chromosome.fitness)
+
+            self.assertEqual(os.listdir(os.path.join(directory, "tasks")), [])
+
+    def test_task_is_rebuilt_from_the_blueprint_of_the_worker(self):
+
+        # GIVEN
+        def create_chromosome():
+            return ClassChromosome(BaggingRegressor, OrderedDict({"estimator": DecisionTreeRegressorChromosome()}))
+
+        chromosome = create_chromosome()
+        chromosome.generate()
+        chromosome.meta.threshold = 1.5
+
+        # WHEN
+        rebuilt, identity = decode_task(encode_task(chromosome, "problem"), create_chromosome())
+
+        # THEN
+        self.assertEqual(identity, "problem")
+        self.assertEqual(rebuilt.id, chromosome.id)
+        self.assertEqual(rebuilt.meta.threshold, 1.5)
+        self.assertIsInstance(rebuilt.phenotype, BaggingRegressor)
+        self.assertEqual(
+            rebuilt.phenotype.estimator.get_params(), chromosome.phenotype.estimator.get_params()
+        )
+
+        # the id derived from the rebuilt genotype matches as well
+        rebuilt.meta.id = None
+        self.assertEqual(rebuilt.id, chromosome.id)
+
+
+def run_test():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
+    unittest.TextTestRunner().run(suite)
+
+
+if __name__ == "__main__":
+    run_test()
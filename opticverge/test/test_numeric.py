@@ -1,6 +1,25 @@
+import datetime
+import os
+import pickle
+import subprocess
+import sys
+import threading
 import unittest
+from collections import OrderedDict
+
+import numpy as np
 
 from opticverge.core.generator.int_distribution_generator import rand_poisson
+from opticverge.core.generator.real_generator import rand_real
+from opticverge.core.generator.sampler import Sampler, get_sampler, set_sampler
+from opticverge.core.enum.objective import Objective
+from opticverge.core.meta.chromosome_index import ChromosomeIndex
+from opticverge.core.numeric.safe import safe_array, safe_value
+from opticverge.core.util.encoding import encode, encode_array
+from opticverge.core.util.shared_array import SharedArray
+from opticverge.external.scikit.problem.abstract_regression_problem import _cannot_beat, _incremental_parameter
+from opticverge.external.scikit.problem.model_store import ModelStore
+from opticverge.external.scikit.problem.partition import Partition
 
 
 class TestHelpers(unittest.TestCase):
@@ -50,6 +69,240 @@ class TestHelpers(unittest.TestCase):
 
         self.assertTrue(expected == actual, message)
 
+    def test_safe_array_matches_safe_value(self):
+
+        # GIVEN
+        values = np.array([-12.5, -5.0, -1.0, 0.0, 3.25, 5.0, 7.5, 25.0])
+        min_val = -5.0
+        max_val = 5.0
+        rounding = 2
+
+        # WHEN
+        actual = safe_array(values, min_val, max_val, rounding, np.float64)
+
+        # THEN
+        expected = np.array([safe_value(value, min_val, max_val, rounding, np.float64) for value in values])
+        self.assertTrue(np.allclose(actual, expected))
+
+    def test_seeded_sampler_is_reproducible(self):
+
+        # GIVEN
+        previous = get_sampler()
+        seed = 7
+
+        # WHEN
+        samples = []
+        for _ in range(2):
+            set_sampler(Sampler(seed, buffer_size=64))
+            samples.append([rand_real() for _ in range(100)] + [rand_poisson(10) for _ in range(100)])
+
+        set_sampler(previous)
+
+        # THEN
+        self.assertEqual(samples[0], samples[1])
+
+    def test_racing_bound(self):
+
+        # GIVEN
+        scores = [10.0, 11.0, 10.5]
+
+        # WHEN
+        hopeless = _cannot_beat(scores, 5.0, Objective.Minimisation, 0.95)
+        promising = _cannot_beat(scores, 10.4, Objective.Minimisation, 0.95)
+        maximising = _cannot_beat(scores, 20.0, Objective.Maximisation, 0.95)
+        single = _cannot_beat(scores[:1], 5.0, Objective.Minimisation, 0.95)
+
+        # THEN
+        self.assertTrue(hopeless)
+        self.assertFalse(promising)
+        self.assertTrue(maximising)
+        self.assertFalse(single)
+
+    def test_partition_subsample(self):
+
+        # GIVEN
+        x = np.arange(200, dtype=np.float64).reshape(100, 2)
+        y = np.arange(100, dtype=np.float64)
+        partition = Partition(x, y, np.arange(80), np.arange(80, 100))
+
+        # WHEN
+        subsample = partition.subsample(0.25, seed=3)
+        repeated = partition.subsample(0.25, seed=3)
+
+        # THEN
+        self.assertEqual(len(subsample.train_index), 20)
+        self.assertTrue(np.array_equal(subsample.train_index, repeated.train_index))
+        self.assertTrue(np.array_equal(subsample.test_index, partition.test_index))
+        self.assertIs(partition.subsample(1.0), partition)
+
+    def test_model_store_retains_fittest(self):
+
+        # GIVEN
+        store = ModelStore(Objective.Minimisation, capacity=2)
+        parameters = {"n_estimators": 100, "max_depth": 3, "warm_start": False}
+
+        # WHEN
+        store.put("a", 3.0, parameters, ["a"])
+        store.put("b", 1.0, parameters, ["b"])
+        replaced = store.put("c", 2.0, parameters, ["c"])
+        rejected = store.put("d", 4.0, parameters, ["d"])
+
+        # THEN
+        self.assertTrue(replaced)
+        self.assertFalse(rejected)
+        self.assertEqual(store.get("c"), (parameters, ["c"]))
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(_incremental_parameter(parameters, {**parameters, "n_estimators": 150}), "n_estimators")
+        self.assertIsNone(_incremental_parameter(parameters, {**parameters, "n_estimators": 50}))
+        self.assertIsNone(_incremental_parameter(parameters, {**parameters, "n_estimators": 150, "max_depth": 4}))
+
+
+    def test_chromosome_index(self):
+
+        # GIVEN
+        exact = ChromosomeIndex(capacity=4)
+        bloom = ChromosomeIndex(capacity=100, false_positive_rate=0.01)
+        ids = ["{:016x}".format(i * 7919 + 1) for i in range(100)]
+
+        # WHEN
+        for i, chromosome_id in enumerate(ids):
+            exact.add(chromosome_id, float(i))
+            exact.add(chromosome_id, float(i))
+            bloom.add(chromosome_id)
+            bloom.add(chromosome_id)
+
+        # THEN
+        self.assertEqual(len(exact), 100)
+        self.assertEqual(len(bloom), 100)
+        self.assertTrue(all(chromosome_id in exact and chromosome_id in bloom for chromosome_id in ids))
+        self.assertEqual([exact.get(chromosome_id) for chromosome_id in ids], [float(i) for i in range(100)])
+        self.assertNotIn("ffffffffffffffff", exact)
+        self.assertIsNone(exact.get("ffffffffffffffff"))
+
+    def test_chromosome_index_is_read_whilst_resizing(self):
+
+        # GIVEN
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+
+        index = ChromosomeIndex(capacity=4)
+        added = ["{:016x}".format(i + 1) for i in range(64)]
+        for chromosome_id in added:
+            index.add(chromosome_id)
+
+        missing = []
+        finished = threading.Event()
+
+        def read():
+            while not finished.is_set():
+                missing.extend(chromosome_id for chromosome_id in added if chromosome_id not in index)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+
+        # WHEN
+        for i in range(64, 20000):
+            index.add("{:016x}".format(i + 1))
+
+        finished.set()
+        reader.join()
+
+        # THEN
+        self.assertEqual(missing, [])
+
+    def test_equal_numbers_share_an_encoding(self):
+
+        # GIVEN
+        values = [1, np.int8(1), np.int64(1), np.uint16(1)]
+        arrays = [np.array([1, 2], dtype=dtype) for dtype in [np.int8, np.int64, np.uint8]]
+
+        # WHEN
+        encodings = {encode(value) for value in values}
+        array_encodings = {encode_array(array) for array in arrays}
+        genotype_encodings = {encode(OrderedDict({"depth": value})) for value in values}
+
+        # THEN
+        self.assertEqual(len(encodings), 1)
+        self.assertEqual(len(array_encodings), 1)
+        self.assertEqual(len(genotype_encodings), 1)
+        self.assertNotEqual(encode(1), encode(1.0))
+        self.assertEqual(encode(np.float32(0.5)), encode(0.5))
+        self.assertEqual(encode_array(np.array([1.0, 2.0])), encode_array(np.array([1.0, 2.0], dtype=np.float32)))
+
+    def test_objects_are_encoded_by_their_state(self):
+
+        # GIVEN
+        class Kernel(object):
+
+            def __init__(self, scale):
+                self.scale = scale
+
+        # WHEN
+        same = {encode(Kernel(0.5)), encode(Kernel(0.5))}
+        different = encode(Kernel(2.0))
+
+        # THEN
+        self.assertEqual(len(same), 1)
+        self.assertNotIn(different, same)
+        self.assertNotEqual(encode(datetime.date(2020, 1, 1)), encode(datetime.date(2020, 1, 2)))
+
+        with self.assertRaises(TypeError):
+            encode(threading.Lock())
+
+    def test_encoding_is_identical_across_processes(self):
+
+        # GIVEN
+        genotype = "OrderedDict({'depth': np.int8(3), 'rate': 0.25, 'name': 'tree', 'tags': {'a', 'b', 'c', 'd'}, " \
+                   "'objective': Objective.Minimisation, 'weights': np.arange(4.0), 'missing': float('nan')})"
+        script = "import sys; from collections import OrderedDict; import numpy as np; " \
+                 "from opticverge.core.enum.objective import Objective; " \
+                 "from opticverge.core.util.encoding import encode; print(encode({}).hex())".format(genotype)
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        # WHEN
+        encodings = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env={**os.environ, "PYTHONPATH": root, "PYTHONHASHSEED": str(seed)},
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+            for seed in range(4)
+        }
+
+        # THEN
+        self.assertEqual(encodings, {encode(eval(genotype)).hex()})
+
+    def test_shared_array_outlives_the_processes_attached_to_it(self):
+
+        # GIVEN
+        shared = SharedArray.from_array(np.arange(6, dtype=np.float64).reshape(2, 3))
+        name = shared.name
+
+        # a process started outside of multiprocessing has its own resource
+        # tracker, which must not destroy the block when the process exits
+        script = "import pickle, sys; a = pickle.loads(bytes.fromhex(sys.argv[1])); print(a.array.sum()); a.close()"
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        # WHEN
+        output = subprocess.run(
+            [sys.executable, "-c", script, pickle.dumps(shared).hex()],
+            env={**os.environ, "PYTHONPATH": root}, capture_output=True, text=True, check=True
+        )
+
+        attached = SharedArray((2, 3), np.float64, name)
+        values = attached.array.copy()
+        attached.close()
+
+        shared.unlink()
+
+        # THEN
+        self.assertEqual(output.stdout.strip(), "15.0")
+        self.assertNotIn("leaked", output.stderr)
+        np.testing.assert_array_equal(values, np.arange(6, dtype=np.float64).reshape(2, 3))
+
+        with self.assertRaises(FileNotFoundError):
+            SharedArray((2, 3), np.float64, name)
+
 
 def run_test():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
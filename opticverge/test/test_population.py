@@ -0,0 +1,142 @@
+import queue
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+import numpy as np
+
+from opticverge.core.chromosome.array_chromosome import RandArrayChromosome
+from opticverge.core.chromosome.distribution.int_distribution_chromosome import RandIntChromosome
+from opticverge.core.chromosome.distribution.real_distribution_chromosome import RandGaussChromosome
+from opticverge.core.enum.objective import Objective
+from opticverge.core.enum.policy import Policy
+from opticverge.core.population.array_population import ArrayPopulation
+from opticverge.core.solver.array_ais import ArrayAIS
+from opticverge.core.solver.generic_ais import AIS
+from opticverge.core.strategy.migration import Migration
+from opticverge.core.strategy.selection import elitist_array_selection
+from opticverge.examples.optimisation.rastrigin.chromosome import RastriginChromosome
+from opticverge.examples.optimisation.rastrigin.problem import RastriginProblem, rastrigin
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_array_population_generate_within_bounds(self):
+
+        # GIVEN
+        population = ArrayPopulation(
+            RandArrayChromosome(
+                RandGaussChromosome(value=2.5, min_val=-5.12, max_val=5.12, rounding=2, output_dtype=np.float64),
+                length=20,
+                fixed=True
+            ),
+            Objective.Minimisation
+        )
+
+        # WHEN
+        genes = population.mutate(population.generate(50), np.full(50, 0.5))
+
+        # THEN
+        self.assertEqual(genes.shape, (50, 20))
+        self.assertTrue(np.all(genes >= -5.12) and np.all(genes <= 5.12))
+
+    def test_elitist_array_selection(self):
+
+        # GIVEN
+        fitness = np.array([1.0, 5.0, np.nan])
+        mutated_fitness = np.array([2.0, 0.5, 4.0, 6.0, 3.0])
+        parents = np.array([0, 0, 1, 1, 2])
+
+        # WHEN
+        actual = elitist_array_selection(fitness, mutated_fitness, parents, Objective.Minimisation)
+
+        # THEN
+        expected = [1, 2, 4]
+        self.assertEqual(list(actual), expected)
+
+    def test_row_id_matches_chromosome_id(self):
+
+        # GIVEN
+        chromosome = RandArrayChromosome(
+            RandGaussChromosome(value=2.5, min_val=-5.12, max_val=5.12, rounding=2, output_dtype=np.float64),
+            length=20,
+            fixed=True
+        )
+        chromosome.generate()
+
+        population = ArrayPopulation(chromosome, Objective.Minimisation)
+
+        # WHEN
+        actual = population.identify(np.asarray(chromosome.phenotype)[np.newaxis, :])[0]
+
+        # THEN
+        self.assertEqual(actual, chromosome.id)
+
+    def test_view_derives_the_id_of_its_row(self):
+
+        # GIVEN
+        population = ArrayPopulation(RastriginChromosome(dimensions=5), Objective.Minimisation)
+        genes = population.generate(3)
+
+        # WHEN
+        views = [population.view(row) for row in genes]
+
+        # THEN
+        self.assertEqual([view.id for view in views], population.identify(genes))
+
+    def test_ids_match_between_ais_and_array_ais(self):
+
+        # GIVEN
+        policies = [Policy.EnforceUniqueChromosome]
+        solver = ArrayAIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 2, policies)
+        solver.run()
+
+        integers = RandArrayChromosome(RandIntChromosome(0, 100), length=6, fixed=True)
+        integers.generate()
+
+        # WHEN
+        chromosomes = [
+            AIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 2, policies).chromosome.derive(
+                OrderedDict(enumerate(row.tolist()))
+            )
+            for row in solver.array_population.genes
+        ]
+
+        rows = np.asarray([integers.phenotype], dtype=np.int8)
+
+        # THEN
+        self.assertTrue(all(chromosome.id in solver.meta.chromosome_index for chromosome in chromosomes))
+        self.assertEqual(ArrayPopulation(integers, Objective.Minimisation).identify(rows)[0], integers.id)
+
+    def test_array_problem_evaluates_the_matrix(self):
+
+        # GIVEN
+        solver = ArrayAIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 2, [])
+        solver.migration = Migration(queue.Queue(), queue.Queue(), interval=1, size=2)
+
+        # WHEN
+        with mock.patch.object(ArrayPopulation, "view") as view, \
+                mock.patch.object(ArrayPopulation, "identify") as identify, \
+                mock.patch.object(ArrayPopulation, "to_chromosomes") as to_chromosomes:
+            best = solver.run()
+
+        # THEN
+        self.assertEqual(solver.generation, 2)
+        view.assert_not_called()
+        identify.assert_not_called()
+        to_chromosomes.assert_not_called()
+
+        population = solver.array_population
+        np.testing.assert_allclose(population.fitness, rastrigin(population.genes))
+        self.assertEqual(best.fitness, np.min(population.fitness))
+
+        self.assertNotIn("population", solver.get_state())
+
+
+def run_test():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
+    unittest.TextTestRunner().run(suite)
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,211 @@
+import importlib.util
+import threading
+import unittest
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import numpy as np
+from sklearn import datasets
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import LinearRegression
+
+from opticverge.core.chromosome.class_chromosome import ClassChromosome
+from opticverge.core.enum.objective import Objective
+from opticverge.core.problem.abstract_problem import AbstractProblem
+from opticverge.core.solver.generic_ais import AIS
+from opticverge.examples.machine_learning.regression.diabetes.problem import DiabetesPredictionProblem
+from opticverge.examples.optimisation.rastrigin.chromosome import RastriginChromosome
+from opticverge.examples.optimisation.rastrigin.problem import RastriginProblem
+from opticverge.external.scikit.enum.scoring_function import Scoring
+from opticverge.external.scikit.problem import abstract_regression_problem
+from opticverge.external.scikit.problem.abstract_regression_problem import AbstractRegressionProblem
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_threads_share_one_worker_pool(self):
+
+        # GIVEN
+        problem = DiabetesPredictionProblem(Scoring.MeanSquaredError, folds=3)
+        problem.log_chromosome = lambda *args, **kwargs: None
+
+        chromosomes = [ClassChromosome(LinearRegression, OrderedDict()) for _ in range(8)]
+        for chromosome in chromosomes:
+            chromosome.generate()
+
+        executors = []
+
+        def create_executor(*args, **kwargs):
+            executors.append(ProcessPoolExecutor(*args, **kwargs))
+            return executors[-1]
+
+        barrier = threading.Barrier(4)
+
+        def evaluate(batch):
+            barrier.wait()
+            problem.objective_function_batch(batch)
+
+        threads = [threading.Thread(target=evaluate, args=(chromosomes[i::4],)) for i in range(4)]
+
+        # WHEN
+        with mock.patch.object(abstract_regression_problem, "ProcessPoolExecutor", side_effect=create_executor):
+            try:
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+            finally:
+                problem.shutdown()
+
+        # THEN
+        self.assertEqual(len(executors), 1)
+        self.assertTrue(all(chromosome.fitness is not None for chromosome in chromosomes))
+        self.assertEqual(len(set(chromosome.fitness for chromosome in chromosomes)), 1)
+
+    def test_identity_and_partitions_follow_the_data_and_seed(self):
+
+        # GIVEN
+        data = [[float(i), float(i % 7)] for i in range(50)]
+        target = [float(i % 5) for i in range(50)]
+
+        def create_problem(data_x, target_x, seed=0):
+            return AbstractRegressionProblem(
+                Objective.Minimisation, "Regression", data_x, target_x, Scoring.MeanSquaredError, folds=5, seed=seed
+            )
+
+        # WHEN
+        problem = create_problem(data, target)
+        array_problem = create_problem(np.array(data, dtype=np.float32), np.array(target))
+        object_problem = create_problem(np.array(data, dtype=object), np.array(target, dtype=object))
+        reseeded_problem = create_problem(data, target, seed=1)
+
+        # THEN
+        self.assertEqual(problem.identity, array_problem.identity)
+        self.assertEqual(problem.identity, create_problem(data, target).identity)
+        self.assertNotEqual(problem.identity, reseeded_problem.identity)
+        # arrays of objects are hashed by their values rather than the pointers to them
+        self.assertEqual(object_problem.identity, create_problem(
+            np.array(data, dtype=object) + 0.0, np.array(target, dtype=object) + 0.0
+        ).identity)
+
+        folds = [partition.test_index.tolist() for partition in problem.partitions]
+
+        self.assertEqual(folds, [partition.test_index.tolist() for partition in array_problem.partitions])
+        self.assertNotEqual(folds, [partition.test_index.tolist() for partition in reseeded_problem.partitions])
+
+    def test_timings_are_logged_after_the_existing_columns(self):
+
+        # GIVEN
+        solver = AIS(RastriginChromosome(dimensions=2), RastriginProblem(), 2, 1, [])
+
+        chromosome = solver.generate_chromosomes(1)[0]
+        solver.problem.evaluate(chromosome)
+
+        # WHEN
+        columns = AbstractProblem.log_chromosome(solver.problem, chromosome, solver, OrderedDict({"folds": 3}))
+
+        # THEN
+        columns = columns.split("|")
+
+        self.assertEqual(columns[3:7], [str(chromosome.fitness), "0", str(chromosome.meta.id), "None"])
+        self.assertEqual(columns[8], "3")
+        self.assertEqual(columns[9:11], [str(chromosome.meta.evaluation_time), str(chromosome.meta.cpu_time)])
+        self.assertEqual(len(columns), 12)
+        self.assertIn("evaluation=", columns[11])
+
+    def test_warm_start_continues_gradient_boosting_in_this_process(self):
+        self.assert_warm_start_continues(GradientBoostingRegressor)
+
+    @unittest.skipIf(importlib.util.find_spec("xgboost") is None, "xgboost is not installed")
+    def test_warm_start_continues_xgboost_in_this_process(self):
+        from xgboost import XGBRegressor
+
+        self.assert_warm_start_continues(XGBRegressor)
+
+    def test_warm_start_fits_in_the_pool_once_the_store_is_full(self):
+
+        # GIVEN
+        dataset = datasets.load_diabetes()
+
+        problem = AbstractRegressionProblem(
+            Objective.Minimisation, "Regression", dataset.get("data"), dataset.get("target"),
+            Scoring.MeanSquaredError, folds=3, warm_start=True, warm_start_capacity=1
+        )
+        self.addCleanup(problem.shutdown)
+
+        chromosomes = []
+        for n_estimators in [5, 7, 10]:
+            chromosome = ClassChromosome(
+                GradientBoostingRegressor, OrderedDict(), {"n_estimators": n_estimators, "random_state": 0}
+            )
+            chromosome.generate()
+            chromosomes.append(chromosome)
+
+        retained, unrelated, child = chromosomes
+        child.meta.parent_id = retained.id
+
+        calls = []
+
+        # WHEN
+        # the mock only records the fits made by this process
+        with mock.patch.object(abstract_regression_problem, "_learn_retained",
+                               wraps=abstract_regression_problem._learn_retained) as learn_retained:
+            for chromosome in chromosomes:
+                problem.objective_function(chromosome)
+                calls.append(learn_retained.call_count)
+
+        # THEN
+        self.assertEqual(calls, [3, 3, 6])
+        self.assertTrue(all(chromosome.fitness is not None for chromosome in chromosomes))
+
+    def assert_warm_start_continues(self, constructor):
+
+        # GIVEN
+        dataset = datasets.load_diabetes()
+
+        def create_problem(warm_start):
+            problem = AbstractRegressionProblem(
+                Objective.Minimisation, "Regression", dataset.get("data"), dataset.get("target"),
+                Scoring.MeanSquaredError, folds=3, warm_start=warm_start
+            )
+            self.addCleanup(problem.shutdown)
+            return problem
+
+        def create_chromosome(n_estimators):
+            chromosome = ClassChromosome(constructor, OrderedDict(), {"n_estimators": n_estimators, "random_state": 0})
+            chromosome.generate()
+            return chromosome
+
+        problem = create_problem(True)
+
+        parent = create_chromosome(5)
+        problem.objective_function(parent)
+
+        child = create_chromosome(10)
+        child.meta.parent_id = parent.id
+
+        expected = create_chromosome(10)
+
+        # WHEN
+        # the mock only records the calls made by this process
+        with mock.patch.object(abstract_regression_problem, "_continue_learner",
+                               wraps=abstract_regression_problem._continue_learner) as continue_learner:
+            problem.objective_function(child)
+
+        create_problem(False).objective_function(expected)
+
+        # THEN
+        self.assertEqual(continue_learner.call_count, 3)
+        self.assertAlmostEqual(child.fitness, expected.fitness, places=4)
+        self.assertEqual(child.phenotype.get_params(deep=False)["n_estimators"], 10)
+
+
+def run_test():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
+    unittest.TextTestRunner().run(suite)
+
+
+if __name__ == "__main__":
+    run_test()
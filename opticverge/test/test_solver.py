@@ -0,0 +1,412 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from opticverge.core.enum.objective import Objective
+from opticverge.core.enum.parallelism import Parallelism
+from opticverge.core.enum.policy import Policy
+from opticverge.core.generator.sampler import Sampler, get_sampler, set_sampler
+from opticverge.core.meta.chromosome_index import ChromosomeIndex
+from opticverge.core.solver import generic_ais
+from opticverge.core.solver.generic_ais import AIS, _mutate_chromosome
+from opticverge.core.solver.island_model import IslandModel
+from opticverge.core.solver.steady_state_ais import SteadyStateAIS
+from opticverge.core.strategy.surrogate import Surrogate, _features
+from opticverge.core.util.checkpoint import Checkpoint
+from opticverge.core.util.exception import TimeoutException
+from opticverge.core.util.fitness_cache import FitnessCache
+from opticverge.examples.optimisation.rastrigin.chromosome import RastriginChromosome
+from opticverge.external.scikit.chromosome.regression.tree import DecisionTreeRegressorChromosome
+from opticverge.examples.optimisation.rastrigin.problem import RastriginProblem, rastrigin
+
+
+class SlowRastriginProblem(RastriginProblem):
+    """ Evaluates slowly enough that the islands of a test overlap """
+
+    def objective_function_batch(self, chromosomes):
+        time.sleep(0.01)
+        super(SlowRastriginProblem, self).objective_function_batch(chromosomes)
+
+
+class RecordingAIS(AIS):
+    """ Records each immigrant of an island in a file of the directory, islands run in their own processes """
+
+    def __init__(self, directory: str, **kwargs):
+        super(RecordingAIS, self).__init__(**kwargs)
+        self.directory = directory
+
+    def immigrate(self, chromosome):
+        expected = rastrigin(np.asarray([chromosome.phenotype], dtype=np.float64))[0]
+
+        with open(os.path.join(self.directory, "{}.island".format(os.getpid())), "a") as file:
+            file.write("{}|{!r}|{!r}\n".format(chromosome.meta.evaluated, float(chromosome.fitness), float(expected)))
+
+        super(RecordingAIS, self).immigrate(chromosome)
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_resume_from_checkpoint(self):
+
+        # GIVEN
+        policies = [Policy.EnforceLimitedMutationAttempts, Policy.EnforceUniqueChromosome]
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Checkpoint(os.path.join(directory, "solver.checkpoint"), interval=1)
+
+            solver = AIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 2, policies)
+            solver.checkpoint = checkpoint
+            solver.run()
+
+            # WHEN
+            resumed = AIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 2, policies)
+            resumed.resume(checkpoint.path)
+
+        # THEN
+        self.assertEqual(resumed.generation, 2)
+        self.assertEqual(resumed.meta.id, solver.meta.id)
+        self.assertEqual([c.id for c in resumed.population], [c.id for c in solver.population])
+        self.assertEqual(len(resumed.meta.chromosome_index), len(solver.meta.chromosome_index))
+        self.assertTrue(all(c.id in resumed.meta.chromosome_index for c in solver.population))
+        self.assertTrue(all(c.meta.evaluated for c in resumed.population))
+
+    def test_checkpoint_is_not_saved_after_an_exception(self):
+
+        # GIVEN
+        class FailingProblem(RastriginProblem):
+
+            solver = None
+
+            def objective_function_batch(self, chromosomes):
+                if self.solver is not None and self.solver.generation == 3:
+                    raise ValueError("The evaluation failed")
+
+                super(FailingProblem, self).objective_function_batch(chromosomes)
+
+        problem = FailingProblem()
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Checkpoint(os.path.join(directory, "solver.checkpoint"), interval=1)
+
+            solver = AIS(RastriginChromosome(dimensions=5), problem, 10, 5, [])
+            solver.checkpoint = checkpoint
+            problem.solver = solver
+
+            # WHEN
+            solver.run()
+
+            # THEN
+            self.assertEqual(solver.generation, 3)
+            self.assertEqual(Checkpoint.load(checkpoint.path)["generation"], 2)
+
+    def test_timeout_saves_the_last_completed_generation(self):
+
+        # GIVEN
+        class TimedOutAIS(AIS):
+
+            completed = None
+
+            def evolve(self):
+                if self.generation < 3:
+                    return super(TimedOutAIS, self).evolve()
+
+                # the population is partially replaced when the time runs out
+                self.completed = [c.id for c in self.population]
+                self.population[-1] = self.generate_chromosomes(1)[0]
+                raise TimeoutException()
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Checkpoint(os.path.join(directory, "solver.checkpoint"), interval=10)
+
+            solver = TimedOutAIS(RastriginChromosome(dimensions=5), RastriginProblem(), 10, 5, [], duration=60)
+            solver.checkpoint = checkpoint
+
+            # WHEN
+            solver.run()
+
+            state = Checkpoint.load(checkpoint.path)
+
+        # THEN
+        self.assertEqual(solver.generation, 3)
+        self.assertEqual(state["generation"], 2)
+        self.assertEqual([c.id for c in state["population"]], solver.completed)
+        self.assertTrue(all(c.meta.evaluated for c in state["population"]))
+
+    def test_islands_exchange_evaluated_chromosomes(self):
+
+        # GIVEN
+        with tempfile.TemporaryDirectory() as directory:
+            model = IslandModel(
+                RecordingAIS,
+                islands=2,
+                migration_interval=1,
+                migration_size=1,
+                seed=7,
+                directory=directory,
+                chromosome=RastriginChromosome(dimensions=5),
+                problem=SlowRastriginProblem(),
+                population_size=4,
+                epochs=10,
+                policies=[]
+            )
+
+            # WHEN
+            best = model.run()
+
+            immigrants = []
+            for name in os.listdir(directory):
+                with open(os.path.join(directory, name)) as file:
+                    immigrants.extend(line.strip().split("|") for line in file)
+
+        # THEN
+        self.assertEqual(len(model.results), 2)
+        self.assertIsNotNone(best)
+        self.assertGreater(len(immigrants), 0)
+        self.assertTrue(all(evaluated == "True" for evaluated, _, _ in immigrants))
+        self.assertTrue(all(float(fitness) == float(expected) for _, fitness, expected in immigrants))
+
+    def test_process_workers_never_receive_the_index(self):
+
+        # GIVEN
+        policies = [Policy.EnforceLimitedMutationAttempts, Policy.EnforceUniqueChromosome]
+        solver = AIS(RastriginChromosome(dimensions=5), RastriginProblem(), 6, 2, policies,
+                     parallelism=Parallelism.Process, workers=2)
+
+        pickled = []
+        getstate = ChromosomeIndex.__getstate__
+
+        def count_pickles(index):
+            pickled.append(index)
+            return getstate(index)
+
+        # WHEN
+        with mock.patch.object(ChromosomeIndex, "__getstate__", count_pickles):
+            solver.run()
+
+        # THEN
+        self.assertEqual(pickled, [])
+        self.assertEqual(solver.generation, 2)
+        self.assertTrue(all(c.meta.evaluated for c in solver.population))
+        self.assertEqual(len(set(c.id for c in solver.population)), len(solver.population))
+        self.assertGreater(len(solver.meta.chromosome_index), len(solver.population))
+
+    def test_fitness_cache_skips_evaluated_chromosomes(self):
+
+        # GIVEN
+        problem = RastriginProblem()
+        chromosomes = [RastriginChromosome(dimensions=5) for _ in range(5)]
+        for chromosome in chromosomes:
+            chromosome.generate()
+
+        with tempfile.TemporaryDirectory() as directory:
+            FitnessCache(os.path.join(directory, "cache.sqlite")).evaluate(problem, chromosomes)
+
+            clones = [chromosome.clone() for chromosome in chromosomes]
+            problem.objective_function_batch = None
+
+            # WHEN
+            FitnessCache(os.path.join(directory, "cache.sqlite")).evaluate(problem, clones)
+
+        # THEN
+        self.assertEqual([c.fitness for c in clones], [c.fitness for c in chromosomes])
+        self.assertTrue(all(c.meta.evaluated for c in clones))
+
+    def test_seeded_solver_is_reproducible(self):
+
+        # GIVEN
+        policies = [Policy.EnforceLimitedMutationAttempts, Policy.EnforceUniqueChromosome]
+        chromosome = RastriginChromosome(dimensions=5)
+
+        # WHEN
+        populations = []
+        for _ in range(2):
+            solver = AIS(chromosome, RastriginProblem(), 10, 3, policies)
+            solver.sampler = Sampler(11)
+            solver.run()
+            populations.append([c.id for c in solver.population])
+
+        # THEN
+        self.assertEqual(populations[0], populations[1])
+
+    def test_surrogate_screens_clones(self):
+
+        # GIVEN
+        problem = RastriginProblem()
+        surrogate = Surrogate(ratio=0.2, min_observations=50)
+
+        self.addCleanup(set_sampler, get_sampler())
+        set_sampler(Sampler(5))
+        template = RastriginChromosome(dimensions=2)
+
+        for chromosome in template.generate_batch(200):
+            problem.objective_function(chromosome)
+            surrogate.observe(chromosome)
+
+        surrogate.fit()
+
+        candidates = template.generate_batch(50)
+        for chromosome in candidates:
+            problem.objective_function(chromosome)
+
+        # WHEN
+        screened = surrogate.screen(candidates, Objective.Minimisation)
+
+        # THEN
+        mean = sum(c.fitness for c in candidates) / len(candidates)
+        self.assertEqual(len(screened), 10)
+        self.assertLess(sum(c.fitness for c in screened) / len(screened), mean)
+
+    def test_surrogate_predicts_from_the_nearest_observations(self):
+
+        # GIVEN
+        surrogate = Surrogate(neighbours=3, min_observations=1, dimensions=8)
+
+        self.addCleanup(set_sampler, get_sampler())
+        set_sampler(Sampler(3))
+        template = RastriginChromosome(dimensions=4)
+
+        observed = template.generate_batch(40)
+        for chromosome in observed:
+            chromosome.fitness = float(np.sum(chromosome.phenotype))
+            surrogate.observe(chromosome)
+
+        surrogate.fit()
+
+        candidates = template.generate_batch(10) + observed[:2]
+
+        # WHEN
+        actual = surrogate.predict(candidates)
+
+        # THEN
+        x = np.array([_features(c.genotype, 8) for c in observed])
+        scale = x.max(axis=0) - x.min(axis=0)
+        scale[scale == 0] = 1.0
+
+        expected = []
+        for candidate in candidates:
+            distances = np.sqrt((((_features(candidate.genotype, 8) - x) / scale) ** 2).sum(axis=1))
+            nearest = np.argsort(distances)[:3]
+            weights = 1.0 / np.maximum(distances[nearest], 1e-12)
+            expected.append(np.sum(weights * np.array([observed[i].fitness for i in nearest])) / np.sum(weights))
+
+        np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    def test_evaluation_is_timed(self):
+
+        # GIVEN
+        problem = RastriginProblem()
+        chromosome = RastriginChromosome(dimensions=5)
+        chromosome.generate()
+
+        # WHEN
+        clone = _mutate_chromosome(chromosome, 0.5, 1, [])[0]
+        problem.evaluate_batch([clone])
+
+        # THEN
+        self.assertEqual(set(clone.meta.timings), {"mutation", "evaluation"})
+        self.assertTrue(all(wall >= 0 and cpu >= 0 for wall, cpu in clone.meta.timings.values()))
+        self.assertEqual(clone.meta.evaluation_time, int(round(clone.meta.timings["evaluation"][0])))
+        self.assertIsNotNone(clone.meta.cpu_time)
+        self.assertIsNone(chromosome.meta.evaluation_time)
+
+    def test_steady_state_clone_replaces_its_parent(self):
+
+        # GIVEN
+        solver = SteadyStateAIS(RastriginChromosome(dimensions=5), RastriginProblem(), 5, 1, [])
+        solver.initialise()
+
+        parent = solver.population[0]
+        worst = solver.population[-1]
+
+        clone = parent.clone()
+        clone.mutate(1.0)
+        clone.fitness = parent.fitness - 1
+        clone.meta.evaluated = True
+
+        # WHEN
+        solver.integrate(clone)
+        solver.shutdown()
+
+        # THEN
+        self.assertEqual(clone.meta.parent_id, parent.id)
+        self.assertIs(solver.population[0], clone)
+        self.assertNotIn(parent, solver.population)
+        self.assertIn(worst, solver.population)
+
+    def test_mutation_probability_reuses_the_fitness_range(self):
+
+        # GIVEN
+        solver = SteadyStateAIS(RastriginChromosome(dimensions=5), RastriginProblem(), 5, 1, [])
+        solver.initialise()
+
+        chromosome = solver.population[2]
+        solver.mutation_probability(chromosome)
+
+        clone = solver.population[0].clone()
+        clone.mutate(1.0)
+        clone.fitness = solver.population[0].fitness / 2
+        clone.meta.evaluated = True
+
+        # WHEN
+        with mock.patch.object(generic_ais, "_fitness_array", wraps=generic_ais._fitness_array) as fitness_array:
+            cached = [solver.mutation_probability(chromosome) for _ in range(3)]
+            calls = fitness_array.call_count
+
+            solver.integrate(clone)
+            integrated = solver.mutation_probability(chromosome)
+
+        solver.shutdown()
+
+        # THEN
+        fitness = [c.fitness for c in solver.population]
+        expected = generic_ais._mutation_probabilities(np.array([chromosome.fitness]), Objective.Minimisation,
+                                                       np.array(fitness))[0]
+
+        self.assertEqual(calls, 0)
+        self.assertEqual(len(set(cached)), 1)
+        self.assertEqual(fitness_array.call_count, 1)
+        self.assertAlmostEqual(integrated, expected)
+        self.assertNotAlmostEqual(integrated, cached[0])
+
+    def test_abandoned_chromosomes_are_not_indexed(self):
+
+        # GIVEN
+        solver = AIS(RastriginChromosome(dimensions=5), RastriginProblem(), 5, 1, [Policy.EnforceUniqueChromosome])
+
+        evaluated, abandoned = solver.generate_chromosomes(2)
+        solver.problem.evaluate_batch([evaluated, abandoned])
+        abandoned.meta.abandoned = True
+
+        # WHEN
+        solver.record_chromosome(evaluated)
+        solver.record_chromosome(abandoned)
+
+        # THEN
+        self.assertIn(evaluated.id, solver.meta.chromosome_index)
+        self.assertNotIn(abandoned.id, solver.meta.chromosome_index)
+
+    def test_generated_chromosomes_draw_their_own_blueprint(self):
+
+        # GIVEN
+        solver = AIS(DecisionTreeRegressorChromosome(), RastriginProblem(), 10, 1, [])
+
+        # WHEN
+        chromosomes = solver.generate_chromosomes(10)
+
+        # THEN
+        self.assertEqual(len(chromosomes), 10)
+        self.assertEqual(len(set(id(c.blueprint) for c in chromosomes)), 10)
+        self.assertGreater(len(set(c.blueprint["max_depth"].blueprint["value"] for c in chromosomes)), 1)
+
+
+def run_test():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestHelpers)
+    unittest.TextTestRunner().run(suite)
+
+
+if __name__ == "__main__":
+    run_test()
@@ -3,9 +3,9 @@ from distutils.core import setup
 setup(
     name='opticverge-evolutionary-machine-learning',
     version='0.0.1',
-    packages=['opticverge', 'opticverge.lib', 'opticverge.core', 'opticverge.core.log', 'opticverge.core.enum',
+    packages=['opticverge', 'opticverge.lib', 'opticverge.core', 'opticverge.core.log', 'opticverge.core.distributed', 'opticverge.core.enum',
               'opticverge.core.meta', 'opticverge.core.util', 'opticverge.core.solver', 'opticverge.core.numeric',
-              'opticverge.core.problem', 'opticverge.core.strategy', 'opticverge.core.generator',
+              'opticverge.core.problem', 'opticverge.core.population', 'opticverge.core.strategy', 'opticverge.core.generator',
               'opticverge.core.chromosome', 'opticverge.core.chromosome.distribution', 'opticverge.test',
               'opticverge.examples', 'opticverge.examples.optimisation', 'opticverge.examples.optimisation.ackley',
               'opticverge.examples.optimisation.one_max', 'opticverge.examples.machine_learning',